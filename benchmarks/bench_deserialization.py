@@ -0,0 +1,153 @@
+# coding: utf-8
+
+"""
+Compares interpreted validation, compiled validation (the default), trusted
+(validate_responses=False) deserialization, lazy models reading two properties
+(response_format='lazy') and the __slots__ classes of response_format='slots'
+on list pages of Contact, Mint and Event, the way the paginators build them:
+the page is json decoded and each item of its data array is built with the
+resource model.
+
+Run from the repository root with:
+    python -m benchmarks.bench_deserialization [--page-size N] [--repeat N]
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+
+from versify import slots
+from versify.lazy import LazyModel
+from versify.model.contact import Contact
+from versify.model.event import Event
+from versify.model.mint import Mint
+
+
+def contact(i):
+    return {
+        '_id': 'con_{}'.format(i),
+        'object': 'contact',
+        'account': 'acc_1',
+        'email': 'contact{}@example.com'.format(i),
+        'first_name': 'First{}'.format(i),
+        'last_name': 'Last{}'.format(i),
+        'status': 'active',
+        'tags': ['vip', 'newsletter'],
+        'metadata': {'source': 'import', 'score': i % 100},
+        'location': {'country': 'US', 'region': 'CA', 'city': 'San Francisco'},
+        'created': 1670000000 + i,
+        'updated': 1670000000 + i,
+    }
+
+
+def mint(i):
+    return {
+        '_id': 'mnt_{}'.format(i),
+        'object': 'mint',
+        'account': 'acc_1',
+        'asset': 'ast_{}'.format(i % 10),
+        'contact': 'con_{}'.format(i),
+        'email': 'contact{}@example.com'.format(i),
+        'quantity': 1,
+        'status': 'complete',
+        'transaction': '0x{:064x}'.format(i),
+        'wallet_address': '0x{:040x}'.format(i),
+        'metadata': {},
+        'created': 1670000000 + i,
+        'updated': 1670000000 + i,
+    }
+
+
+def event(i):
+    return {
+        '_id': 'evt_{}'.format(i),
+        'object': 'event',
+        'account': 'acc_1',
+        'contact': 'con_{}'.format(i),
+        'detail_type': 'contact.created',
+        'detail': {
+            'contact': {'_id': 'con_{}'.format(i), 'email': 'contact{}@example.com'.format(i)},
+        },
+        'source': 'versify',
+        'metadata': {},
+        'created': 1670000000 + i,
+        'updated': 1670000000 + i,
+    }
+
+
+def list_page(make_item, page_size):
+    """The body of an ApiListResponse page"""
+    return json.dumps({
+        'count': page_size * 10,
+        'data': [make_item(i) for i in range(page_size)],
+        'has_more': True,
+        'object': 'list',
+        'url': '/v2/items',
+    }).encode('utf-8')
+
+
+def build_page(model, page, validate):
+    return [
+        model.from_server_data_oapg(item, validate=validate) for item in json.loads(page)['data']]
+
+
+def build_page_interpreted(model, page):
+    return [model._from_openapi_data_interpreted_oapg(item) for item in json.loads(page)['data']]
+
+
+def read_page_lazy(model, page):
+    items = [LazyModel.from_server_data(model, item) for item in json.loads(page)['data']]
+    return [(item['_id'], item['account']) for item in items]
+
+
+def build_page_slots(model, page):
+    return [slots.from_json(model, item) for item in json.loads(page)['data']]
+
+
+def allocated_kb(fn):
+    """The memory held by the result of fn"""
+    tracemalloc.start()
+    try:
+        result = fn()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    def best_ms(fn):
+        return min(timeit.repeat(fn, number=1, repeat=args.repeat)) * 1000
+
+    print('{:<8} {:>15} {:>13} {:>11} {:>8} {:>9} {:>16} {:>14} {:>13} {:>10}'.format(
+        'model', 'interpreted ms', 'compiled ms', 'trusted ms', 'lazy ms', 'slots ms',
+        'compiled speedup', 'trusted speedup', 'compiled KiB', 'slots KiB'))
+    for model, make_item in ((Contact, contact), (Mint, mint), (Event, event)):
+        page = list_page(make_item, args.page_size)
+        # the first build of each model fills the class caches
+        expected = build_page_interpreted(model, page)
+        assert expected == build_page(model, page, True) == build_page(model, page, False)
+        assert [item.to_model() for item in build_page_slots(model, page)] == expected
+        interpreted = best_ms(lambda: build_page_interpreted(model, page))
+        compiled = best_ms(lambda: build_page(model, page, True))
+        trusted = best_ms(lambda: build_page(model, page, False))
+        lazy = best_ms(lambda: read_page_lazy(model, page))
+        slotted = best_ms(lambda: build_page_slots(model, page))
+        print(
+            '{:<8} {:>15.2f} {:>13.2f} {:>11.2f} {:>8.2f} {:>9.2f} {:>15.1f}x {:>13.1f}x '
+            '{:>13.0f} {:>10.0f}'.format(
+                model.__name__, interpreted, compiled, trusted, lazy, slotted,
+                interpreted / compiled, interpreted / trusted,
+                allocated_kb(lambda: build_page(model, page, True)),
+                allocated_kb(lambda: build_page_slots(model, page))))
+
+
+if __name__ == '__main__':
+    main()
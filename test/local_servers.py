@@ -0,0 +1,150 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+
+class LocalServer:
+    """
+    A stand-in Versify API on 127.0.0.1 that serves documents by path
+
+    GET answers If-None-Match and If-Modified-Since with a 304 when they match the document,
+    PUT replaces the document and bumps its ETag. Every request is recorded in requests.
+    """
+
+    def __init__(self, documents=None, etags=True, last_modified='Wed, 01 Feb 2023 00:00:00 GMT'):
+        self.documents = dict(documents or {})
+        self.versions = dict.fromkeys(self.documents, 1)
+        self.etags = etags
+        self.last_modified = last_modified
+        self.requests = []
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def log_message(self, format, *args):
+                pass
+
+            def send_json(self, status, body, headers=()):
+                data = json.dumps(body).encode('utf-8') if body is not None else b''
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                if body is not None:
+                    self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                with server.lock:
+                    server.requests.append(('GET', self.path, dict(self.headers)))
+                    if self.path not in server.documents:
+                        self.send_json(404, {'detail': [
+                            {'loc': ['path'], 'msg': 'not found', 'type': 'value_error'}]})
+                        return
+                    validators = server.validators(self.path)
+                    expected = dict(validators)
+                    matched = (
+                        self.headers.get('If-None-Match') is not None and
+                        self.headers.get('If-None-Match') == expected.get('ETag')
+                    ) or (
+                        self.headers.get('If-None-Match') is None and
+                        self.headers.get('If-Modified-Since') is not None and
+                        self.headers.get('If-Modified-Since') == expected.get('Last-Modified')
+                    )
+                    if matched:
+                        self.send_json(304, None, validators)
+                    else:
+                        self.send_json(200, server.documents[self.path], validators)
+
+            def do_PUT(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with server.lock:
+                    server.requests.append(('PUT', self.path, dict(self.headers)))
+                    document = dict(server.documents[self.path], **body)
+                    server.documents[self.path] = document
+                    server.versions[self.path] += 1
+                    self.send_json(200, document, server.validators(self.path))
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.host = 'http://127.0.0.1:{}'.format(self.httpd.server_address[1])
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def validators(self, path):
+        headers = []
+        if self.etags:
+            headers.append(('ETag', '"{}"'.format(self.versions[path])))
+        if self.last_modified:
+            headers.append(('Last-Modified', self.last_modified))
+        return headers
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class AsyncLocalServer:
+    """Minimal keep-alive HTTP/1.1 server on the running event loop"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.connections = 0
+        self.requests = []
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.serve, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.host = 'http://127.0.0.1:{}'.format(self.port)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def serve(self, reader, writer):
+        self.connections += 1
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line == b'\r\n':
+                    break
+                name, _, value = line.decode().partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            self.requests.append((request_line.decode().split()[:2], headers, body))
+            writer.write(self.handler(request_line, headers, body))
+            await writer.drain()
+        writer.close()
+
+
+def json_response(payload, status=200, chunked=False) -> bytes:
+    """The raw HTTP/1.1 response with a json body that an AsyncLocalServer handler returns"""
+    body = json.dumps(payload).encode()
+    head = 'HTTP/1.1 {} OK\r\nContent-Type: application/json\r\n'.format(status)
+    if chunked:
+        middle = len(body) // 2
+        chunks = [body[:middle], body[middle:]]
+        encoded = b''.join(b'%x\r\n%s\r\n' % (len(c), c) for c in chunks) + b'0\r\n\r\n'
+        return (head + 'Transfer-Encoding: chunked\r\n\r\n').encode() + encoded
+    return (head + 'Content-Length: {}\r\n\r\n'.format(len(body))).encode() + body
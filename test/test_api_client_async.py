@@ -0,0 +1,125 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+import json
+import unittest
+
+from versify import api_client, batch, configuration, exceptions, pagination, rest_async
+from versify.paths.v2_accounts import get
+
+from .local_servers import AsyncLocalServer, json_response
+
+
+class TestAsyncApiClient(unittest.TestCase):
+    page = {
+        'count': 1,
+        'data': [{'_id': 'acc_1', 'domain': 'example.com', 'name': 'Example'}],
+        'has_more': False,
+        'object': 'list',
+        'url': '/v2/accounts',
+    }
+
+    def run_with_server(self, handler, coro_fn):
+        async def main():
+            async with AsyncLocalServer(handler) as server:
+                config = configuration.Configuration(host=server.host)
+                config.access_token = 'token'
+                async with api_client.AsyncApiClient(config) as client:
+                    return await coro_fn(server, get.ApiForget(client))
+        return asyncio.run(main())
+
+    def test_operations_are_awaitable_and_deserialized(self):
+        async def scenario(server, api):
+            return await api.get()
+
+        api_response = self.run_with_server(
+            lambda *args: json_response(self.page, chunked=True), scenario)
+        self.assertIsInstance(api_response, get.ApiResponseFor200)
+        self.assertEqual(api_response.body['data'][0]['domain'], 'example.com')
+        self.assertEqual(api_response.response.status, 200)
+
+    def test_concurrent_requests_reuse_pooled_connections(self):
+        async def scenario(server, api):
+            api.api_client.rest_client.maxsize = 2
+            for _ in range(3):
+                await asyncio.gather(*(api.get() for _ in range(2)))
+            return server
+
+        server = self.run_with_server(lambda *args: json_response(self.page), scenario)
+        self.assertEqual(len(server.requests), 6)
+        self.assertEqual(server.connections, 2)
+        (method, target), headers, _body = server.requests[0]
+        self.assertEqual((method, target), ('GET', '/v2/accounts'))
+        self.assertEqual(headers['accept'], 'application/json')
+        self.assertEqual(headers['authorization'], 'Bearer token')
+
+    def test_error_status_raises_api_exception(self):
+        async def scenario(server, api):
+            with self.assertRaises(exceptions.ApiException) as ctx:
+                await api.get()
+            return ctx.exception
+
+        error = self.run_with_server(
+            lambda *args: json_response({'detail': []}, status=422), scenario)
+        self.assertEqual(error.status, 422)
+        self.assertEqual(json.loads(error.body), {'detail': []})
+
+    def test_stream_is_rejected(self):
+        async def scenario(server, api):
+            with self.assertRaises(exceptions.ApiValueError):
+                await api.get(stream=True)
+            return server
+
+        server = self.run_with_server(lambda *args: json_response(self.page), scenario)
+        self.assertEqual(server.requests, [])
+
+    def test_thread_pool_helpers_are_rejected(self):
+        client = api_client.AsyncApiClient(configuration.Configuration())
+        api = get.ApiForget(client)
+        with self.assertRaises(exceptions.ApiTypeError):
+            client.submit(api.get)
+        with self.assertRaises(exceptions.ApiTypeError):
+            client.map(api.get, [{}])
+        with self.assertRaises(exceptions.ApiTypeError):
+            pagination.fetch_all(client, 'accounts')
+        with self.assertRaises(exceptions.ApiTypeError):
+            batch.get_many(client, 'accounts', ['acc_1'])
+        self.assertIsNone(client._executor)
+
+    def test_close(self):
+        client = api_client.AsyncApiClient(configuration.Configuration())
+        self.assertIsInstance(client.rest_client, rest_async.AsyncRESTClientObject)
+        with self.assertRaises(TypeError):
+            with client:
+                pass
+        client.executor
+        asyncio.run(client.aclose())
+        self.assertIsNone(client._executor)
+
+    def test_truncated_chunked_body(self):
+        async def read_chunked(data):
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+            return await rest_async._read_chunked(reader)
+
+        self.assertEqual(asyncio.run(read_chunked(b'3\r\nabc\r\n0\r\n\r\n')), b'abc')
+        for truncated in (b'', b'3\r\nabc\r\n', b'3\r\nab'):
+            with self.assertRaises(asyncio.IncompleteReadError):
+                asyncio.run(read_chunked(truncated))
+        with self.assertRaises(exceptions.ApiException) as ctx:
+            asyncio.run(read_chunked(b'3x\r\nabc\r\n0\r\n\r\n'))
+        self.assertEqual(ctx.exception.status, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
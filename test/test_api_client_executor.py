@@ -0,0 +1,104 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions
+from versify.paths.v2_contacts_contact_id import get
+
+from .test_paths import ApiTestMixin
+
+
+class TestApiClientExecutor(ApiTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        config.connection_pool_maxsize = 4
+        self.client = api_client.ApiClient(configuration=config)
+        self.api = get.ApiForget(api_client=self.client)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        self.client.close()
+
+    def fake_request(self, method, url, **kwargs):
+        contact_id = url.rsplit('/', 1)[1]
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # earlier ids answer slower so completion order differs from submission order
+        delay = 5 - int(contact_id[-1]) % 5 if contact_id[-1].isdigit() else 0
+        time.sleep(0.01 * delay)
+        with self.lock:
+            self.in_flight -= 1
+        if contact_id == 'missing':
+            return self.response(self.json_bytes({'detail': []}), status=404)
+        contact = {'_id': contact_id, 'account': 'acc_1', 'email': 'a@b.co'}
+        return self.response(self.json_bytes(contact))
+
+    def kwargs_for(self, contact_ids):
+        return ({'path_params': {'contact_id': contact_id}} for contact_id in contact_ids)
+
+    def test_executor_is_sized_from_connection_pool(self):
+        self.assertEqual(self.client.pool_threads, 4)
+        self.assertEqual(self.client.executor._max_workers, 4)
+
+    def test_submit_returns_future(self):
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.fake_request):
+            future = self.client.submit(self.api.get, path_params={'contact_id': 'con_1'})
+            api_response = future.result()
+        self.assertIsInstance(api_response, get.ApiResponseFor200)
+        self.assertEqual(api_response.body['_id'], 'con_1')
+
+    def test_map_preserves_order_and_bounds_concurrency(self):
+        contact_ids = ['con_{}'.format(i) for i in range(10)]
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.fake_request):
+            results = list(
+                self.client.map(self.api.get, self.kwargs_for(contact_ids), max_workers=3))
+        self.assertEqual([r.body['_id'] for r in results], contact_ids)
+        self.assertEqual(self.max_in_flight, 3)
+
+    def test_map_as_completed(self):
+        contact_ids = ['con_{}'.format(i) for i in range(5)]
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.fake_request):
+            results = list(
+                self.client.map(self.api.get, self.kwargs_for(contact_ids), ordered=False))
+        self.assertEqual(sorted(r.body['_id'] for r in results), contact_ids)
+        self.assertNotEqual([r.body['_id'] for r in results], contact_ids)
+
+    def test_map_exceptions(self):
+        contact_ids = ['con_1', 'missing', 'con_2']
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.fake_request):
+            results = list(self.client.map(
+                self.api.get, self.kwargs_for(contact_ids), return_exceptions=True))
+            self.assertIsInstance(results[1], exceptions.ApiException)
+            self.assertEqual(results[1].status, 404)
+            self.assertEqual(results[2].body['_id'], 'con_2')
+
+            with self.assertRaises(exceptions.ApiException):
+                list(self.client.map(self.api.get, self.kwargs_for(contact_ids)))
+
+    def test_call_api_async_req_returns_future(self):
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.fake_request):
+            future = self.client.call_api('/v2/contacts/con_3', 'GET', async_req=True)
+            self.assertEqual(future.result().status, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import threading
+import unittest
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import urllib3
+
+from versify import api_client, batch, configuration, exceptions
+from versify.cache import LRUResponseCache
+from versify.model.contact import Contact
+
+from .test_pagination import contacts
+from .test_paths import ApiTestMixin
+
+
+class FakeItemServer(ApiTestMixin):
+    """Answers GET /v2/contacts/<id> from a list of contacts, 404 for unknown ids"""
+
+    def __init__(self, items):
+        self.items = {item['_id']: item for item in items}
+        self.paths = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, **kwargs):
+        path = urlparse(url).path
+        with self.lock:
+            self.paths.append(path)
+        item = self.items.get(path.rsplit('/', 1)[-1])
+        if item is None:
+            error = {'detail': [
+                {'loc': ['path', 'contact_id'], 'msg': 'not found', 'type': 'value_error'}]}
+            return self.response(self.json_bytes(error), status=404)
+        return self.response(self.json_bytes(item))
+
+
+class TestGetMany(unittest.TestCase):
+
+    def setUp(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.cache = LRUResponseCache()
+        self.client = api_client.ApiClient(configuration=config, response_cache=self.cache)
+        self.addCleanup(self.client.close)
+        self.server = FakeItemServer(contacts(20))
+
+    def test_get_many(self):
+        ids = ['con_3', 'con_1', 'con_3', 'con_404', 'con_7']
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.server):
+            result = batch.get_many(self.client, 'contacts', ids, concurrency=4)
+        self.assertEqual(list(result.items), ['con_3', 'con_1', 'con_7'])
+        self.assertIsInstance(result.items['con_1'], Contact)
+        self.assertEqual(result.items['con_7']['email'], 'c7@example.com')
+        self.assertEqual(list(result.errors), ['con_404'])
+        self.assertEqual(result.errors['con_404'].status, 404)
+        # duplicates are requested once
+        self.assertEqual(sorted(self.server.paths), ['/v2/contacts/con_1', '/v2/contacts/con_3',
+                                                     '/v2/contacts/con_404', '/v2/contacts/con_7'])
+
+    def test_iter_many_serves_cached_ids_first(self):
+        ids = ['con_{}'.format(i) for i in range(10)]
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.server):
+            batch.get_many(self.client, 'contacts', ids[5:], response_format='python')
+            self.server.paths.clear()
+            results = list(batch.iter_many(
+                self.client, 'contacts', ids, concurrency=2, response_format='python'))
+        self.assertEqual([item_id for item_id, _ in results[:5]], ids[5:])
+        self.assertEqual(sorted(item_id for item_id, _ in results), sorted(ids))
+        self.assertEqual(
+            sorted(self.server.paths), ['/v2/contacts/' + item_id for item_id in ids[:5]])
+        self.assertEqual(dict(results)['con_2'], contacts(3)[2])
+        self.assertEqual(self.cache.stats().hits, 5)
+
+    def test_unknown_resources(self):
+        with self.assertRaises(exceptions.ApiValueError):
+            batch.get_many(self.client, 'widgets', ['wdg_1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
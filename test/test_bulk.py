@@ -0,0 +1,244 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import urllib3
+
+from versify import api_client, bulk, configuration
+from versify.model.contact import Contact
+from versify.model.contact_create import ContactCreate
+
+from .test_paths import ApiTestMixin
+
+VALIDATION_ERROR = {
+    'detail': [{'loc': ['body', 'email'], 'msg': 'invalid email', 'type': 'value_error'}]}
+
+
+class FakeWriteServer(ApiTestMixin):
+    """
+    Creates, updates and deletes contacts
+
+    Emails without an @ are rejected with a 422 and emails starting with busy with a 503.
+    """
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+
+    def __call__(self, method, url, body=None, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.requests.append((method, urlparse(url).path))
+        try:
+            time.sleep(self.delay)
+            return self.respond(method, urlparse(url).path, json.loads(body) if body else None)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def respond(self, method, path, body):
+        item_id = path.rsplit('/', 1)[-1]
+        if method == 'DELETE':
+            if item_id == 'con_busy':
+                return self.response(self.json_bytes({'detail': []}), status=503)
+            return self.response(
+                self.json_bytes({'id': item_id, 'object': 'contact', 'deleted': True}))
+        email = body['email']
+        if '@' not in email:
+            return self.response(self.json_bytes(VALIDATION_ERROR), status=422)
+        if email.startswith('busy'):
+            return self.response(self.json_bytes({'detail': []}), status=503)
+        if method == 'POST':
+            contact = {'_id': 'con_' + email, 'account': 'acc_1', 'email': email}
+            return self.response(self.json_bytes(contact), 201)
+        return self.response(self.json_bytes({'_id': item_id, 'account': 'acc_1', 'email': email}))
+
+
+class TestBulk(unittest.TestCase):
+
+    def setUp(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.client = api_client.ApiClient(configuration=config, pool_threads=8)
+        self.addCleanup(self.client.close)
+
+    def test_bulk_create_reports_partial_failures(self):
+        emails = ['a{}@example.com'.format(i) for i in range(20)]
+        emails += ['not-an-email', 'busy@example.com']
+        server = FakeWriteServer(delay=0.005)
+        bodies = (ContactCreate(email=email) for email in emails)
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            report = bulk.bulk_create(self.client, 'contacts', bodies, window=4)
+        self.assertEqual(server.max_in_flight, 4)
+        self.assertEqual(report.succeeded, 20)
+        self.assertEqual(sorted(key for key, _ in report.successes), list(range(20)))
+        self.assertIsInstance(report.successes[0][1], Contact)
+        [failure] = report.failures
+        self.assertEqual((failure.key, failure.status), (20, 422))
+        self.assertEqual(failure.error.api_response.body['detail'][0]['msg'], 'invalid email')
+        [retryable] = report.retryable
+        self.assertEqual(
+            (retryable.key, retryable.status, retryable.record['email']),
+            (21, 503, 'busy@example.com'))
+        self.assertEqual(report.completed, 22)
+        self.assertGreater(report.records_per_second, 0)
+
+    def test_bulk_update_and_delete(self):
+        server = FakeWriteServer()
+        updates = [
+            ('con_1', {'email': 'one@example.com'}), ('con_2', {'email': 'busy@example.com'})]
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            updated = bulk.bulk_update(self.client, 'contacts', iter(updates))
+            deleted = bulk.bulk_delete(
+                self.client, 'contacts', ['con_1', 'con_busy'], keep_results=False)
+        self.assertEqual(updated.successes[0][0], 'con_1')
+        self.assertEqual(updated.successes[0][1]['email'], 'one@example.com')
+        self.assertEqual(updated.retryable[0].record, updates[1])
+        self.assertEqual((deleted.succeeded, deleted.successes), (1, []))
+        self.assertEqual(deleted.retryable[0].key, 'con_busy')
+        self.assertIn(('PUT', '/v2/contacts/con_1'), server.requests)
+        self.assertIn(('DELETE', '/v2/contacts/con_busy'), server.requests)
+
+    def test_connection_errors_are_retryable(self):
+        error = urllib3.exceptions.MaxRetryError(None, '/v2/contacts', 'connection refused')
+        with patch.object(urllib3.PoolManager, 'request', side_effect=error):
+            report = bulk.bulk_create(self.client, 'contacts', [{'email': 'a@example.com'}])
+        self.assertEqual(len(report.retryable), 1)
+        self.assertIs(report.retryable[0].error, error)
+
+
+CSV_ROWS = '''email,first_name,last_name,plan
+ada@example.com,Ada,Lovelace,pro
+grace@example.com,Grace,"Hopper
+(Rear Admiral)",free
+ADA@example.com,Ada,Again,pro
+not-an-email,,,
+busy@example.com,,,
+,No,Email,
+alan@example.com,Alan,Turing,pro
+'''
+
+
+class Interrupt(BaseException):
+    pass
+
+
+class TestImportContacts(unittest.TestCase):
+
+    mapping = {'email': 'email', 'name': {'first_name': 'first_name', 'last_name': 'last_name'},
+               'metadata': {'plan': 'plan'}}
+
+    def setUp(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.client = api_client.ApiClient(configuration=config, pool_threads=4)
+        self.addCleanup(self.client.close)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def posted_emails(self, mock_request):
+        return [json.loads(call[1]['body'])['email'] for call in mock_request.call_args_list]
+
+    def test_csv_import(self):
+        path = self.write('contacts.csv', CSV_ROWS)
+        checkpoint = os.path.join(self.directory, 'contacts.checkpoint')
+        server = FakeWriteServer()
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server) as mock_request:
+            report = bulk.import_contacts(
+                self.client, path, self.mapping, window=2, batch_size=2, checkpoint=checkpoint,
+                keep_results=True)
+        self.assertEqual(sorted(self.posted_emails(mock_request)), [
+            'ada@example.com', 'alan@example.com', 'busy@example.com', 'grace@example.com',
+            'not-an-email'])
+        [body] = [json.loads(call[1]['body']) for call in mock_request.call_args_list
+                  if b'grace' in call[1]['body']]
+        self.assertEqual(
+            body['name'], {'first_name': 'Grace', 'last_name': 'Hopper\n(Rear Admiral)'})
+        self.assertEqual(body['metadata'], {'plan': 'free'})
+        self.assertEqual((report.rows, report.duplicates, report.succeeded), (7, 1, 3))
+        self.assertEqual(
+            sorted((failure.key, failure.status) for failure in report.failures),
+            [(3, 422), (5, None)])
+        self.assertEqual([failure.key for failure in report.retryable], [4])
+        self.assertEqual(report.offset, os.path.getsize(path))
+        with open(checkpoint) as file:
+            self.assertEqual(file.read(), '{} 7'.format(os.path.getsize(path)))
+        self.assertTrue(os.path.exists(checkpoint + '.emails'))
+
+    def test_emails_with_the_same_hash_are_imported(self):
+        path = self.write('contacts.csv', 'email\nada@example.com\ngrace@example.com\n')
+        server = FakeWriteServer()
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server) as mock_request:
+            with patch.object(bulk, 'hash', create=True, return_value=0):
+                report = bulk.import_contacts(self.client, path, {'email': 'email'})
+        self.assertEqual((report.succeeded, report.duplicates), (2, 0))
+        self.assertEqual(len(mock_request.call_args_list), 2)
+
+    def test_jsonl_import_resumes_from_the_checkpoint(self):
+        lines = [
+            json.dumps({'email': 'c{}@example.com'.format(i), 'metadata': {'n': i}})
+            for i in range(6)]
+        lines.insert(5, '{not json')
+        lines.append(json.dumps({'email': 'C1@example.com'}))
+        path = self.write('contacts.jsonl', '\n'.join(lines) + '\n')
+        checkpoint = os.path.join(self.directory, 'contacts.checkpoint')
+        server = FakeWriteServer()
+        requests = []
+
+        def interrupted(method, url, **kwargs):
+            requests.append(kwargs)
+            if len(requests) == 4:
+                raise Interrupt()
+            return server(method, url, **kwargs)
+
+        with patch.object(urllib3.PoolManager, 'request', side_effect=interrupted):
+            with self.assertRaises(Interrupt):
+                bulk.import_contacts(
+                    self.client, path, window=1, batch_size=1, checkpoint=checkpoint)
+        with open(checkpoint) as file:
+            self.assertEqual(
+                file.read(), '{} 3'.format(sum(len(line) + 1 for line in lines[:3])))
+
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server) as mock_request:
+            # the rows before the checkpoint are not read again
+            with patch.object(bulk, 'ContactCreate', wraps=bulk.ContactCreate) as create:
+                report = bulk.import_contacts(self.client, path, window=2, checkpoint=checkpoint)
+        self.assertEqual(create.call_count, 4)
+        # c1 was imported before the interruption, so C1 is a duplicate
+        self.assertEqual(sorted(self.posted_emails(mock_request)),
+                         ['c3@example.com', 'c4@example.com', 'c5@example.com'])
+        self.assertEqual((report.rows, report.duplicates, report.succeeded), (8, 1, 3))
+        self.assertEqual([failure.key for failure in report.failures], [5])
+        self.assertIsInstance(report.failures[0].error, ValueError)
+        self.assertEqual(report.offset, os.path.getsize(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
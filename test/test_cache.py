@@ -0,0 +1,135 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions
+from versify.cache import LRUResponseCache
+from versify.paths.v2_contacts_contact_id import delete, get
+
+from .test_paths import ApiTestMixin
+
+CONTACT = {'_id': 'con_1', 'account': 'acc_1', 'email': 'ada@example.com'}
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUResponseCache(ApiTestMixin, unittest.TestCase):
+
+    def test_keys(self):
+        cache = LRUResponseCache(ttls={'assets': 0})
+        host = 'https://api.versifylabs.com'
+        self.assertEqual(cache.key('/v2/contacts/con_1?fields=_id', 'acc_1', host),
+                         ('/v2/contacts/con_1', 'fields=_id', 'acc_1', host))
+        self.assertIsNone(cache.key('/v2/contacts', None, None))
+        self.assertIsNone(cache.key('/v2/assets/ast_1', None, None))
+        # the user of /v2/users/me depends on the credentials, which are not part of the key
+        self.assertIsNone(cache.key('/v2/users/me', 'acc_1', None))
+
+    def test_expiry_and_lru_eviction(self):
+        clock = FakeClock()
+        cache = LRUResponseCache(
+            ttl=10, ttls={'mints': 1}, max_entries=2, max_bytes=10, clock=clock)
+        contact, mint, reward = (
+            cache.key(path, None, None)
+            for path in ('/v2/contacts/con_1', '/v2/mints/mnt_1', '/v2/rewards/rwd_1'))
+        cache.put(contact, self.response(b'1234'))
+        cache.put(mint, self.response(b'1234'))
+        self.assertEqual(cache.get(contact).data, b'1234')
+        cache.put(reward, self.response(b'1234'))
+        # the mint was the least recently used
+        self.assertIsNone(cache.get(mint))
+        clock.now = 5
+        cache.put(mint, self.response(b'12345678'))
+        self.assertEqual(len(cache), 1)
+        clock.now = 6
+        self.assertIsNone(cache.get(mint))
+        self.assertEqual(cache.stats(), cache.stats().__class__(
+            hits=1, misses=2, evictions=3, expirations=1, invalidations=0, entries=0, bytes=0))
+        with self.assertRaises(exceptions.ApiValueError):
+            LRUResponseCache(max_entries=0)
+
+
+class TestApiClientResponseCache(ApiTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.cache = LRUResponseCache()
+        self.client = api_client.ApiClient(configuration=config, response_cache=self.cache)
+        self.addCleanup(self.client.close)
+        self.api = get.ApiForget(api_client=self.client)
+
+    def get(self, account='acc_1', **kwargs):
+        response = self.response(self.json_bytes(CONTACT))
+        with patch.object(urllib3.PoolManager, 'request', return_value=response) as mock_request:
+            api_response = self.api.get(
+                path_params={'contact_id': 'con_1'}, header_params={'Versify-Account': account},
+                **kwargs)
+        return api_response, mock_request.call_count
+
+    def test_get_by_id_is_read_through(self):
+        first, calls = self.get()
+        self.assertEqual(calls, 1)
+        second, calls = self.get()
+        self.assertEqual(calls, 0)
+        self.assertEqual(dict(second.body), dict(first.body))
+        _, calls = self.get(response_format='python')
+        self.assertEqual(calls, 0)
+        # accounts have their own entries
+        _, calls = self.get(account='acc_2')
+        self.assertEqual(calls, 1)
+        _, calls = self.get(stream=True)
+        self.assertEqual(calls, 1)
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (2, 2, 2))
+
+    def test_writes_invalidate_the_path(self):
+        self.get()
+        self.get(account='acc_2')
+        api = delete.ApiFordelete(api_client=self.client)
+        deleted = {'id': 'con_1', 'object': 'contact', 'deleted': True}
+        response = self.response(self.json_bytes(deleted))
+        with patch.object(urllib3.PoolManager, 'request', return_value=response):
+            api.delete(
+                path_params={'contact_id': 'con_1'}, header_params={'Versify-Account': 'acc_1'})
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats().invalidations, 2)
+        _, calls = self.get()
+        self.assertEqual(calls, 1)
+
+    def test_errors_are_not_cached(self):
+        error = {'detail': [
+            {'loc': ['path', 'contact_id'], 'msg': 'not found', 'type': 'value_error'}]}
+        for _ in range(2):
+            response = self.response(self.json_bytes(error), status=404)
+            with patch.object(
+                    urllib3.PoolManager, 'request', return_value=response) as mock_request:
+                with self.assertRaises(exceptions.ApiException):
+                    self.api.get(
+                        path_params={'contact_id': 'con_1'},
+                        header_params={'Versify-Account': 'acc_1'})
+            self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
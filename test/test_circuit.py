@@ -0,0 +1,167 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions
+from versify.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from versify.deadline import Deadline
+from versify.paths.v2_contacts import get as list_contacts
+from versify.paths.v2_contacts_contact_id import get
+from versify.retry import RetryPolicy
+
+from .test_cache import FakeClock
+from .test_paths import ApiTestMixin
+
+CONTACT = {'_id': 'con_1', 'account': 'acc_1', 'email': 'ada@example.com'}
+PAGE = {'count': 0, 'data': [], 'has_more': False, 'object': 'list', 'url': '/v2/contacts'}
+KEY = ('api.versifylabs.com', '/v2/contacts/{id}')
+
+
+class TestCircuitBreaker(ApiTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.transitions = []
+        self.breaker = CircuitBreaker(
+            failure_rate=0.5, window=10, min_requests=4, open_for=5, half_open_requests=2,
+            on_transition=lambda *transition: self.transitions.append(transition),
+            clock=self.clock)
+
+    def test_states(self):
+        for failed in (False, True, False):
+            self.breaker.record(KEY, failed)
+        self.assertEqual(self.breaker.state(KEY), CLOSED)
+        # failures older than the window are forgotten
+        self.clock.now = 11
+        self.breaker.record(KEY, True)
+        self.assertEqual(self.breaker.stats()[KEY].requests, 1)
+        for failed in (True, False, False):
+            self.breaker.record(KEY, failed)
+        self.assertEqual(self.breaker.state(KEY), OPEN)
+        with self.assertRaises(exceptions.CircuitOpenError) as context:
+            self.breaker.allow(KEY)
+        self.assertEqual((context.exception.status, context.exception.retry_in), (503, 5))
+
+        self.clock.now = 16
+        self.assertEqual(self.breaker.state(KEY), HALF_OPEN)
+        self.breaker.allow(KEY)
+        self.breaker.allow(KEY)
+        with self.assertRaises(exceptions.CircuitOpenError):
+            self.breaker.allow(KEY)
+        self.breaker.record(KEY, False)
+        self.breaker.record(KEY, True)
+        self.assertEqual(self.breaker.state(KEY), OPEN)
+
+        self.clock.now = 21
+        for _ in range(2):
+            self.breaker.allow(KEY)
+            self.breaker.record(KEY, False)
+        self.assertEqual(self.transitions, [
+            (KEY, CLOSED, OPEN), (KEY, OPEN, HALF_OPEN), (KEY, HALF_OPEN, OPEN),
+            (KEY, OPEN, HALF_OPEN), (KEY, HALF_OPEN, CLOSED)])
+        stats = self.breaker.stats()[KEY]
+        self.assertEqual(
+            (stats.state, stats.requests, stats.rejected, stats.opened), (CLOSED, 0, 2, 2))
+
+    def open_circuit(self):
+        for _ in range(4):
+            self.breaker.record(KEY, True)
+        self.clock.now += 5
+        self.assertEqual(self.breaker.state(KEY), HALF_OPEN)
+
+    def test_lost_probes(self):
+        self.open_circuit()
+        self.breaker.allow(KEY)
+        self.breaker.allow(KEY)
+        # a probe that was not sent is given back
+        self.breaker.release(KEY)
+        self.breaker.allow(KEY)
+        with self.assertRaises(exceptions.CircuitOpenError):
+            self.breaker.allow(KEY)
+        # probes that are never recorded expire
+        self.clock.now += 60
+        self.breaker.allow(KEY)
+        self.breaker.record(KEY, False)
+        self.breaker.allow(KEY)
+        self.breaker.record(KEY, False)
+        self.assertEqual(self.breaker.state(KEY), CLOSED)
+
+    def test_api_client_gives_back_unsent_probes(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        config.host = 'https://api.versifylabs.com'
+        self.open_circuit()
+
+        # the deadline passed before the request was sent
+        client = api_client.ApiClient(configuration=config, circuit_breaker=self.breaker)
+        self.addCleanup(client.close)
+        with patch.object(urllib3.PoolManager, 'request') as mock_request:
+            with self.assertRaises(exceptions.DeadlineExceededError):
+                get.ApiForget(api_client=client).get(
+                    path_params={'contact_id': 'con_1'}, timeout=Deadline(0, clock=self.clock))
+        self.assertEqual(mock_request.call_count, 0)
+
+        # the request was cancelled
+        async def cancelled(*args, **kwargs):
+            raise asyncio.CancelledError()
+
+        async def main():
+            async with api_client.AsyncApiClient(config, circuit_breaker=self.breaker) as client:
+                api = get.ApiForget(api_client=client)
+                with patch.object(client, 'request', side_effect=cancelled):
+                    for _ in range(3):
+                        with self.assertRaises(asyncio.CancelledError):
+                            await api.get(path_params={'contact_id': 'con_1'})
+
+        asyncio.run(main())
+        self.breaker.allow(KEY)
+        self.breaker.allow(KEY)
+        self.assertEqual(self.breaker.state(KEY), HALF_OPEN)
+
+    def test_api_client_fails_fast(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        config.host = 'https://api.versifylabs.com'
+        policy = RetryPolicy(max_retries=5, sleep=lambda delay: None)
+        client = api_client.ApiClient(
+            configuration=config, circuit_breaker=self.breaker, retry_policy=policy)
+        self.addCleanup(client.close)
+        unavailable = self.response(self.json_bytes({'detail': []}), status=503)
+        api = get.ApiForget(api_client=client)
+        with patch.object(
+                urllib3.PoolManager, 'request', return_value=unavailable) as mock_request:
+            with self.assertRaises(exceptions.ApiException) as context:
+                api.get(path_params={'contact_id': 'con_1'})
+            self.assertIsInstance(context.exception, exceptions.CircuitOpenError)
+            # the retries opened the circuit, which stopped them
+            self.assertEqual(mock_request.call_count, 4)
+            with self.assertRaises(exceptions.CircuitOpenError):
+                api.get(path_params={'contact_id': 'con_2'})
+            self.assertEqual(mock_request.call_count, 4)
+        # other path templates are not affected
+        page = self.response(self.json_bytes(PAGE))
+        with patch.object(urllib3.PoolManager, 'request', return_value=page):
+            self.assertEqual(list_contacts.ApiForget(api_client=client).get().body['count'], 0)
+        self.clock.now = 5
+        contact = self.response(self.json_bytes(CONTACT))
+        with patch.object(urllib3.PoolManager, 'request', return_value=contact):
+            for _ in range(2):
+                api.get(path_params={'contact_id': 'con_1'})
+        self.assertEqual(self.breaker.state(KEY), CLOSED)
+
+
+if __name__ == '__main__':
+    unittest.main()
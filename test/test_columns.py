@@ -0,0 +1,117 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import array
+import math
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions, pagination
+from versify.columns import NAT, collect_columns
+from versify.model.mint import Mint
+
+from .test_pagination import FakeListServer
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def mints(count):
+    return [
+        {
+            '_id': 'mnt_{}'.format(i),
+            'account': 'acc_1',
+            'asset': 'ast_1',
+            'status': ('complete', 'pending', 'failed')[i % 3],
+            'quantity': None if i == 1 else i,
+            'created': 1670000000 + i,
+        }
+        for i in range(count)
+    ]
+
+
+class TestCollectColumns(unittest.TestCase):
+
+    def test_columns_are_typed_buffers(self):
+        fields = ['_id', 'status', 'quantity', 'created', 'metadata.score']
+        columns = collect_columns(mints(4), fields, model=Mint, max_categories=3)
+        self.assertEqual(columns.num_rows, 4)
+        status = columns['status']
+        self.assertEqual(status.kind, 'category')
+        self.assertEqual(status.categories, ['complete', 'pending', 'failed'])
+        self.assertEqual(status.values, array.array('i', [0, 1, 2, 0]))
+        quantity = columns['quantity']
+        self.assertEqual((quantity.kind, quantity.values.typecode), ('int', 'q'))
+        self.assertEqual(list(quantity.mask), [0, 1, 0, 0])
+        created = columns['created']
+        self.assertEqual(created.kind, 'datetime')
+        self.assertEqual(created.values[0], 1670000000 * 1000000)
+        # more distinct values than max_categories
+        self.assertEqual(columns['_id'].kind, 'str')
+        self.assertEqual(columns['_id'].values, ['mnt_0', 'mnt_1', 'mnt_2', 'mnt_3'])
+        self.assertEqual(columns['metadata.score'].kind, None)
+        self.assertEqual(len(columns['metadata.score']), 4)
+
+    def test_kinds_are_inferred_and_promoted(self):
+        items = [
+            {'n': 1, 'at': '2023-01-01T00:00:01Z', 'ok': True},
+            {'n': 2.5, 'at': None, 'ok': None},
+            {},
+        ]
+        columns = collect_columns(items, ['n', 'at', 'ok'], kinds={'at': 'datetime'})
+        self.assertEqual(columns['n'].kind, 'float')
+        self.assertEqual(columns['n'].values[:2], array.array('d', [1.0, 2.5]))
+        self.assertTrue(math.isnan(columns['n'].values[2]))
+        self.assertEqual(list(columns['at'].values), [1672531201000000, NAT, NAT])
+        self.assertEqual(list(columns['ok'].mask), [0, 1, 1])
+        with self.assertRaises(exceptions.ApiTypeError):
+            collect_columns([{'n': 1}, {'n': 'one'}], ['n'])
+
+    def test_schema_instances_are_collected(self):
+        items = [
+            Mint.from_openapi_data_oapg(
+                {key: value for key, value in item.items() if value is not None})
+            for item in mints(3)
+        ]
+        columns = collect_columns(items, ['status', 'quantity'])
+        self.assertEqual(columns['status'].categories, ['complete', 'pending', 'failed'])
+        self.assertEqual(columns['quantity'].kind, 'int')
+        self.assertEqual(list(columns['quantity'].mask), [0, 1, 0])
+
+    def test_paginated_export(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        client = api_client.ApiClient(configuration=config)
+        self.addCleanup(client.close)
+        fields = ['_id', 'status', 'quantity']
+        server = FakeListServer(mints(7))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            items = pagination.iter_mints(
+                client, page_size=3, stream=True, response_format='python', fields=fields)
+            columns = collect_columns(items, fields, model=Mint)
+        self.assertEqual(columns.num_rows, 7)
+        self.assertEqual(list(columns['quantity'].values), [0, 0, 2, 3, 4, 5, 6])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_to_numpy(self):
+        arrays = collect_columns(
+            mints(3), ['status', 'quantity', 'created'], model=Mint).to_numpy()
+        self.assertEqual(arrays['status'].dtype, numpy.int32)
+        self.assertTrue(numpy.isnan(arrays['quantity'][1]))
+        self.assertEqual(str(arrays['created'][0]), '2022-12-02T16:53:20.000000')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import unittest
+
+import frozendict
+
+from versify import configuration, exceptions, schemas
+from versify.model.contact import Contact
+from versify.model.event import Event
+from versify.model.journey import Journey
+from versify.model.location import Location
+from versify.model.mint import Mint
+
+CONTACT = {
+    '_id': 'con_1',
+    'account': 'acc_1',
+    'email': 'ada@example.com',
+    'avatar': 'https://example.com/ada.png',
+    'status': 'active',
+    'tags': ['vip'],
+    'metadata': {
+        'score': 10, 'ratio': 0.5, 'whole': 2.0, 'flag': True, 'empty': None,
+        'list': [1, {'a': 'b'}],
+    },
+    'location': {'country': 'GB', 'region': 'London', 'city': 'London'},
+    'created': 1670000000,
+}
+JOURNEY = {
+    '_id': 'jou_1',
+    'account': 'acc_1',
+    'name': 'Welcome',
+    'active': True,
+    'states': {},
+    'trigger': {
+        'trigger_type': 'event',
+        'config': {
+            'detail_type': 'contact.created',
+            'source': 'versify',
+            'detail_filters': [
+                {'field': 'email', 'operator': '=', 'value': 'ada@example.com'},
+                {'field': 'score', 'operator': '>', 'value': 3.5},
+            ],
+        },
+    },
+}
+MINT = {'_id': 'mnt_1', 'account': 'acc_1', 'asset': 'ast_1', 'quantity': 2, 'status': 'complete'}
+EVENT = {
+    '_id': 'evt_1', 'account': 'acc_1', 'detail_type': 'contact.created',
+    'detail': {'contact': 'con_1'},
+}
+
+
+class TestCompiledSchema(unittest.TestCase):
+
+    def assert_same_instance(self, expected, actual, path=()):
+        self.assertIs(type(actual), type(expected), path)
+        self.assertEqual(actual, expected, path)
+        if isinstance(expected, frozendict.frozendict):
+            for key in expected:
+                self.assert_same_instance(expected[key], actual[key], path + (key,))
+        elif isinstance(expected, tuple):
+            for i, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+                self.assert_same_instance(expected_item, actual_item, path + (i,))
+
+    def assert_same_error(self, model, payload, _configuration=None):
+        errors = []
+        for build in (model._from_openapi_data_interpreted_oapg, model.from_openapi_data_oapg):
+            with self.assertRaises((exceptions.ApiTypeError, exceptions.ApiValueError)) as context:
+                build(payload, _configuration)
+            errors.append((type(context.exception), str(context.exception)))
+        self.assertEqual(errors[0], errors[1])
+
+    def test_compiled_instances_match_interpreted_instances(self):
+        payloads = ((Contact, CONTACT), (Journey, JOURNEY), (Mint, MINT), (Event, EVENT))
+        for model, payload in payloads:
+            with self.subTest(model=model.__name__):
+                self.assert_same_instance(
+                    model._from_openapi_data_interpreted_oapg(payload),
+                    model.from_openapi_data_oapg(payload))
+
+    def test_compiled_errors_match_interpreted_errors(self):
+        filters = JOURNEY['trigger']['config']['detail_filters']
+        invalid_payloads = (
+            (Contact, dict(CONTACT, status='deleted')),
+            (Contact, dict(CONTACT, email=5)),
+            (Contact, {'account': 'acc_1'}),
+            (Contact, dict(CONTACT, avatar='')),
+            (Contact, dict(CONTACT, created=1.5)),
+            (Contact, dict(CONTACT, location={'country': 'GB'})),
+            (Journey, dict(JOURNEY, trigger={'trigger_type': 'sometimes', 'config': {}})),
+            (Journey, dict(JOURNEY, trigger=dict(JOURNEY['trigger'], config=dict(
+                JOURNEY['trigger']['config'],
+                detail_filters=filters + [{'field': 'f', 'operator': '='}]))))
+        )
+        for model, payload in invalid_payloads:
+            with self.subTest(payload=payload):
+                self.assert_same_error(model, payload)
+
+    def test_disabled_client_side_validations_are_skipped(self):
+        config = configuration.Configuration(disabled_client_side_validations='minLength')
+        contact = Contact.from_openapi_data_oapg(dict(CONTACT, avatar=''), _configuration=config)
+        self.assertEqual(contact['avatar'], '')
+
+    def test_compiled_schemas_are_cached(self):
+        Contact.from_openapi_data_oapg(CONTACT)
+        compiled = schemas.CompiledSchema.for_schema_classes((Contact,))
+        self.assertIs(schemas.CompiledSchema.for_schema_classes((Contact,)), compiled)
+        self.assertIs(compiled.property_schema('location'), compiled.property_schema('location'))
+
+    def test_payloads_holding_schema_instances_use_the_interpreted_validation(self):
+        location = Location(country='GB', region='London', city='London')
+        contact = Contact(account='acc_1', email='ada@example.com', location=location)
+        self.assertIsInstance(contact['location'], Location)
+        self.assertEqual(
+            contact, Contact(account='acc_1', email='ada@example.com', location=dict(location)))
+
+
+if __name__ == '__main__':
+    unittest.main()
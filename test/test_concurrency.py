@@ -0,0 +1,107 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, bulk, configuration, exceptions
+from versify.concurrency import AdaptiveConcurrency, ConcurrencyStats
+
+from .test_bulk import FakeWriteServer
+from .test_cache import FakeClock
+
+
+class OverloadedServer(FakeWriteServer):
+    """Answers 503 while more than capacity requests are in flight"""
+
+    def __init__(self, capacity, delay):
+        super().__init__(delay=delay)
+        self.capacity = capacity
+
+    def respond(self, method, path, body):
+        with self.lock:
+            overloaded = self.in_flight > self.capacity
+        if overloaded:
+            return self.response(self.json_bytes({'detail': []}), status=503)
+        return super().respond(method, path, body)
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+
+    def test_aimd(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrency(initial_limit=4, max_limit=5, clock=clock)
+
+        def complete(latency, status=201):
+            started = clock.now
+            clock.now += latency
+            limiter.record(started, status)
+
+        for _ in range(4):
+            complete(0.125)
+        # each success adds 1 / limit
+        self.assertEqual(limiter.limit, 4)
+        complete(0.125)
+        self.assertEqual(limiter.limit, 5)
+        complete(0.125)
+        self.assertEqual(limiter.limit, 5)
+        complete(0.125, status=503)
+        self.assertEqual(limiter.limit, 3)
+        # a request sent before the decrease does not decrease the limit again
+        limiter.record(clock.now - 1, None)
+        self.assertEqual(limiter.limit, 3)
+        # a response more than latency_tolerance times slower than the fastest one means overload
+        complete(0.375)
+        self.assertEqual(limiter.limit, 2)
+        complete(0.125, status=422)
+        self.assertEqual(limiter.stats(), ConcurrencyStats(
+            limit=2, min_latencies={None: 0.125}, requests=10, increases=6, decreases=2))
+        with self.assertRaises(exceptions.ApiValueError):
+            AdaptiveConcurrency(initial_limit=0)
+
+    def test_every_operation_has_its_own_baseline(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrency(initial_limit=4, clock=clock)
+        # list pages take far longer than gets by id without a sign of overload
+        latencies = {'GET /v2/contacts/{id}': 0.015625, 'GET /v2/contacts': 0.5}
+        for operation, latency in list(latencies.items()) * 10:
+            started = clock.now
+            clock.now += latency
+            limiter.record(started, 200, operation)
+        stats = limiter.stats()
+        self.assertEqual((stats.decreases, stats.increases), (0, 20))
+        self.assertEqual(stats.min_latencies, latencies)
+
+    def test_bulk_converges_on_the_server_capacity(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        limiter = AdaptiveConcurrency(initial_limit=2, max_limit=16)
+        client = api_client.ApiClient(
+            configuration=config, pool_threads=16, concurrency_limiter=limiter)
+        self.addCleanup(client.close)
+        server = OverloadedServer(capacity=4, delay=0.002)
+        bodies = ({'email': 'c{}@example.com'.format(i)} for i in range(300))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            report = bulk.bulk_create(client, 'contacts', bodies, window=16, keep_results=False)
+        stats = limiter.stats()
+        self.assertEqual(stats.requests, 300)
+        self.assertGreater(stats.increases, 0)
+        self.assertGreater(stats.decreases, 0)
+        # the limit grows until requests beyond the capacity fail, then backs off below the window
+        self.assertLessEqual(stats.limit, 8)
+        self.assertLessEqual(server.max_in_flight, 8)
+        self.assertGreater(report.succeeded, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
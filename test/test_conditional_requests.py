@@ -0,0 +1,112 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import unittest
+
+from versify import api_client, configuration, exceptions, schemas
+from versify.cache import LRUResponseCache
+from versify.paths.v2_collections_collection_id import get, put
+
+from .local_servers import LocalServer
+from .test_cache import FakeClock
+from .test_paths import ApiTestMixin
+
+
+COLLECTION = {'_id': 'col_1', 'account': 'acc_1', 'name': 'Founders'}
+
+
+class TestConditionalRequests(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = LRUResponseCache(ttl=10, clock=self.clock)
+
+    def client(self, server):
+        config = configuration.Configuration(host=server.host)
+        config.access_token = 'token'
+        client = api_client.ApiClient(configuration=config, response_cache=self.cache)
+        self.addCleanup(client.close)
+        return get.ApiForget(api_client=client), put.ApiForput(api_client=client)
+
+    def get(self, api):
+        return api.get(path_params={'collection_id': 'col_1'})
+
+    def test_304_serves_the_cached_model(self):
+        with LocalServer({'/v2/collections/col_1': COLLECTION}) as server:
+            api, _ = self.client(server)
+            first = self.get(api)
+            self.assertEqual(first.etag, '"1"')
+            self.assertEqual(first.last_modified, 'Wed, 01 Feb 2023 00:00:00 GMT')
+            # fresh, the server is not called
+            self.assertIs(self.get(api).body, first.body)
+            self.clock.now = 11
+            revalidated = self.get(api)
+            # stale, revalidated by the server and not decoded again
+            self.assertIs(revalidated.body, first.body)
+            self.assertEqual(revalidated.response.status, 200)
+            self.clock.now = 15
+            self.get(api)
+        self.assertEqual(
+            [request[2].get('If-None-Match') for request in server.requests], [None, '"1"'])
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.revalidations), (2, 2, 1))
+
+    def test_changed_documents_are_downloaded(self):
+        with LocalServer({'/v2/collections/col_1': COLLECTION}) as server:
+            api, put_api = self.client(server)
+            first = self.get(api)
+            self.clock.now = 11
+            server.documents['/v2/collections/col_1'] = dict(COLLECTION, name='Early adopters')
+            server.versions['/v2/collections/col_1'] += 1
+            changed = self.get(api)
+            self.assertEqual(changed.body['name'], 'Early adopters')
+            self.assertEqual(changed.etag, '"2"')
+            self.assertIsNot(changed.body, first.body)
+            # a write invalidates the entry, so the next read is unconditional
+            put_api.put(path_params={'collection_id': 'col_1'}, body={'name': 'Launch'})
+            self.assertEqual(self.get(api).body['name'], 'Launch')
+        self.assertEqual(server.requests[-1][0], 'GET')
+        self.assertNotIn('If-None-Match', server.requests[-1][2])
+
+    def test_last_modified_revalidation(self):
+        with LocalServer({'/v2/collections/col_1': COLLECTION}, etags=False) as server:
+            api, _ = self.client(server)
+            first = self.get(api)
+            self.clock.now = 11
+            self.assertIs(self.get(api).body, first.body)
+        self.assertEqual(
+            server.requests[1][2].get('If-Modified-Since'), 'Wed, 01 Feb 2023 00:00:00 GMT')
+        self.assertNotIn('If-None-Match', server.requests[1][2])
+
+
+class TestResponseHeaders(ApiTestMixin, unittest.TestCase):
+
+    def deserialize(self, value):
+        response = api_client.OpenApiResponse(headers=[
+            api_client.HeaderParameter('X-Remaining', style=api_client.ParameterStyle.SIMPLE,
+                                       schema=schemas.IntSchema)])
+        return response.deserialize(
+            self.response(b'', headers={'X-Remaining': value}), configuration.Configuration())
+
+    def test_unquoted_numbers_are_decoded(self):
+        self.assertEqual(self.deserialize('5').headers, {'X-Remaining': 5})
+
+    def test_invalid_values_raise_the_validation_error(self):
+        with self.assertRaises(exceptions.ApiTypeError) as context:
+            self.deserialize('five')
+        # the error of the value itself, not of the json fallback
+        self.assertIn('passed type was str', str(context.exception))
+        with self.assertRaises(exceptions.ApiTypeError):
+            self.deserialize('"5"')
+
+
+if __name__ == '__main__':
+    unittest.main()
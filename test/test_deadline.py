@@ -0,0 +1,110 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, bulk, configuration, exceptions, pagination
+from versify.deadline import Deadline
+from versify.paths.v2_contacts_contact_id import get
+from versify.retry import RetryPolicy
+
+from .test_bulk import FakeWriteServer
+from .test_cache import FakeClock
+from .test_pagination import FakeListServer, contacts
+from .test_paths import ApiTestMixin
+
+CONTACT = {'_id': 'con_1', 'account': 'acc_1', 'email': 'ada@example.com'}
+
+
+class TestDeadline(ApiTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.client = api_client.ApiClient(configuration=config, pool_threads=1)
+        self.addCleanup(self.client.close)
+
+    def slow(self, server, seconds):
+        """Wraps server so every request takes seconds of the fake clock"""
+        def request(*args, **kwargs):
+            self.clock.now += seconds
+            return server(*args, **kwargs)
+        return request
+
+    def test_deadline(self):
+        deadline = Deadline(2, request_timeout=0.5, clock=self.clock)
+        self.assertEqual(deadline.timeout(), 0.5)
+        self.clock.now = 1.75
+        self.assertEqual((deadline.timeout(), deadline.remaining()), (0.25, 0.25))
+        step = deadline.budget(1)
+        self.assertEqual(step.remaining(), 0.25)
+        self.assertEqual(Deadline(3, clock=self.clock).budget(1).remaining(), 1)
+        self.clock.now = 2
+        self.assertTrue(deadline.expired)
+        with self.assertRaises(exceptions.DeadlineExceededError) as context:
+            deadline.timeout()
+        self.assertEqual(context.exception.status, 504)
+
+    def test_requests_get_the_remaining_time(self):
+        deadline = Deadline(2, clock=self.clock)
+        api = get.ApiForget(api_client=self.client)
+        self.clock.now = 0.5
+        found = self.response(self.json_bytes(CONTACT))
+        with patch.object(urllib3.PoolManager, 'request', return_value=found) as mock_request:
+            api.get(path_params={'contact_id': 'con_1'}, timeout=deadline)
+            self.assertEqual(mock_request.call_args[1]['timeout'].total, 1.5)
+            self.clock.now = 2
+            with self.assertRaises(exceptions.DeadlineExceededError):
+                api.get(path_params={'contact_id': 'con_1'}, timeout=deadline)
+            self.assertEqual(mock_request.call_count, 1)
+
+    def test_retries_stop_at_the_deadline(self):
+        sleeps = []
+        self.client.retry_policy = RetryPolicy(sleep=sleeps.append)
+        unavailable = self.response(
+            self.json_bytes({'detail': []}), status=503, headers={'Retry-After': '5'})
+        api = get.ApiForget(api_client=self.client)
+        with patch.object(
+                urllib3.PoolManager, 'request', return_value=unavailable) as mock_request:
+            with self.assertRaises(exceptions.ApiException) as context:
+                api.get(path_params={'contact_id': 'con_1'}, timeout=Deadline(3, clock=self.clock))
+        # waiting for Retry-After would end after the deadline, so the 503 is returned right away
+        self.assertEqual((context.exception.status, mock_request.call_count, sleeps), (503, 1, []))
+        self.assertEqual(self.client.retry_policy.stats()['GET /v2/contacts/{id}'].give_ups, 1)
+
+    def test_pagination_aborts(self):
+        server = FakeListServer(contacts(10))
+        deadline = Deadline(2.5, clock=self.clock)
+        items = []
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.slow(server, 1)):
+            with self.assertRaises(exceptions.DeadlineExceededError):
+                for item in pagination.iter_resource(
+                        self.client, 'contacts', page_size=2, timeout=deadline):
+                    items.append(item)
+        self.assertEqual((len(items), server.requested_pages), (6, [1, 2, 3]))
+
+    def test_bulk_stops_taking_records(self):
+        server = FakeWriteServer()
+        bodies = [{'email': 'c{}@example.com'.format(i)} for i in range(10)]
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.slow(server, 1)):
+            report = bulk.bulk_create(
+                self.client, 'contacts', iter(bodies), window=1,
+                timeout=Deadline(3.5, clock=self.clock))
+        self.assertTrue(report.deadline_exceeded)
+        self.assertEqual((report.succeeded, report.completed), (4, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration
+from versify.hedging import HedgingPolicy
+from versify.paths.v2_contacts_contact_id import get
+
+from .test_paths import ApiTestMixin
+
+CONTACT = {'_id': 'con_1', 'account': 'acc_1', 'email': 'ada@example.com'}
+OPERATION = 'GET /v2/contacts/{id}'
+
+
+class TestHedgingPolicy(ApiTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.policy = HedgingPolicy(paths={'/v2/contacts/{id}'}, min_samples=5, max_hedge_rate=0.0)
+        self.addCleanup(self.policy.close)
+        for _ in range(5):
+            self.policy.observe(OPERATION, 0.01)
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.client = api_client.ApiClient(configuration=config, hedging_policy=self.policy)
+        self.addCleanup(self.client.close)
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def slow_first_request(self):
+        calls = []
+
+        def request(method, url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                self.release.wait(5)
+            return self.response(self.json_bytes(CONTACT))
+        return request
+
+    def test_slow_requests_are_hedged(self):
+        self.assertEqual(self.policy.delay(OPERATION), 0.01)
+        api = get.ApiForget(api_client=self.client)
+        start = time.monotonic()
+        slow_first_request = self.slow_first_request()
+        with patch.object(
+                urllib3.PoolManager, 'request', side_effect=slow_first_request) as mock_request:
+            api_response = api.get(path_params={'contact_id': 'con_1'})
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(api_response.body['_id'], 'con_1')
+        self.assertEqual(mock_request.call_count, 2)
+        stats = self.policy.stats()[OPERATION]
+        self.assertEqual((stats.requests, stats.hedged, stats.hedge_wins), (1, 1, 1))
+
+    def test_hedge_rate_is_capped(self):
+        api = get.ApiForget(api_client=self.client)
+        with patch.object(urllib3.PoolManager, 'request', side_effect=self.slow_first_request()):
+            api.get(path_params={'contact_id': 'con_1'})
+        # the reserve is spent and max_hedge_rate=0 adds nothing back, so no hedge is sent
+        threading.Timer(0.1, self.release.set).start()
+        slow_first_request = self.slow_first_request()
+        with patch.object(
+                urllib3.PoolManager, 'request', side_effect=slow_first_request) as mock_request:
+            api.get(path_params={'contact_id': 'con_1'})
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(self.policy.stats()[OPERATION].hedged, 1)
+
+    def test_requests_without_a_hedge_stay_on_the_calling_thread(self):
+        threads = []
+
+        def request(method, url, **kwargs):
+            threads.append(threading.current_thread())
+            return self.response(self.json_bytes(CONTACT))
+
+        api = get.ApiForget(api_client=self.client)
+        with patch.object(urllib3.PoolManager, 'request', side_effect=request):
+            # the budget can pay for a hedge, so the request is sent on the executor
+            api.get(path_params={'contact_id': 'con_1'})
+            self.policy.budget.withdraw()
+            api.get(path_params={'contact_id': 'con_1'})
+        self.assertEqual(threads[0].name.split('_')[0], 'versify-hedge')
+        self.assertIs(threads[1], threading.current_thread())
+        self.client.close()
+        self.assertIsNone(self.policy._executor)
+
+    def test_a_busy_executor_does_not_trigger_hedges(self):
+        policy = HedgingPolicy(min_samples=1, max_workers=1)
+        self.addCleanup(policy.close)
+        policy.observe(OPERATION, 0.01)
+        policy.executor.submit(self.release.wait, 5)
+        thread = policy.send(OPERATION, threading.current_thread)
+        self.assertIs(thread, threading.current_thread())
+        self.assertEqual(policy.stats()[OPERATION].hedged, 0)
+
+    def test_applies_to_gets_of_the_paths(self):
+        self.assertTrue(self.policy.applies('GET', '/v2/contacts/{id}'))
+        self.assertFalse(self.policy.applies('DELETE', '/v2/contacts/{id}'))
+        self.assertFalse(self.policy.applies('GET', '/v2/contacts'))
+        self.assertIsNone(self.policy.delay('GET /v2/users/me'))
+
+    def test_send_async_cancels_the_slower_request(self):
+        cancelled = []
+
+        async def main():
+            calls = []
+
+            async def send():
+                calls.append(None)
+                if len(calls) == 1:
+                    try:
+                        await asyncio.sleep(5)
+                    except asyncio.CancelledError:
+                        cancelled.append(True)
+                        raise
+                    return 'primary'
+                return 'hedge'
+
+            return await self.policy.send_async(OPERATION, send)
+
+        self.assertEqual(asyncio.run(main()), 'hedge')
+        self.assertEqual(cancelled, [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions, pagination, schemas
+from versify.lazy import LazyModel
+from versify.model.contact import Contact
+from versify.paths.v2_contacts_contact_id import get
+
+from .test_paths import ApiTestMixin
+from .test_pagination import FakeListServer, contacts
+
+CONTACT = {
+    '_id': 'con_1',
+    'account': 'acc_1',
+    'email': 'ada@example.com',
+    'status': 'active',
+    'location': {'country': 'GB', 'region': 'London', 'city': 'London'},
+    'metadata': {'score': 10},
+}
+
+
+class TestLazyModel(ApiTestMixin, unittest.TestCase):
+
+    def test_properties_are_built_on_first_access(self):
+        contact = LazyModel.from_server_data(Contact, CONTACT)
+        self.assertIs(contact.model, Contact)
+        self.assertFalse(contact.is_built('location'))
+        email = contact.email
+        self.assertIsInstance(email, schemas.StrSchema)
+        self.assertEqual(email, 'ada@example.com')
+        self.assertIs(contact['email'], email)
+        self.assertFalse(contact.is_built('location'))
+        self.assertEqual(contact['location'], Contact.from_openapi_data_oapg(CONTACT)['location'])
+        self.assertIs(contact.get_item_oapg('phone_number'), schemas.unset)
+        self.assertEqual(contact.to_dict(), CONTACT)
+        self.assertEqual(contact.to_model(), Contact.from_openapi_data_oapg(CONTACT))
+
+    def test_validation_errors_surface_on_access(self):
+        with self.assertRaises(exceptions.ApiTypeError):
+            LazyModel.from_server_data(Contact, {'account': 'acc_1'})
+        contact = LazyModel.from_server_data(
+            Contact, dict(CONTACT, status='deleted', location={'country': 'GB'}))
+        self.assertEqual(contact['email'], 'ada@example.com')
+        with self.assertRaises(exceptions.ApiValueError):
+            contact['status']
+        with self.assertRaises(exceptions.ApiTypeError) as context:
+            contact['location']
+        self.assertEqual(
+            str(context.exception), "Location is missing 2 required arguments: ['city', 'region']")
+        trusted = LazyModel.from_server_data(
+            Contact, dict(CONTACT, status='deleted'), validate=False)
+        self.assertEqual(trusted['status'], 'deleted')
+
+    def test_lazy_response_format(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        client = api_client.ApiClient(configuration=config)
+        self.addCleanup(client.close)
+        api = get.ApiForget(api_client=client)
+        response = self.response(self.json_bytes(CONTACT))
+        with patch.object(urllib3.PoolManager, 'request', return_value=response):
+            api_response = api.get(path_params={'contact_id': 'con_1'}, response_format='lazy')
+        self.assertIsInstance(api_response, get.ApiResponseFor200)
+        self.assertIsInstance(api_response.body, LazyModel)
+        self.assertEqual(api_response.body['_id'], 'con_1')
+
+        server = FakeListServer(contacts(5))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            for stream in (False, True):
+                items = list(pagination.iter_contacts(
+                    client, page_size=2, stream=stream, response_format='lazy'))
+                self.assertEqual([item.to_dict() for item in items], contacts(5))
+                self.assertEqual(
+                    [item.email for item in items], [item['email'] for item in contacts(5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
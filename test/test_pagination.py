@@ -0,0 +1,165 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import io
+import threading
+import unittest
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import urllib3
+
+from versify import api_client, configuration, exceptions, pagination
+from versify.model.contact import Contact
+
+from .test_paths import ApiTestMixin
+
+
+class FakeListServer(ApiTestMixin):
+    """Serves /v2/<resource> pages out of an in-memory list"""
+
+    def __init__(self, items):
+        self.items = items
+        self.requested_pages = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, **kwargs):
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        page_num = int(query['page_num'][0])
+        page_size = int(query['page_size'][0])
+        with self.lock:
+            self.requested_pages.append(page_num)
+        start = (page_num - 1) * page_size
+        page = {
+            'count': len(self.items),
+            'data': self.items[start:start + page_size],
+            'has_more': start + page_size < len(self.items),
+            'object': 'list',
+            'url': parsed.path,
+        }
+        return self.response(
+            io.BytesIO(self.json_bytes(page)), preload_content=kwargs.get('preload_content', True))
+
+
+def contacts(count):
+    return [{'_id': 'con_{}'.format(i), 'account': 'acc_1', 'email': 'c{}@example.com'.format(i)}
+            for i in range(count)]
+
+
+class TestPagination(unittest.TestCase):
+
+    def setUp(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.client = api_client.ApiClient(configuration=config)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_iter_contacts_yields_every_item_in_order(self):
+        server = FakeListServer(contacts(250))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            items = list(pagination.iter_contacts(self.client, page_size=100))
+        self.assertEqual([item['_id'] for item in items], ['con_{}'.format(i) for i in range(250)])
+        self.assertIsInstance(items[0], Contact)
+        self.assertEqual(server.requested_pages, [1, 2, 3])
+
+    def test_prefetch_requests_pages_ahead_and_stops_at_count(self):
+        server = FakeListServer(contacts(50))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            items = list(pagination.iter_contacts(self.client, page_size=10, prefetch=3))
+        self.assertEqual(len(items), 50)
+        self.assertEqual(sorted(server.requested_pages), [1, 2, 3, 4, 5])
+
+    def test_early_exit_bounds_requested_pages(self):
+        server = FakeListServer(contacts(1000))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            iterator = pagination.iter_contacts(self.client, page_size=10, prefetch=2)
+            first = [next(iterator) for _ in range(15)]
+            iterator.close()
+        self.assertEqual(first[-1]['_id'], 'con_14')
+        self.assertLessEqual(max(server.requested_pages), 5)
+
+    def test_query_and_header_params_are_forwarded(self):
+        server = FakeListServer(contacts(3))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server) as mock_request:
+            list(pagination.iter_contacts(
+                self.client, query_params={'status': 'active'},
+                header_params={'Versify-Account': 'acc_1'}))
+        url = mock_request.call_args[0][1]
+        self.assertIn('status=active', url)
+        self.assertEqual(mock_request.call_args[1]['headers']['Versify-Account'], 'acc_1')
+
+    def test_stream_decodes_items_from_the_socket(self):
+        server = FakeListServer(contacts(25))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server) as mock_request:
+            items = list(pagination.iter_contacts(self.client, page_size=10, stream=True))
+        self.assertEqual([item['_id'] for item in items], ['con_{}'.format(i) for i in range(25)])
+        self.assertIsInstance(items[0], Contact)
+        self.assertEqual(server.requested_pages, [1, 2, 3])
+        self.assertFalse(mock_request.call_args[1]['preload_content'])
+
+    def test_python_response_format_yields_decoded_json(self):
+        server = FakeListServer(contacts(15))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            items = list(
+                pagination.iter_contacts(self.client, page_size=10, response_format='python'))
+        self.assertEqual(items, contacts(15))
+        self.assertIs(type(items[0]), dict)
+
+    def test_fetch_all_reassembles_concurrent_pages_in_order(self):
+        server = FakeListServer(contacts(95))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            items = pagination.fetch_all(self.client, 'contacts', page_size=10, concurrency=4)
+        self.assertEqual([item['_id'] for item in items], ['con_{}'.format(i) for i in range(95)])
+        self.assertEqual(sorted(server.requested_pages), list(range(1, 11)))
+
+    def test_fetch_all_deduplicates_items_shifted_by_inserts(self):
+        server = FakeListServer(contacts(20))
+
+        def insert_after_first_page(method, url, **kwargs):
+            response = server(method, url, **kwargs)
+            if len(server.requested_pages) == 1:
+                server.items.insert(
+                    0, {'_id': 'con_new', 'account': 'acc_1', 'email': 'new@example.com'})
+            return response
+
+        with patch.object(urllib3.PoolManager, 'request', side_effect=insert_after_first_page):
+            items = pagination.fetch_all(self.client, 'contacts', page_size=10, concurrency=1)
+        ids = [item['_id'] for item in items]
+        self.assertEqual(ids, ['con_{}'.format(i) for i in range(20)])
+        self.assertEqual(server.requested_pages, [1, 2, 3])
+
+    def test_pages_added_during_the_scan_are_followed(self):
+        for prefetch in (0, 3):
+            server = FakeListServer(contacts(20))
+
+            def grow_after_first_page(method, url, **kwargs):
+                response = server(method, url, **kwargs)
+                if len(server.requested_pages) == 1:
+                    server.items.extend(contacts(35)[20:])
+                return response
+
+            with patch.object(urllib3.PoolManager, 'request', side_effect=grow_after_first_page):
+                items = list(
+                    pagination.iter_contacts(self.client, page_size=10, prefetch=prefetch))
+            self.assertEqual(
+                [item['_id'] for item in items], ['con_{}'.format(i) for i in range(35)])
+            self.assertEqual(sorted(server.requested_pages), [1, 2, 3, 4])
+
+    def test_unknown_resource(self):
+        with self.assertRaises(exceptions.ApiValueError):
+            pagination.iter_resource(self.client, 'widgets')
+
+
+if __name__ == '__main__':
+    unittest.main()
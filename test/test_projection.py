@@ -0,0 +1,113 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import unittest
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import urllib3
+
+from versify import api_client, configuration, exceptions, pagination
+from versify.model.contact import Contact
+from versify.paths.v2_contacts import get as list_contacts
+from versify.paths.v2_contacts_contact_id import get
+
+from .test_paths import ApiTestMixin
+from .test_pagination import FakeListServer, contacts
+
+CONTACT = {
+    '_id': 'con_1',
+    'account': 'acc_1',
+    'email': 'ada@example.com',
+    'status': 'deleted',
+    'location': {'country': 'GB'},
+}
+
+
+class TestProjection(ApiTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.client = api_client.ApiClient(configuration=config)
+        self.api = get.ApiForget(api_client=self.client)
+
+    def tearDown(self):
+        self.client.close()
+
+    def get(self, response, **kwargs):
+        with patch.object(urllib3.PoolManager, 'request', return_value=response) as mock_request:
+            api_response = self.api.get(path_params={'contact_id': 'con_1'}, **kwargs)
+        return api_response, mock_request.call_args
+
+    def test_only_the_requested_properties_are_built(self):
+        # status and location are invalid but are never built
+        api_response, _ = self.get(
+            self.response(self.json_bytes(CONTACT)), fields=('_id', 'email'))
+        self.assertIsInstance(api_response.body, Contact)
+        self.assertEqual(dict(api_response.body), {'_id': 'con_1', 'email': 'ada@example.com'})
+        self.assertEqual(api_response.body['email'], 'ada@example.com')
+        with self.assertRaises(exceptions.ApiValueError):
+            self.get(self.response(self.json_bytes(CONTACT)), fields=('_id', 'status'))
+
+        api_response, _ = self.get(
+            self.response(self.json_bytes(CONTACT)), fields=('_id', 'location'),
+            response_format='python')
+        self.assertEqual(api_response.body, {'_id': 'con_1', 'location': {'country': 'GB'}})
+
+    def test_list_responses_project_their_items(self):
+        api = list_contacts.ApiForget(api_client=self.client)
+        page = {
+            'count': 2, 'data': contacts(2), 'has_more': False, 'object': 'list',
+            'url': '/v2/contacts',
+        }
+        response = self.response(self.json_bytes(page))
+        with patch.object(urllib3.PoolManager, 'request', return_value=response):
+            api_response = api.get(fields=('email',))
+        self.assertEqual(api_response.body['count'], 2)
+        self.assertEqual([dict(item) for item in api_response.body['data']],
+                         [{'email': item['email']} for item in contacts(2)])
+
+    def test_error_bodies_are_not_projected(self):
+        error = {'detail': [
+            {'loc': ['path', 'contact_id'], 'msg': 'invalid', 'type': 'value_error'}]}
+        with self.assertRaises(exceptions.ApiException) as context:
+            self.get(
+                self.response(self.json_bytes(error), status=422), fields=('_id',),
+                response_format='python')
+        self.assertEqual(context.exception.api_response.body, error)
+
+    def test_fields_are_sent_when_the_server_supports_them(self):
+        _, call_args = self.get(self.response(self.json_bytes(CONTACT)), fields=('_id', 'email'))
+        self.assertEqual(urlparse(call_args[0][1]).query, '')
+        self.client.configuration.fields_query_param = 'fields'
+        _, call_args = self.get(self.response(self.json_bytes(CONTACT)), fields=('_id', 'email'))
+        self.assertEqual(parse_qs(urlparse(call_args[0][1]).query), {'fields': ['_id,email']})
+        with self.assertRaises(exceptions.ApiValueError):
+            self.get(
+                self.response(self.json_bytes(CONTACT)), fields=('_id',), response_format='slots')
+
+    def test_paginators_project_items(self):
+        server = FakeListServer(contacts(5))
+        expected = [{'_id': item['_id']} for item in contacts(5)]
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            for stream in (False, True):
+                items = list(pagination.iter_contacts(
+                    self.client, page_size=2, stream=stream, fields=('_id',)))
+                self.assertEqual([dict(item) for item in items], expected)
+                self.assertIsInstance(items[0], Contact)
+            items = pagination.fetch_all(
+                self.client, 'contacts', page_size=2, fields=('_id',), response_format='python')
+            self.assertEqual(items, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
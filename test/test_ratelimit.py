@@ -0,0 +1,108 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions
+from versify.paths.v2_contacts_contact_id import get
+from versify.ratelimit import RateLimiter, TokenBucket
+from versify.retry import RetryPolicy
+
+from .test_cache import FakeClock
+from .test_paths import ApiTestMixin
+
+CONTACT = {'_id': 'con_1', 'account': 'acc_1', 'email': 'ada@example.com'}
+
+
+class TestRateLimiter(ApiTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.sleeps = []
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.clock.now += seconds
+
+    def limiter(self, **kwargs):
+        return RateLimiter(sleep=self.sleep, clock=self.clock, **kwargs)
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=2, burst=2, clock=self.clock)
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0, 0, 0.5, 1.0])
+        self.clock.now += 2
+        self.assertEqual(bucket.reserve(), 0)
+        with self.assertRaises(exceptions.ApiValueError):
+            TokenBucket(rate=0, burst=1)
+
+    def test_buckets_per_account_and_path(self):
+        limiter = self.limiter(rate=1, rates={'/v2/contacts/search': 0.5})
+        waits = [limiter.acquire(account, path) for _ in range(2)
+                 for account, path in [('acc_1', '/v2/contacts'), ('acc_2', '/v2/contacts'),
+                                       ('acc_1', '/v2/contacts/search')]]
+        self.assertEqual(waits, [0, 0, 0, 1.0, 1.0, 2.0])
+        stats = limiter.stats()
+        self.assertEqual(stats['acc_1', '/v2/contacts/search'].rate, 0.5)
+        contacts = stats['acc_1', '/v2/contacts']
+        self.assertEqual((contacts.requests, contacts.delayed), (2, 1))
+
+    def test_slows_down_on_429(self):
+        limiter = self.limiter(rate=4, burst=1, recovery=0.25)
+        limiter.record('acc_1', '/v2/contacts', 429, retry_after='3')
+        self.assertEqual(limiter.acquire('acc_1', '/v2/contacts'), 3)
+        self.assertEqual(limiter.stats()['acc_1', '/v2/contacts'].rate, 2)
+        limiter.record('acc_1', '/v2/contacts', 429)
+        self.assertEqual(limiter.stats()['acc_1', '/v2/contacts'].rate, 1)
+        for _ in range(5):
+            limiter.record('acc_1', '/v2/contacts', 200)
+        stats = limiter.stats()['acc_1', '/v2/contacts']
+        self.assertEqual((stats.rate, stats.throttled), (4, 2))
+
+    def test_api_client_paces_requests(self):
+        limiter = self.limiter(rate=1)
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        client = api_client.ApiClient(
+            configuration=config, header_name='Versify-Account', header_value='acc_1',
+            rate_limiter=limiter, retry_policy=RetryPolicy(sleep=self.sleep))
+        self.addCleanup(client.close)
+        throttled = self.response(
+            self.json_bytes({'detail': []}), status=429, headers={'Retry-After': '2'})
+        responses = [throttled] + [self.response(self.json_bytes(CONTACT)) for _ in range(2)]
+        api = get.ApiForget(api_client=client)
+        with patch.object(urllib3.PoolManager, 'request', side_effect=responses):
+            api.get(path_params={'contact_id': 'con_1'})
+            api.get(path_params={'contact_id': 'con_2'})
+        # the retry waits out Retry-After, which also refilled the bucket, then the halved rate
+        # (plus the recovery of one success) paces the second request
+        self.assertEqual(self.sleeps[0], 2.0)
+        self.assertAlmostEqual(self.sleeps[1], 1 / 0.52)
+        self.assertEqual(len(self.sleeps), 2)
+        stats = limiter.stats()['acc_1', '/v2/contacts/{id}']
+        self.assertEqual((stats.requests, stats.throttled), (3, 1))
+
+    def test_wait_async(self):
+        limiter = RateLimiter(rate=100, burst=1)
+
+        async def main():
+            for _ in range(3):
+                await limiter.wait_async(None, '/v2/contacts')
+
+        asyncio.run(main())
+        self.assertEqual(limiter.stats()[None, '/v2/contacts'].delayed, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions
+from versify.paths.v2_contacts_contact_id import delete, get
+
+from .test_paths import ApiTestMixin
+
+CONTACT = {
+    '_id': 'con_1', 'account': 'acc_1', 'email': 'ada@example.com',
+    'metadata': {'score': 10, 'ratio': 0.5},
+}
+
+
+class TestResponseFormat(ApiTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.client = api_client.ApiClient(configuration=config)
+        self.api = get.ApiForget(api_client=self.client)
+
+    def tearDown(self):
+        self.client.close()
+
+    def get(self, response, **kwargs):
+        with patch.object(urllib3.PoolManager, 'request', return_value=response):
+            return self.api.get(path_params={'contact_id': 'con_1'}, **kwargs)
+
+    def test_python_format_returns_decoded_json(self):
+        api_response = self.get(self.response(self.json_bytes(CONTACT)), response_format='python')
+        self.assertIsInstance(api_response, api_client.ApiResponseWithoutSchema)
+        self.assertEqual(api_response.body, CONTACT)
+        self.assertIs(type(api_response.body), dict)
+        self.assertIs(type(api_response.body['metadata']['score']), int)
+        self.assertIs(type(api_response.body['metadata']['ratio']), float)
+
+    def test_bytes_format_returns_the_body(self):
+        body = self.json_bytes(CONTACT)
+        api_response = self.get(self.response(body), response_format='bytes')
+        self.assertEqual(api_response.body, body)
+
+    def test_error_responses_carry_the_decoded_body(self):
+        error = {'detail': [
+            {'loc': ['path', 'contact_id'], 'msg': 'invalid', 'type': 'value_error'}]}
+        with self.assertRaises(exceptions.ApiException) as context:
+            self.get(self.response(self.json_bytes(error), status=422), response_format='python')
+        self.assertEqual(context.exception.status, 422)
+        self.assertEqual(context.exception.api_response.body, error)
+
+    def test_empty_body_is_unset(self):
+        api = delete.ApiFordelete(api_client=self.client)
+        response = self.response(b'', status=204)
+        with patch.object(urllib3.PoolManager, 'request', return_value=response):
+            api_response = api.delete(
+                path_params={'contact_id': 'con_1'}, response_format='python')
+        self.assertIsInstance(api_response, api_client.ApiResponseWithoutSchema)
+        self.assertIs(api_response.body, api_client.unset)
+
+    def test_invalid_format_is_rejected_before_the_request(self):
+        with patch.object(urllib3.PoolManager, 'request') as mock_request:
+            with self.assertRaises(exceptions.ApiValueError):
+                self.api.get(path_params={'contact_id': 'con_1'}, response_format='xml')
+        mock_request.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
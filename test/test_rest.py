@@ -0,0 +1,80 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import concurrent.futures
+import threading
+import unittest
+
+from versify import configuration, exceptions, rest
+
+from .local_servers import LocalServer
+
+COLLECTION = {'_id': 'col_1', 'account': 'acc_1', 'name': 'Founders'}
+
+
+class TestPoolStats(unittest.TestCase):
+
+    def setUp(self):
+        self.server = LocalServer({'/v2/collections/col_1': COLLECTION})
+        # keep connections alive between requests
+        self.server.httpd.RequestHandlerClass.protocol_version = 'HTTP/1.1'
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.url = self.server.host + '/v2/collections/col_1'
+        # pool_stats keys are scheme://host:port
+        self.key = self.server.host
+
+    def client(self, **settings):
+        config = configuration.Configuration(host=self.server.host)
+        for name, value in settings.items():
+            setattr(config, name, value)
+        return rest.RESTClientObject(config)
+
+    def test_connections_are_reused(self):
+        client = self.client()
+        for _ in range(3):
+            self.assertEqual(client.GET(self.url).status, 200)
+        stats = client.pool_stats()[self.key]
+        self.assertEqual(
+            (stats.created, stats.connects, stats.reused, stats.discarded), (1, 1, 2, 0))
+        self.assertEqual((stats.checked_out, stats.max_checked_out, stats.exhausted), (0, 1, 0))
+
+    def test_idle_timeout(self):
+        client = self.client(connection_pool_idle_timeout=0)
+        for _ in range(3):
+            client.GET(self.url)
+        stats = client.pool_stats()[self.key]
+        self.assertEqual(
+            (stats.created, stats.connects, stats.reused, stats.discarded), (1, 3, 0, 2))
+
+    def test_per_host_pool_settings(self):
+        client = self.client(
+            connection_pool_maxsize=8, connection_pool_per_host={'127.0.0.1': {'maxsize': 2}})
+        barrier = threading.Barrier(4)
+
+        def request(_):
+            barrier.wait(5)
+            return client.GET(self.url).status
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            self.assertEqual(list(executor.map(request, range(4))), [200] * 4)
+        stats = client.pool_stats()[self.key]
+        self.assertEqual(stats.checked_out, 0)
+        self.assertGreater(stats.exhausted, 0)
+        # connections beyond maxsize are closed when they are returned
+        self.assertEqual(stats.created - stats.discarded, 2)
+
+        with self.assertRaises(exceptions.ApiValueError):
+            self.client(connection_pool_per_host={'127.0.0.1': {'max_size': 2}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+from datetime import datetime, timezone
+import random
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions
+from versify.api_client import path_template
+from versify.paths.v2_accounts import get as list_accounts
+from versify.paths.v2_contacts import post
+from versify.paths.v2_contacts_contact_id import get
+from versify.retry import RetryBudget, RetryPolicy, RetryStats, parse_retry_after
+
+from .local_servers import AsyncLocalServer, json_response
+from .test_paths import ApiTestMixin
+
+CONTACT = {'_id': 'con_1', 'account': 'acc_1', 'email': 'ada@example.com'}
+
+
+class TestRetryPolicy(ApiTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.sleeps = []
+        self.policy = RetryPolicy(
+            max_retries=2, backoff=1, sleep=self.sleeps.append, rng=random.Random(1))
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.client = api_client.ApiClient(configuration=config, retry_policy=self.policy)
+        self.addCleanup(self.client.close)
+
+    def error(self, status, headers=None):
+        return self.response(self.json_bytes({'detail': []}), status=status, headers=headers)
+
+    def get(self, *responses):
+        api = get.ApiForget(api_client=self.client)
+        with patch.object(urllib3.PoolManager, 'request', side_effect=responses) as mock_request:
+            try:
+                return api.get(path_params={'contact_id': 'con_1'}), mock_request.call_count
+            except exceptions.ApiException as error:
+                return error, mock_request.call_count
+
+    def post(self, *responses):
+        api = post.ApiForpost(api_client=self.client)
+        with patch.object(urllib3.PoolManager, 'request', side_effect=responses) as mock_request:
+            try:
+                return api.post(body={'email': 'ada@example.com'}), mock_request.call_count
+            except (exceptions.ApiException, urllib3.exceptions.HTTPError) as error:
+                return error, mock_request.call_count
+
+    def test_backoff_with_full_jitter(self):
+        api_response, calls = self.get(
+            self.error(503), self.error(502), self.response(self.json_bytes(CONTACT)))
+        self.assertEqual(api_response.body['_id'], 'con_1')
+        self.assertEqual(calls, 3)
+        self.assertTrue(0 <= self.sleeps[0] <= 1 and 0 <= self.sleeps[1] <= 2)
+        error, calls = self.get(self.error(500), self.error(500), self.error(500))
+        self.assertEqual((error.status, calls), (500, 3))
+        # not retryable
+        error, calls = self.get(self.error(404))
+        self.assertEqual((error.status, calls), (404, 1))
+        self.assertEqual(self.policy.stats(), {
+            'GET /v2/contacts/{id}': RetryStats(
+                requests=3, retries=4, give_ups=1, budget_exhausted=0)})
+
+    def test_retry_after(self):
+        api_response, _ = self.get(
+            self.error(429, {'Retry-After': '7'}), self.response(self.json_bytes(CONTACT)))
+        self.assertEqual(self.sleeps, [7.0])
+        error, calls = self.get(self.error(503, {'Retry-After': '3600'}))
+        self.assertEqual((error.status, calls), (503, 1))
+        now = datetime(2023, 2, 1, tzinfo=timezone.utc)
+        self.assertEqual(parse_retry_after('Wed, 01 Feb 2023 00:00:30 GMT', now), 30.0)
+        self.assertIsNone(parse_retry_after('soon'))
+
+    def test_non_idempotent_methods(self):
+        created = self.response(self.json_bytes(CONTACT), status=201)
+        error, calls = self.post(self.error(503))
+        self.assertEqual((error.status, calls), (503, 1))
+        _, calls = self.post(self.error(429), created)
+        self.assertEqual(calls, 2)
+        refused = urllib3.exceptions.NewConnectionError(None, 'connection refused')
+        _, calls = self.post(refused, created)
+        self.assertEqual(calls, 2)
+        reset = urllib3.exceptions.ProtocolError('Connection aborted.')
+        error, calls = self.post(reset)
+        self.assertEqual((error, calls), (reset, 1))
+
+    def test_budget(self):
+        self.policy.budget = RetryBudget(ratio=0.5, reserve=1)
+        _, calls = self.get(self.error(503), self.response(self.json_bytes(CONTACT)))
+        self.assertEqual(calls, 2)
+        # the reserve is spent and one request only deposits half a retry
+        error, calls = self.get(self.error(503))
+        self.assertEqual(calls, 1)
+        _, calls = self.get(self.error(503), self.response(self.json_bytes(CONTACT)))
+        self.assertEqual(calls, 2)
+        self.assertEqual(self.policy.stats()['GET /v2/contacts/{id}'].budget_exhausted, 1)
+
+    def test_path_template(self):
+        self.assertEqual(path_template('/v2/contacts/con_1?fields=_id'), '/v2/contacts/{id}')
+        self.assertEqual(path_template('/v2/accounts/acc_1/metrics'), '/v2/accounts/{id}/metrics')
+        self.assertEqual(path_template('/v2/contacts/search'), '/v2/contacts/search')
+        self.assertEqual(path_template('/v2/users/me'), '/v2/users/me')
+        self.assertEqual(path_template('/v2/contacts'), '/v2/contacts')
+
+    def test_async_client_retries(self):
+        page = {'count': 0, 'data': [], 'has_more': False, 'object': 'list', 'url': '/v2/accounts'}
+        responses = [json_response({'detail': []}, status=503), json_response(page)]
+        sleeps = []
+        policy = RetryPolicy(backoff=0.001, sleep=sleeps.append)
+
+        async def main():
+            async with AsyncLocalServer(lambda *args: responses.pop(0)) as server:
+                config = configuration.Configuration(host=server.host)
+                config.access_token = 'token'
+                async with api_client.AsyncApiClient(config, retry_policy=policy) as client:
+                    return await list_accounts.ApiForget(client).get(), server
+
+        api_response, server = asyncio.run(main())
+        self.assertEqual(api_response.body['count'], 0)
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(policy.stats()['GET /v2/accounts'].retries, 1)
+        # the async client waits with the policy's sleep as well
+        self.assertEqual(len(sleeps), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions
+from versify.paths.v2_accounts import get as list_accounts
+from versify.paths.v2_contacts_contact_id import get
+from versify.singleflight import SingleFlight
+
+from .local_servers import AsyncLocalServer, json_response
+from .test_paths import ApiTestMixin
+
+CONTACT = {'_id': 'con_1', 'account': 'acc_1', 'email': 'ada@example.com'}
+
+
+class BlockingServer(ApiTestMixin):
+    """Answers PoolManager.request once released, counting the requests"""
+
+    def __init__(self, body, status=200):
+        self.body = body
+        self.status = status
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, method, url, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        return self.response(self.json_bytes(self.body), status=self.status)
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        self.client = api_client.ApiClient(configuration=config, single_flight=True)
+        self.addCleanup(self.client.close)
+        self.api = get.ApiForget(api_client=self.client)
+
+    def burst(self, server, count=8, **kwargs):
+        def call():
+            try:
+                return self.api.get(path_params={'contact_id': 'con_1'}, **kwargs)
+            except exceptions.ApiException as error:
+                return error
+
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            with concurrent.futures.ThreadPoolExecutor(count) as executor:
+                futures = [executor.submit(call) for _ in range(count)]
+                wait_for(lambda: self.client.single_flight.stats().coalesced == count - 1)
+                server.release.set()
+                return [future.result() for future in futures]
+
+    def test_identical_gets_share_one_response(self):
+        server = BlockingServer(CONTACT)
+        results = self.burst(server)
+        self.assertEqual(server.calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(results[0].body['email'], 'ada@example.com')
+        self.assertEqual(
+            self.client.single_flight.stats().__dict__,
+            {'calls': 1, 'coalesced': 7, 'in_flight': 0})
+        # once finished the next call is sent again
+        response = ApiTestMixin.response(ApiTestMixin.json_bytes(CONTACT))
+        with patch.object(urllib3.PoolManager, 'request', return_value=response) as mock_request:
+            self.api.get(path_params={'contact_id': 'con_1'})
+            # other deserialization options are not coalesced with it
+            self.api.get(path_params={'contact_id': 'con_1'}, response_format='python')
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_errors_are_shared(self):
+        error = {'detail': [
+            {'loc': ['path', 'contact_id'], 'msg': 'not found', 'type': 'value_error'}]}
+        results = self.burst(BlockingServer(error, status=404), count=3)
+        self.assertTrue(all(isinstance(result, exceptions.ApiException) for result in results))
+        self.assertEqual({result.status for result in results}, {404})
+
+    def test_mutable_response_formats_are_not_coalesced(self):
+        server = BlockingServer(CONTACT)
+        server.release.set()
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            with concurrent.futures.ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(lambda _: self.api.get(
+                    path_params={'contact_id': 'con_1'}, response_format='python'), range(4)))
+        self.assertEqual(server.calls, 4)
+        self.assertEqual(len({id(result.body) for result in results}), 4)
+        self.assertEqual(self.client.single_flight.stats().calls, 0)
+
+    def test_async_gets_share_one_response(self):
+        page = {'count': 0, 'data': [], 'has_more': False, 'object': 'list', 'url': '/v2/accounts'}
+
+        async def main():
+            async with AsyncLocalServer(lambda *args: json_response(page)) as server:
+                config = configuration.Configuration(host=server.host)
+                config.access_token = 'token'
+                async with api_client.AsyncApiClient(config, single_flight=True) as client:
+                    api = list_accounts.ApiForget(client)
+                    results = await asyncio.gather(*(api.get() for _ in range(5)))
+                    return server, client, results
+
+        server, client, results = asyncio.run(main())
+        self.assertEqual(len(server.requests), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(client.single_flight.stats().coalesced, 4)
+
+    def test_cancelled_follower_does_not_cancel_the_call(self):
+        flight = SingleFlight()
+
+        async def main():
+            async def slow():
+                await asyncio.sleep(0.01)
+                return 'done'
+            leader = asyncio.ensure_future(flight.do_async('key', slow))
+            follower = asyncio.ensure_future(flight.do_async('key', slow))
+            await asyncio.sleep(0)
+            follower.cancel()
+            return await leader
+
+        self.assertEqual(asyncio.run(main()), 'done')
+        self.assertEqual(flight.stats().coalesced, 1)
+
+    def test_a_follower_takes_over_when_the_caller_is_cancelled(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def main():
+            async def slow():
+                calls.append(len(calls))
+                await asyncio.sleep(0.01)
+                return 'done {}'.format(len(calls))
+            leader = asyncio.ensure_future(flight.do_async('key', slow))
+            followers = [asyncio.ensure_future(flight.do_async('key', slow)) for _ in range(2)]
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await asyncio.gather(*followers)
+
+        self.assertEqual(asyncio.run(main()), ['done 2', 'done 2'])
+        self.assertEqual(calls, [0, 1])
+        self.assertEqual(flight.stats().in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
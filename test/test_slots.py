@@ -0,0 +1,113 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+from datetime import datetime
+import unittest
+from unittest.mock import patch
+import uuid
+
+import urllib3
+
+from versify import api_client, configuration, exceptions, pagination, schemas, slots
+from versify.model.contact import Contact
+from versify.paths.v2_contacts_contact_id import get
+
+from .test_paths import ApiTestMixin
+from .test_pagination import FakeListServer, contacts
+
+CONTACT = {
+    '_id': 'con_1',
+    'account': 'acc_1',
+    'email': 'ada@example.com',
+    'created': 1672531200,
+    'location': {'country': 'GB', 'region': 'London', 'city': 'London'},
+    'metadata': {'score': 10},
+    'social_profiles': [],
+    'nickname': 'ada',
+}
+
+
+class Schedule(schemas.DictSchema):
+
+    class MetaOapg:
+        required = {'at'}
+
+        class properties:
+            at = schemas.DateTimeSchema
+            run_id = schemas.UUIDSchema
+            __annotations__ = {'at': at, 'run_id': run_id}
+
+
+class TestSlots(ApiTestMixin, unittest.TestCase):
+
+    def test_models_are_slotted_with_native_values(self):
+        contact = slots.from_json(Contact, CONTACT)
+        self.assertIs(type(contact), slots.slots_class(Contact))
+        self.assertEqual(type(contact).__name__, 'Contact')
+        self.assertFalse(hasattr(contact, '__dict__'))
+        self.assertEqual(contact.email, 'ada@example.com')
+        self.assertIs(type(contact.created), int)
+        self.assertEqual(type(contact.location).__name__, 'Location')
+        self.assertEqual(contact.location.city, 'London')
+        self.assertEqual(contact.metadata, {'score': 10})
+        self.assertIs(contact.phone_number, schemas.unset)
+        self.assertEqual(contact['nickname'], 'ada')
+        self.assertNotIn('phone_number', contact)
+
+    def test_formatted_strings_are_converted(self):
+        run_id = uuid.uuid4()
+        schedule = slots.from_json(Schedule, {'at': '2023-01-01T12:30:00', 'run_id': str(run_id)})
+        self.assertEqual(schedule.at, datetime(2023, 1, 1, 12, 30))
+        self.assertEqual(schedule.run_id, run_id)
+        self.assertEqual(schedule.to_dict(), {'at': '2023-01-01T12:30:00', 'run_id': str(run_id)})
+
+    def test_to_dict_round_trips(self):
+        contact = slots.from_json(Contact, CONTACT)
+        self.assertEqual(contact.to_dict(), CONTACT)
+        self.assertEqual(slots.from_json(Contact, contact.to_dict()), contact)
+        self.assertEqual(contact.to_model(), Contact.from_openapi_data_oapg(CONTACT))
+        built = slots.slots_class(Contact)(account='acc_1', email='ada@example.com')
+        self.assertEqual(built.to_dict(), {'account': 'acc_1', 'email': 'ada@example.com'})
+
+    def test_types_and_required_properties_are_checked(self):
+        with self.assertRaises(exceptions.ApiTypeError):
+            slots.from_json(Contact, {'account': 'acc_1'})
+        with self.assertRaises(exceptions.ApiTypeError):
+            slots.from_json(Contact, dict(CONTACT, email=1))
+        with self.assertRaises(exceptions.ApiTypeError):
+            slots.from_json(Contact, dict(CONTACT, location={'country': 'GB'}))
+        with self.assertRaises(exceptions.ApiValueError):
+            slots.from_json(Schedule, {'at': 'yesterday'})
+
+    def test_slots_response_format(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        client = api_client.ApiClient(configuration=config)
+        self.addCleanup(client.close)
+        api = get.ApiForget(api_client=client)
+        response = self.response(self.json_bytes(CONTACT))
+        with patch.object(urllib3.PoolManager, 'request', return_value=response):
+            api_response = api.get(path_params={'contact_id': 'con_1'}, response_format='slots')
+        self.assertIsInstance(api_response, api_client.ApiResponseWithoutSchema)
+        self.assertIs(type(api_response.body), slots.slots_class(Contact))
+        self.assertEqual(api_response.body.to_dict(), CONTACT)
+
+        server = FakeListServer(contacts(5))
+        with patch.object(urllib3.PoolManager, 'request', side_effect=server):
+            for stream in (False, True):
+                items = list(pagination.iter_contacts(
+                    client, page_size=2, stream=stream, response_format='slots'))
+                self.assertEqual([item.to_dict() for item in items], contacts(5))
+                self.assertIs(type(items[0]), slots.slots_class(Contact))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import io
+import json
+import unittest
+
+import urllib3
+
+from versify import exceptions
+from versify.model.event import Event
+from versify.streaming import JsonArrayStream, StreamingList
+
+
+def chunked(data: bytes, size: int):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+class TestJsonArrayStream(unittest.TestCase):
+    document = {
+        'count': 12345,
+        'data': [
+            {'_id': 'evt_{}'.format(i), 'name': 'café ☕', 'n': [i, 1.5, None, True]}
+            for i in range(5)],
+        'has_more': True,
+        'object': 'list',
+    }
+
+    def test_items_and_envelope_survive_any_chunking(self):
+        data = json.dumps(self.document, ensure_ascii=False, indent=1).encode('utf-8')
+        for size in (1, 2, 7, 64, len(data)):
+            stream = JsonArrayStream(chunked(data, size))
+            self.assertEqual(list(stream), self.document['data'], size)
+            self.assertEqual(stream.envelope, {'count': 12345, 'has_more': True, 'object': 'list'})
+
+    def test_items_are_yielded_before_the_document_is_read(self):
+        data = json.dumps(self.document).encode('utf-8')
+        chunks = chunked(data, 16)
+        stream = iter(JsonArrayStream(chunks))
+        self.assertEqual(next(stream)['_id'], 'evt_0')
+        self.assertGreater(len(list(chunks)), 0)
+
+    def test_empty_and_missing_arrays(self):
+        self.assertEqual(list(JsonArrayStream([b'{"data": [], "count": 0}'])), [])
+        self.assertEqual(list(JsonArrayStream([b'{}'])), [])
+        stream = JsonArrayStream([b'{"data": null}'])
+        self.assertEqual(list(stream), [])
+        self.assertEqual(stream.envelope, {'data': None})
+
+    def test_malformed_document(self):
+        with self.assertRaises(exceptions.ApiValueError):
+            list(JsonArrayStream([b'{"data": [{"a": 1}', b' {"b": 2}]}']))
+        with self.assertRaises(exceptions.ApiValueError):
+            list(JsonArrayStream([b'{"data": [{"a": 1']))
+
+
+class TestStreamingList(unittest.TestCase):
+    payload = {
+        'count': 2,
+        'data': [{'_id': 'evt_1', 'account': 'acc_1', 'detail_type': 'contact.created'},
+                 {'_id': 'evt_2', 'account': 'acc_1', 'detail_type': 'contact.updated'}],
+        'has_more': False,
+    }
+
+    def response(self, released):
+        body = io.BytesIO(json.dumps(self.payload).encode() + b'\n')
+        response = urllib3.HTTPResponse(body, status=200, preload_content=False)
+        response.release_conn = lambda: released.append('released')
+        close = response.close
+
+        def closed():
+            if not response.closed:
+                released.append('closed')
+            close()
+
+        response.close = closed
+        return response
+
+    def test_items_are_validated_and_connection_released(self):
+        released = []
+        response = self.response(released)
+        items = StreamingList(response, model=Event, chunk_size=8)
+        events = list(items)
+        self.assertEqual([event['_id'] for event in events], ['evt_1', 'evt_2'])
+        self.assertIsInstance(events[0], Event)
+        self.assertEqual(items.count, 2)
+        self.assertFalse(items.has_more)
+        self.assertEqual(released, ['released'])
+        # the body was read to its end
+        self.assertEqual(response.read(), b'')
+
+    def test_connection_is_closed_when_iteration_stops_early(self):
+        released = []
+        iterator = iter(StreamingList(self.response(released), model=Event, chunk_size=8))
+        next(iterator)
+        iterator.close()
+        self.assertEqual(released, ['closed', 'released'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import unittest
+from unittest.mock import patch
+
+import urllib3
+
+from versify import api_client, configuration, exceptions
+from versify.model.contact import Contact
+from versify.model.event import Event
+from versify.model.mint import Mint
+from versify.paths.v2_contacts_contact_id import get
+
+from .test_paths import ApiTestMixin
+
+CONTACT = {
+    '_id': 'con_1',
+    'account': 'acc_1',
+    'email': 'ada@example.com',
+    'status': 'active',
+    'tags': ['vip'],
+    'metadata': {'score': 10, 'ratio': 0.5, 'flag': True, 'empty': None},
+    'location': {'country': 'GB', 'region': 'London', 'city': 'London'},
+    'created': 1670000000,
+}
+MINT = {'_id': 'mnt_1', 'account': 'acc_1', 'asset': 'ast_1', 'quantity': 2, 'status': 'complete'}
+EVENT = {
+    '_id': 'evt_1', 'account': 'acc_1', 'detail_type': 'contact.created',
+    'detail': {'contact': 'con_1'},
+}
+
+
+class TestTrustedDeserialization(ApiTestMixin, unittest.TestCase):
+
+    def test_trusted_instances_match_validated_instances(self):
+        for model, payload in ((Contact, CONTACT), (Mint, MINT), (Event, EVENT)):
+            with self.subTest(model=model.__name__):
+                validated = model.from_openapi_data_oapg(payload)
+                trusted = model.from_trusted_data_oapg(payload)
+                self.assertIs(type(trusted), type(validated))
+                self.assertEqual(trusted, validated)
+                for key in payload:
+                    self.assertIs(type(trusted[key]), type(validated[key]))
+
+    def test_trusted_mode_skips_keyword_validation(self):
+        payload = dict(CONTACT, status='deleted')
+        with self.assertRaises(exceptions.ApiValueError):
+            Contact.from_openapi_data_oapg(payload)
+        self.assertEqual(Contact.from_trusted_data_oapg(payload)['status'], 'deleted')
+
+    def test_trusted_mode_falls_back_to_validation_on_type_mismatch(self):
+        with self.assertRaises(exceptions.ApiTypeError):
+            Contact.from_trusted_data_oapg(dict(CONTACT, email=5))
+
+    def test_validate_responses_switch(self):
+        config = configuration.Configuration()
+        config.access_token = 'token'
+        client = api_client.ApiClient(configuration=config)
+        api = get.ApiForget(api_client=client)
+        body = self.json_bytes(dict(CONTACT, status='deleted'))
+        with patch.object(urllib3.PoolManager, 'request',
+                          side_effect=lambda *args, **kwargs: self.response(body)):
+            with self.assertRaises(exceptions.ApiValueError):
+                api.get(path_params={'contact_id': 'con_1'})
+            response = api.get(path_params={'contact_id': 'con_1'}, validate_responses=False)
+            self.assertIsInstance(response.body, Contact)
+            self.assertEqual(response.body['status'], 'deleted')
+
+            config.validate_responses = False
+            response = api.get(path_params={'contact_id': 'con_1'})
+            self.assertEqual(response.body['status'], 'deleted')
+            with self.assertRaises(exceptions.ApiValueError):
+                api.get(path_params={'contact_id': 'con_1'}, validate_responses=True)
+        client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,7 @@ __version__ = "1.0.0"
 
 # import ApiClient
 from versify.api_client import ApiClient
+from versify.api_client import AsyncApiClient
 
 # import Configuration
 from versify.configuration import Configuration
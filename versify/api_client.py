@@ -8,17 +8,21 @@
     Generated by: https://openapi-generator.tech
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from decimal import Decimal
 import enum
 import email
 import json
 import os
 import io
+import asyncio
 import atexit
-from multiprocessing.pool import ThreadPool
+import collections
+import concurrent.futures
+import functools
 import re
 import tempfile
+import threading
 import typing
 import typing_extensions
 import urllib3
@@ -29,8 +33,20 @@ from urllib3.fields import RequestField as RequestFieldBase
 import frozendict
 
 from versify import rest
+from versify import rest_async
+from versify import slots
+from versify.hedging import HedgingPolicy
+from versify.ratelimit import RateLimiter
+from versify.retry import RetryPolicy, sleep_async
+from versify.singleflight import SingleFlight
+from versify.circuit import CircuitBreaker
+from versify.concurrency import AdaptiveConcurrency
+from versify.deadline import Deadline, time_left
+from versify.cache import (
+    ACCOUNT_HEADER, NON_ID_SEGMENTS, CachedResponse, ResponseCache, fields_key)
 from versify.configuration import Configuration
-from versify.exceptions import ApiTypeError, ApiValueError
+from versify.exceptions import ApiException, ApiTypeError, ApiValueError
+from versify.lazy import LazyModel
 from versify.schemas import (
     NoneClass,
     BoolClass,
@@ -766,6 +782,30 @@ class HeaderParameter(ParameterBase, StyleSimpleSerializer):
                 return self.__to_headers(((self.name, value),))
             raise NotImplementedError('Serialization of {} has not yet been implemented'.format(content_type))
 
+    def deserialize(
+        self,
+        in_data: str,
+        configuration: typing.Optional[Configuration] = None,
+    ) -> Schema:
+        """Builds the schema instance of a response header value"""
+        if self.schema:
+            try:
+                return self.schema.from_openapi_data_oapg(in_data, _configuration=configuration)
+            except ApiTypeError as error:
+                # simple style numbers and booleans are sent unquoted
+                try:
+                    value = json.loads(in_data)
+                except ValueError:
+                    raise error from None
+                return self.schema.from_openapi_data_oapg(value, _configuration=configuration)
+        # self.content will be length one
+        for content_type, schema in self.content.items():
+            if self._content_type_is_json(content_type):
+                return schema.from_openapi_data_oapg(
+                    json.loads(in_data), _configuration=configuration)
+            raise NotImplementedError(
+                'Deserialization of {} has not yet been implemented'.format(content_type))
+
 
 class Encoding:
     def __init__(
@@ -816,6 +856,16 @@ class ApiResponse:
         self.body = body
         self.headers = headers
 
+    @property
+    def etag(self) -> typing.Optional[str]:
+        """The ETag header of the response, sent back in If-None-Match to revalidate it"""
+        return self.response.headers.get('ETag')
+
+    @property
+    def last_modified(self) -> typing.Optional[str]:
+        """The Last-Modified header of the response, sent in If-Modified-Since to revalidate it"""
+        return self.response.headers.get('Last-Modified')
+
 
 @dataclass
 class ApiResponseWithoutDeserialization(ApiResponse):
@@ -824,6 +874,83 @@ class ApiResponseWithoutDeserialization(ApiResponse):
     headers: typing.Union[Unset, typing.List[HeaderParameter]] = unset
 
 
+RESPONSE_FORMATS = ('schema', 'lazy', 'python', 'slots', 'bytes')
+# the formats whose bodies can be changed by the caller
+MUTABLE_RESPONSE_FORMATS = frozenset(('python', 'slots'))
+
+
+def project_json(
+    value: typing.Any,
+    fields: typing.Optional[typing.Union[typing.Collection[str], typing.Dict[str, typing.Any]]],
+) -> typing.Any:
+    """Keeps the object properties of decoded json named in fields, see build_projection"""
+    if fields is None:
+        return value
+    if isinstance(value, list):
+        return [project_json(item, fields) for item in value]
+    if isinstance(value, dict):
+        if not isinstance(fields, dict):
+            fields = dict.fromkeys(fields)
+        return {name: project_json(value[name], fields[name]) for name in fields if name in value}
+    return value
+
+
+def path_template(resource_path: str) -> str:
+    """
+    The path of an operation with its id segment templated,
+    e.g. /v2/contacts/{id} for /v2/contacts/con_1
+    """
+    segments = resource_path.partition('?')[0].split('/')
+    # ['', 'v2', <resource>, <id>, ...]
+    if len(segments) > 3 and segments[1] == 'v2' and segments[3] not in NON_ID_SEGMENTS:
+        segments[3] = '{id}'
+    return '/'.join(segments)
+
+
+@dataclass
+class ApiResponseWithoutSchema(ApiResponse):
+    """
+    The response of an operation called with response_format='python', 'slots' or 'bytes'
+    body holds the json.loads output of a json response (dict, list, str, int, float, bool, None),
+    that output converted into the slots.SlotsModel classes of the response schema,
+    or the undecoded response bytes, so no schema instances are built
+    """
+    response: urllib3.HTTPResponse
+    body: typing.Union[Unset, bytes, typing.Any] = unset
+    headers: typing.Union[Unset, typing.Dict[str, typing.Any]] = unset
+
+    @classmethod
+    def from_response(
+        cls,
+        response: urllib3.HTTPResponse,
+        response_format: str,
+        schema: typing.Optional[typing.Type[Schema]] = None,
+        fields: typing.Optional[typing.Collection[str]] = None,
+    ) -> 'ApiResponseWithoutSchema':
+        """
+        :param schema: the schema of the json body, used by response_format='slots' and fields
+        :param fields: the properties kept in the decoded json, see OpenApiResponse.projection
+        """
+        data = response.data
+        if response.supports_chunked_reads():
+            response.release_conn()
+        if not data:
+            return cls(response=response)
+        content_type = response.getheader('content-type')
+        if (
+            response_format != 'bytes'
+            and content_type
+            and JSONDetector._content_type_is_json(content_type)
+        ):
+            body = json.loads(data)
+            if fields is not None and schema is not None:
+                body = project_json(body, OpenApiResponse.projection(schema, body, fields))
+            if response_format == 'slots' and schema is not None:
+                body = slots.from_json(schema, body)
+            return cls(response=response, body=body)
+        return cls(response=response, body=data)
+
+
 class OpenApiResponse(JSONDetector):
     __filename_content_disposition_pattern = re.compile('filename="(.+?)"')
 
@@ -914,15 +1041,61 @@ class OpenApiResponse(JSONDetector):
             for part in msg.get_payload()
         }
 
-    def deserialize(self, response: urllib3.HTTPResponse, configuration: Configuration) -> ApiResponse:
+    @staticmethod
+    def projection(
+        body_schema: typing.Type[Schema],
+        body_data: typing.Any,
+        fields: typing.Optional[typing.Collection[str]],
+    ) -> typing.Optional[typing.Union[typing.Collection[str], typing.Dict[str, typing.Any]]]:
+        """
+        The CompiledSchema.build_projection fields of a response body
+        The fields of list and search responses apply to their data items, other members are kept.
+        """
+        if fields is None:
+            return None
+        properties = getattr(getattr(body_schema, 'MetaOapg', None), 'properties', None)
+        property_names = getattr(properties, '__annotations__', {})
+        if (
+            isinstance(body_data, dict)
+            and 'data' in property_names
+            and 'has_more' in property_names
+        ):
+            projection = dict.fromkeys(body_data)
+            projection['data'] = tuple(fields)
+            return projection
+        return tuple(fields)
+
+    def deserialize(
+        self,
+        response: urllib3.HTTPResponse,
+        configuration: Configuration,
+        validate: typing.Optional[bool] = None,
+        lazy: bool = False,
+        fields: typing.Optional[typing.Collection[str]] = None,
+    ) -> ApiResponse:
+        """
+        :param validate: whether json bodies are validated against their schema,
+            defaults to configuration.validate_responses
+        :param lazy: if True json object bodies are returned as a lazy.LazyModel whose
+            properties are validated and built on first access
+        :param fields: the properties of the body, or of the data items of a list or search
+            response, that are built; other properties are dropped
+        """
         content_type = response.getheader('content-type')
         deserialized_body = unset
         streamed = response.supports_chunked_reads()
 
         deserialized_headers = unset
         if self.headers is not None:
-            # TODO add header deserialiation here
-            pass
+            deserialized_headers = {}
+            for header in self.headers:
+                header_value = response.headers.get(header.name)
+                if header_value is None:
+                    if header.required:
+                        raise ApiValueError(
+                            'Missing required response header {!r}'.format(header.name))
+                    continue
+                deserialized_headers[header.name] = header.deserialize(header_value, configuration)
 
         if self.content is not None:
             if content_type not in self.content:
@@ -941,6 +1114,13 @@ class OpenApiResponse(JSONDetector):
 
             if self._content_type_is_json(content_type):
                 body_data = self.__deserialize_json(response)
+                if lazy:
+                    deserialized_body = LazyModel.from_server_data(
+                        body_schema, body_data, _configuration=configuration, validate=validate)
+                else:
+                    deserialized_body = body_schema.from_server_data_oapg(
+                        body_data, _configuration=configuration, validate=validate,
+                        fields=self.projection(body_schema, body_data, fields))
             elif content_type == 'application/octet-stream':
                 body_data = self.__deserialize_application_octet_stream(response)
             elif content_type.startswith('multipart/form-data'):
@@ -948,8 +1128,9 @@ class OpenApiResponse(JSONDetector):
                 content_type = 'multipart/form-data'
             else:
                 raise NotImplementedError('Deserialization of {} has not yet been implemented'.format(content_type))
-            deserialized_body = body_schema.from_openapi_data_oapg(
-                body_data, _configuration=configuration)
+            if deserialized_body is unset:
+                deserialized_body = body_schema.from_openapi_data_oapg(
+                    body_data, _configuration=configuration)
         elif streamed:
             response.release_conn()
 
@@ -960,6 +1141,116 @@ class OpenApiResponse(JSONDetector):
         )
 
 
+class _Attempts:
+    """
+    The bookkeeping of the attempts of one request, shared by ApiClient and AsyncApiClient
+
+    Applies the retry_policy, rate_limiter, circuit_breaker, concurrency_limiter and deadline
+    of a client to each attempt, so the request loops only send, await and sleep.
+    """
+
+    def __init__(
+        self,
+        api_client: 'ApiClient',
+        resource_path: str,
+        method: str,
+        url: str,
+        headers: HTTPHeaderDict,
+        stream: bool,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]],
+    ):
+        self.policy = api_client.retry_policy
+        self.limiter = api_client.rate_limiter
+        self.breaker = api_client.circuit_breaker
+        self.hedging = api_client.hedging_policy
+        self.concurrency = api_client.concurrency_limiter
+        self.deadline = timeout if isinstance(timeout, Deadline) else None
+        self.method = method
+        self._timeout = timeout
+        self.enabled = any(setting is not None for setting in (
+            self.policy, self.limiter, self.breaker, self.hedging, self.concurrency,
+            self.deadline))
+        if not self.enabled:
+            return
+        self.path = path_template(resource_path)
+        self.operation = '{} {}'.format(method, self.path)
+        self.hedged = (
+            self.hedging is not None and not stream and self.hedging.applies(method, self.path))
+        self.account = headers.get(ACCOUNT_HEADER)
+        self.circuit = (urlparse(url).netloc, self.path)
+        self.retry = 0
+        self._started = None
+        # whether the circuit allowed an attempt whose outcome was not recorded yet
+        self._allowed = False
+        if self.policy is not None:
+            self.policy.started(self.operation)
+
+    def admit(self) -> float:
+        """Checks the circuit and takes a rate limit token, returns the seconds to wait first"""
+        if self.deadline is not None:
+            self.deadline.check()
+        if self.breaker is not None:
+            self.breaker.allow(self.circuit)
+            self._allowed = True
+        wait = 0.0
+        if self.limiter is not None:
+            wait = self.limiter.acquire(self.account, self.path)
+            if wait > 0 and self.deadline is not None and wait >= self.deadline.remaining():
+                self.release()
+                raise self.deadline.exceeded()
+        return wait
+
+    def release(self):
+        """Gives an allowed attempt that was not recorded back to the circuit breaker"""
+        if self._allowed:
+            self._allowed = False
+            self.breaker.release(self.circuit)
+
+    def timeout(self) -> typing.Optional[typing.Union[int, typing.Tuple]]:
+        """The timeout of the next attempt, what is left of the deadline when there is one"""
+        if self.deadline is not None:
+            return self.deadline.timeout()
+        return self._timeout
+
+    def sending(self):
+        if self.concurrency is not None:
+            self._started = self.concurrency.clock()
+
+    def failed(self, error: Exception) -> typing.Optional[float]:
+        """Records an attempt that raised, returns the seconds to wait before the retry or None"""
+        if self.concurrency is not None:
+            self.concurrency.record(self._started, None, self.operation)
+        if self.breaker is not None:
+            self._allowed = False
+            self.breaker.record(self.circuit, True)
+        if self.policy is None:
+            return None
+        return self._retry(self.policy.delay(
+            self.operation, self.method, self.retry, error=error,
+            max_delay=time_left(self.deadline)))
+
+    def completed(self, response: urllib3.HTTPResponse) -> typing.Optional[float]:
+        """Records a response, returns the seconds to wait before the retry or None"""
+        if self.concurrency is not None:
+            self.concurrency.record(self._started, response.status, self.operation)
+        if self.breaker is not None:
+            self._allowed = False
+            self.breaker.record(self.circuit, self.breaker.is_failure(response=response))
+        if self.limiter is not None:
+            self.limiter.record(
+                self.account, self.path, response.status, response.headers.get('Retry-After'))
+        if self.policy is None:
+            return None
+        return self._retry(self.policy.delay(
+            self.operation, self.method, self.retry, response=response,
+            max_delay=time_left(self.deadline)))
+
+    def _retry(self, delay: typing.Optional[float]) -> typing.Optional[float]:
+        if delay is not None:
+            self.retry += 1
+        return delay
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -978,11 +1269,27 @@ class ApiClient:
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
-    :param pool_threads: The number of threads to use for async requests
-        to the API. More threads means more concurrent API requests.
+    :param pool_threads: The number of threads used by submit/map to run
+        requests concurrently. Defaults to configuration.connection_pool_maxsize
+        so every worker can hold its own pooled connection.
+    :param response_cache: a cache.ResponseCache that call_operation reads GET
+        responses from and invalidates on writes, e.g. cache.LRUResponseCache()
+    :param single_flight: if True identical GET operations made while one is in
+        flight wait for it and share its ApiResponse, see singleflight.SingleFlight
+    :param retry_policy: a retry.RetryPolicy deciding which failed requests are sent
+        again and when; configuration.retries only covers urllib3 connection retries
+    :param rate_limiter: a ratelimit.RateLimiter pacing requests per Versify-Account
+        and path template, and slowing down on 429 responses
+    :param circuit_breaker: a circuit.CircuitBreaker raising CircuitOpenError instead of
+        sending requests to a host and path template that keeps failing
+    :param hedging_policy: a hedging.HedgingPolicy sending a second request when a GET
+        takes longer than its usual latency
+    :param concurrency_limiter: a concurrency.AdaptiveConcurrency fed with the latency and
+        status of every request, whose limit caps the calls map keeps in flight
     """
 
-    _pool = None
+    _executor = None
+    rest_client_cls = rest.RESTClientObject
 
     def __init__(
         self,
@@ -990,14 +1297,31 @@ class ApiClient:
         header_name: typing.Optional[str] = None,
         header_value: typing.Optional[str] = None,
         cookie: typing.Optional[str] = None,
-        pool_threads: int = 1
+        pool_threads: typing.Optional[int] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        single_flight: bool = False,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        concurrency_limiter: typing.Optional[AdaptiveConcurrency] = None,
     ):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
+        self.response_cache = response_cache
+        self.single_flight = SingleFlight() if single_flight else None
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedging_policy = hedging_policy
+        self.concurrency_limiter = concurrency_limiter
+        if pool_threads is None:
+            pool_threads = configuration.connection_pool_maxsize or 4
         self.pool_threads = pool_threads
+        self._executor_lock = threading.Lock()
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self.rest_client_cls(configuration)
         self.default_headers = HTTPHeaderDict()
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -1012,22 +1336,113 @@ class ApiClient:
         self.close()
 
     def close(self):
-        if self._pool:
-            self._pool.close()
-            self._pool.join()
-            self._pool = None
+        if self.hedging_policy is not None:
+            self.hedging_policy.close()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
             if hasattr(atexit, 'unregister'):
                 atexit.unregister(self.close)
 
     @property
-    def pool(self):
-        """Create thread pool on first request
-         avoids instantiating unused threadpool for blocking clients.
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Create the thread pool executor on first use
+         avoids starting worker threads for blocking clients.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                atexit.register(self.close)
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.pool_threads,
+                    thread_name_prefix='versify-api-client',
+                )
+            return self._executor
+
+    def submit(self, op: typing.Callable[..., ApiResponse], **kwargs) -> concurrent.futures.Future:
+        """Runs an operation on the client's executor.
+
+        Example:
+            api = v2_contacts_contact_id.get.ApiForget(api_client)
+            future = api_client.submit(api.get, path_params={'contact_id': contact_id})
+            api_response = future.result()
+
+        :param op: a generated operation method bound to an Api using this client
+        :param kwargs: the keyword arguments the operation is called with
+        :return: a concurrent.futures.Future resolving to the operation's ApiResponse
         """
-        if self._pool is None:
-            atexit.register(self.close)
-            self._pool = ThreadPool(self.pool_threads)
-        return self._pool
+        return self.executor.submit(op, **kwargs)
+
+    def concurrency_window(self, window: int) -> int:
+        """window capped by the current limit of concurrency_limiter, when it is set"""
+        if self.concurrency_limiter is None:
+            return window
+        return min(window, self.concurrency_limiter.limit)
+
+    def map(
+        self,
+        op: typing.Callable[..., ApiResponse],
+        kwargs_iterable: typing.Iterable[typing.Dict[str, typing.Any]],
+        max_workers: typing.Optional[int] = None,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> typing.Iterator[typing.Union[ApiResponse, Exception]]:
+        """Calls an operation once per kwargs dict, running the calls concurrently.
+
+        kwargs_iterable is consumed lazily and at most max_workers calls are in
+        flight at a time, so arbitrarily long batches use bounded memory.
+
+        :param op: a generated operation method bound to an Api using this client
+        :param kwargs_iterable: the keyword arguments for each call
+        :param max_workers: the maximum number of concurrent calls, defaults to
+            and is effectively capped by pool_threads; with a concurrency_limiter
+            its current limit caps them as well
+        :param ordered: if True results are yielded in the order of kwargs_iterable,
+            otherwise they are yielded as they complete
+        :param return_exceptions: if True exceptions raised by a call are yielded
+            in place of its result instead of being raised
+        :return: an iterator of ApiResponse (or Exception) instances
+        """
+        window = max_workers or self.pool_threads
+        if window < 1:
+            raise ApiValueError('max_workers must be greater than 0')
+        kwargs_iterator = iter(kwargs_iterable)
+        pending = collections.deque() if ordered else set()
+
+        def fill():
+            while len(pending) < self.concurrency_window(window):
+                try:
+                    kwargs = next(kwargs_iterator)
+                except StopIteration:
+                    return
+                future = self.submit(op, **kwargs)
+                if ordered:
+                    pending.append(future)
+                else:
+                    pending.add(future)
+
+        def outcome(future: concurrent.futures.Future):
+            if return_exceptions:
+                exception = future.exception()
+                if exception is not None:
+                    return exception
+            return future.result()
+
+        try:
+            fill()
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    done, _not_done = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    pending.difference_update(done)
+                for future in done:
+                    result = outcome(future)
+                    fill()
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
 
     @property
     def user_agent(self):
@@ -1041,23 +1456,20 @@ class ApiClient:
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
-    def __call_api(
+    def _prepare_request(
         self,
         resource_path: str,
         method: str,
         headers: typing.Optional[HTTPHeaderDict] = None,
         body: typing.Optional[typing.Union[str, bytes]] = None,
-        fields: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]] = None,
         auth_settings: typing.Optional[typing.List[str]] = None,
-        stream: bool = False,
-        timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
         host: typing.Optional[str] = None,
-    ) -> urllib3.HTTPResponse:
-
+    ) -> typing.Tuple[str, HTTPHeaderDict]:
+        """Builds the request url and headers shared by the sync and async transports."""
         # header parameters
         used_headers = HTTPHeaderDict(self.default_headers)
         if self.cookie:
-            headers['Cookie'] = self.cookie
+            used_headers['Cookie'] = self.cookie
 
         # auth setting
         self.update_params_for_auth(used_headers,
@@ -1073,18 +1485,62 @@ class ApiClient:
         else:
             # use server/host defined in path or operation instead
             url = host + resource_path
+        return url, used_headers
+
+    def __call_api(
+        self,
+        resource_path: str,
+        method: str,
+        headers: typing.Optional[HTTPHeaderDict] = None,
+        body: typing.Optional[typing.Union[str, bytes]] = None,
+        fields: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]] = None,
+        auth_settings: typing.Optional[typing.List[str]] = None,
+        stream: bool = False,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+        host: typing.Optional[str] = None,
+    ) -> urllib3.HTTPResponse:
+        url, used_headers = self._prepare_request(
+            resource_path, method, headers=headers, body=body, auth_settings=auth_settings,
+            host=host)
 
         # perform request and return response
-        response = self.request(
+        request = functools.partial(
+            self.request,
             method,
             url,
             headers=used_headers,
             fields=fields,
             body=body,
             stream=stream,
-            timeout=timeout,
         )
-        return response
+        attempts = _Attempts(self, resource_path, method, url, used_headers, stream, timeout)
+        if not attempts.enabled:
+            return request(timeout=timeout)
+        while True:
+            wait = attempts.admit()
+            try:
+                if wait > 0:
+                    attempts.limiter.sleep(wait)
+                send = functools.partial(request, timeout=attempts.timeout())
+                if attempts.hedged:
+                    send = functools.partial(attempts.hedging.send, attempts.operation, send)
+                attempts.sending()
+                try:
+                    response = send()
+                except Exception as error:
+                    delay = attempts.failed(error)
+                    if delay is None:
+                        raise
+                else:
+                    delay = attempts.completed(response)
+                    if delay is None:
+                        return response
+                    if stream:
+                        response.drain_conn()
+            finally:
+                # e.g. the deadline passed or the request was cancelled before it was recorded
+                attempts.release()
+            attempts.policy.sleep(delay)
 
     def call_api(
         self,
@@ -1096,7 +1552,7 @@ class ApiClient:
         auth_settings: typing.Optional[typing.List[str]] = None,
         async_req: typing.Optional[bool] = None,
         stream: bool = False,
-        timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
         host: typing.Optional[str] = None,
     ) -> urllib3.HTTPResponse:
         """Makes the HTTP request (synchronous) and returns deserialized data.
@@ -1111,8 +1567,8 @@ class ApiClient:
         :param fields: Request post form parameters,
             for `application/x-www-form-urlencoded`, `multipart/form-data`.
         :param auth_settings: Auth Settings names for the request.
-        :param async_req: execute request asynchronously
-        :type async_req: bool, optional TODO remove, unused
+        :param async_req: execute request on the client's executor
+        :type async_req: bool, optional
         :param stream: if True, the urllib3.HTTPResponse object will
                                  be returned without reading/decoding response
                                  data. Also when True, if the openapi spec describes a file download,
@@ -1123,12 +1579,14 @@ class ApiClient:
         :param timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
+                                 (connection, read) timeouts, or a
+                                 deadline.Deadline giving each attempt the
+                                 time left.
         :param host: api endpoint host
         :return:
             If async_req parameter is True,
             the request will be called asynchronously.
-            The method will return the request thread.
+            The method will return a concurrent.futures.Future.
             If parameter async_req is False or missing,
             then the method will return the response directly.
         """
@@ -1146,22 +1604,322 @@ class ApiClient:
                 host,
             )
 
-        return self.pool.apply_async(
+        return self.executor.submit(
             self.__call_api,
-            (
+            resource_path,
+            method,
+            headers,
+            body,
+            fields,
+            auth_settings,
+            stream,
+            timeout,
+            host,
+        )
+
+    def call_operation(
+        self,
+        resource_path: str,
+        method: str,
+        status_code_to_response: typing.Dict[str, 'OpenApiResponse'],
+        headers: typing.Optional[HTTPHeaderDict] = None,
+        body: typing.Optional[typing.Union[str, bytes]] = None,
+        fields: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]] = None,
+        auth_settings: typing.Optional[typing.List[str]] = None,
+        stream: bool = False,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+        host: typing.Optional[str] = None,
+        skip_deserialization: bool = False,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        projection: typing.Optional[typing.Collection[str]] = None,
+    ) -> ApiResponse:
+        """Makes the HTTP request of a generated operation and deserializes the response.
+
+        :param status_code_to_response: the operation's map of status code to OpenApiResponse
+        :param skip_deserialization: If true then api_response.response will be set but
+            api_response.body and api_response.headers will not be deserialized into schema
+            class instances
+        :param validate_responses: whether the response body is validated against its schema,
+            defaults to configuration.validate_responses
+        :param response_format: 'schema' deserializes the body into schema class instances,
+            'lazy' into a lazy.LazyModel that builds its properties on first access,
+            'python' returns the json.loads output, 'slots' that output converted by versify.slots
+            and 'bytes' the undecoded body in an ApiResponseWithoutSchema
+        :param projection: the properties of the body, or of the data items of list and search
+            responses, that are built; sent in configuration.fields_query_param when it is set
+        :return: the ApiResponse for the status code of the response
+        :raises ApiException: when the response status is not 2xx
+        """
+        resource_path = self._prepare_operation(resource_path, response_format, projection)
+        send = functools.partial(
+            self._send_operation, resource_path, method, status_code_to_response,
+            headers=headers, body=body, fields=fields, auth_settings=auth_settings, stream=stream,
+            timeout=timeout, host=host,
+            skip_deserialization=skip_deserialization, validate_responses=validate_responses,
+            response_format=response_format, projection=projection)
+        flight_key = self._single_flight_key(
+            resource_path, method, headers, auth_settings, stream, host, skip_deserialization,
+            validate_responses, response_format, projection)
+        if flight_key is None:
+            return send()
+        return self.single_flight.do(flight_key, send)
+
+    def _send_operation(
+        self,
+        resource_path: str,
+        method: str,
+        status_code_to_response: typing.Dict[str, 'OpenApiResponse'],
+        headers: typing.Optional[HTTPHeaderDict] = None,
+        body: typing.Optional[typing.Union[str, bytes]] = None,
+        fields: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]] = None,
+        auth_settings: typing.Optional[typing.List[str]] = None,
+        stream: bool = False,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+        host: typing.Optional[str] = None,
+        skip_deserialization: bool = False,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        projection: typing.Optional[typing.Collection[str]] = None,
+    ) -> ApiResponse:
+        """Sends a prepared operation request, through response_cache when it is set"""
+        cache_key, entry, headers = self._cached_response(
+            resource_path, method, headers, stream, host)
+        if entry is None or entry.stale:
+            response = self.call_api(
                 resource_path,
                 method,
-                headers,
-                body,
-                json,
-                fields,
-                auth_settings,
-                stream,
-                timeout,
-                host,
+                headers=headers,
+                body=body,
+                fields=fields,
+                auth_settings=auth_settings,
+                stream=stream,
+                timeout=timeout,
+                host=host,
             )
+            entry = self._cache_response(resource_path, method, cache_key, entry, response)
+            if entry is None:
+                return self.deserialize_operation_response(
+                    response, status_code_to_response, skip_deserialization, validate_responses,
+                    response_format, projection)
+        return self._deserialize_cached_response(
+            entry, status_code_to_response, skip_deserialization, validate_responses,
+            response_format, projection)
+
+    def _prepare_operation(
+        self,
+        resource_path: str,
+        response_format: str,
+        projection: typing.Optional[typing.Collection[str]],
+    ) -> str:
+        """Checks the response options of an operation and returns the resource path to request"""
+        if response_format not in RESPONSE_FORMATS:
+            raise ApiValueError(
+                'Invalid response_format {!r}, must be one of {}'.format(
+                    response_format, RESPONSE_FORMATS))
+        if projection is None:
+            return resource_path
+        if isinstance(projection, str):
+            raise ApiValueError('fields must be a collection of property names, not a str')
+        if response_format == 'slots':
+            raise ApiValueError("fields cannot be combined with response_format='slots'")
+        fields_query_param = self.configuration.fields_query_param
+        if fields_query_param:
+            resource_path += '{}{}={}'.format(
+                '&' if '?' in resource_path else '?', fields_query_param,
+                quote(','.join(projection), safe=','))
+        return resource_path
+
+    def _single_flight_key(
+        self,
+        resource_path: str,
+        method: str,
+        headers: typing.Optional[HTTPHeaderDict],
+        auth_settings: typing.Optional[typing.List[str]],
+        stream: bool,
+        host: typing.Optional[str],
+        skip_deserialization: bool,
+        validate_responses: typing.Optional[bool],
+        response_format: str,
+        projection: typing.Optional[typing.Collection[str]],
+    ) -> typing.Optional[typing.Hashable]:
+        """The key identical GET requests are coalesced by, None if the request is sent alone"""
+        if self.single_flight is None or method != 'GET' or stream:
+            return None
+        if response_format in MUTABLE_RESPONSE_FORMATS:
+            # every caller would get the same body, so changes made by one would show for all
+            return None
+        url, used_headers = self._prepare_request(
+            resource_path, method, headers=headers, auth_settings=auth_settings, host=host)
+        return (
+            url,
+            tuple(sorted((name.lower(), value) for name, value in used_headers.items())),
+            skip_deserialization,
+            validate_responses,
+            response_format,
+            fields_key(projection),
         )
 
+    def is_cached(
+        self,
+        resource_path: str,
+        headers: typing.Optional[HTTPHeaderDict] = None,
+        host: typing.Optional[str] = None,
+        response_format: str = 'schema',
+        projection: typing.Optional[typing.Collection[str]] = None,
+    ) -> bool:
+        """Whether a GET of resource_path would be served from response_cache without a request"""
+        if self.response_cache is None:
+            return False
+        resource_path = self._prepare_operation(resource_path, response_format, projection)
+        key = self.response_cache.key(
+            resource_path, self.__account(headers), host or self.configuration.host)
+        return key is not None and key in self.response_cache
+
+    def __account(self, headers: typing.Optional[HTTPHeaderDict]) -> typing.Optional[str]:
+        account = headers.get(ACCOUNT_HEADER) if headers else None
+        if account is None:
+            account = self.default_headers.get(ACCOUNT_HEADER)
+        return account
+
+    def _cached_response(
+        self,
+        resource_path: str,
+        method: str,
+        headers: typing.Optional[HTTPHeaderDict],
+        stream: bool,
+        host: typing.Optional[str],
+    ) -> typing.Tuple[
+        typing.Optional[typing.Hashable],
+        typing.Optional[CachedResponse],
+        typing.Optional[HTTPHeaderDict],
+    ]:
+        """
+        Returns the response_cache key of a request, its cached entry and the request headers
+
+        Writes invalidate the entries of their path before they are sent. A stale entry adds the
+        If-None-Match and If-Modified-Since headers that revalidate it to the request headers.
+        """
+        cache = self.response_cache
+        if cache is None:
+            return None, None, headers
+        if method != 'GET':
+            cache.invalidate(resource_path)
+            return None, None, headers
+        if stream:
+            return None, None, headers
+        key = cache.key(resource_path, self.__account(headers), host or self.configuration.host)
+        if key is None:
+            return None, None, headers
+        entry = cache.get(key)
+        if entry is not None and entry.stale:
+            headers = HTTPHeaderDict(headers or {})
+            headers.update(entry.conditional_headers())
+        return key, entry, headers
+
+    def _cache_response(
+        self,
+        resource_path: str,
+        method: str,
+        cache_key: typing.Optional[typing.Hashable],
+        entry: typing.Optional[CachedResponse],
+        response: urllib3.HTTPResponse,
+    ) -> typing.Optional[CachedResponse]:
+        """
+        Stores a 200 response in response_cache, or invalidates the path again after a write
+
+        :return: the entry the response is served from, the refreshed entry after a 304
+            revalidation, None when the response is not cached
+        """
+        cache = self.response_cache
+        if cache is None:
+            return None
+        if method != 'GET':
+            # drops entries stored by GETs that raced the write
+            cache.invalidate(resource_path)
+        elif entry is not None and response.status == 304:
+            return cache.revalidate(cache_key, entry, response)
+        elif cache_key is not None and response.status == 200:
+            return cache.put(cache_key, response)
+        return None
+
+    def _deserialize_cached_response(
+        self,
+        entry: CachedResponse,
+        status_code_to_response: typing.Dict[str, 'OpenApiResponse'],
+        skip_deserialization: bool,
+        validate_responses: typing.Optional[bool],
+        response_format: str,
+        projection: typing.Optional[typing.Collection[str]],
+    ) -> ApiResponse:
+        """
+        Deserializes a cached response
+
+        Schema instances are immutable so those built from an entry are kept on it and
+        returned again without decoding the body.
+        """
+        if skip_deserialization or response_format != 'schema':
+            return self.deserialize_operation_response(
+                entry.to_response(), status_code_to_response, skip_deserialization,
+                validate_responses, response_format, projection)
+        model_key = (validate_responses, fields_key(projection))
+        api_response = entry.models.get(model_key)
+        if api_response is None:
+            api_response = self.deserialize_operation_response(
+                entry.to_response(), status_code_to_response,
+                validate_responses=validate_responses, projection=projection)
+            entry.models[model_key] = api_response
+            return api_response
+        return replace(api_response, response=entry.to_response())
+
+    @staticmethod
+    def __json_schema(
+        response_for_status: typing.Optional['OpenApiResponse']
+    ) -> typing.Optional[typing.Type[Schema]]:
+        """The schema of the json content of an operation response, None if it has none"""
+        if response_for_status is None or not response_for_status.content:
+            return None
+        for content_type, media_type in response_for_status.content.items():
+            if JSONDetector._content_type_is_json(content_type):
+                return media_type.schema
+        return None
+
+    def deserialize_operation_response(
+        self,
+        response: urllib3.HTTPResponse,
+        status_code_to_response: typing.Dict[str, 'OpenApiResponse'],
+        skip_deserialization: bool = False,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        projection: typing.Optional[typing.Collection[str]] = None,
+    ) -> ApiResponse:
+        if not 200 <= response.status <= 299:
+            # error bodies are kept whole
+            projection = None
+        if skip_deserialization:
+            api_response = ApiResponseWithoutDeserialization(response=response)
+        elif response_format not in ('schema', 'lazy'):
+            schema = self.__json_schema(status_code_to_response.get(str(response.status)))
+            api_response = ApiResponseWithoutSchema.from_response(
+                response, response_format, schema, fields=projection)
+        else:
+            response_for_status = status_code_to_response.get(str(response.status))
+            if response_for_status:
+                api_response = response_for_status.deserialize(
+                    response, self.configuration, validate=validate_responses,
+                    lazy=response_format == 'lazy', fields=projection)
+            else:
+                api_response = ApiResponseWithoutDeserialization(response=response)
+
+        if not 200 <= response.status <= 299:
+            raise ApiException(
+                status=response.status,
+                reason=response.reason,
+                api_response=api_response
+            )
+
+        return api_response
+
     def request(
         self,
         method: str,
@@ -1258,6 +2016,251 @@ class ApiClient:
                 )
 
 
+class AsyncApiClient(ApiClient):
+    """ApiClient that performs requests on an asyncio event loop.
+
+    Generated operations invoked through an Api bound to this client return
+    awaitables, for example:
+
+        async with AsyncApiClient(configuration) as client:
+            api = v2_contacts.get.ApiForget(client)
+            api_response = await api.get(query_params={'page_size': 100})
+
+    Requests go through rest_async.AsyncRESTClientObject, so one event loop can
+    drive many in-flight requests over a keep-alive connection pool. Use it with
+    'async with', or await aclose() when it is no longer used. Bodies are read
+    before a response is returned, so operations reject stream=True.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    :param response_cache: a cache.ResponseCache, see ApiClient
+    :param single_flight: whether identical concurrent GET operations are coalesced, see ApiClient
+    :param retry_policy: a retry.RetryPolicy, see ApiClient; retries wait with asyncio.sleep
+    :param rate_limiter: a ratelimit.RateLimiter, see ApiClient; requests wait with asyncio.sleep
+    :param circuit_breaker: a circuit.CircuitBreaker, see ApiClient
+    :param hedging_policy: a hedging.HedgingPolicy, see ApiClient; the slower request is cancelled
+    :param concurrency_limiter: a concurrency.AdaptiveConcurrency, see ApiClient
+    """
+
+    rest_client_cls = rest_async.AsyncRESTClientObject
+
+    def __init__(
+        self,
+        configuration: typing.Optional[Configuration] = None,
+        header_name: typing.Optional[str] = None,
+        header_value: typing.Optional[str] = None,
+        cookie: typing.Optional[str] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        single_flight: bool = False,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        hedging_policy: typing.Optional[HedgingPolicy] = None,
+        concurrency_limiter: typing.Optional[AdaptiveConcurrency] = None,
+    ):
+        super().__init__(
+            configuration=configuration,
+            header_name=header_name,
+            header_value=header_value,
+            cookie=cookie,
+            response_cache=response_cache,
+            single_flight=single_flight,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging_policy=hedging_policy,
+            concurrency_limiter=concurrency_limiter,
+        )
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncApiClient")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """Closes the connections of the transport, then the executor like ApiClient.close"""
+        await self.rest_client.close()
+        self.close()
+
+    def submit(self, op: typing.Callable[..., ApiResponse], **kwargs) -> concurrent.futures.Future:
+        """Not supported, operations return coroutines that are awaited on the event loop"""
+        raise ApiTypeError('submit needs a blocking ApiClient, await the operation instead')
+
+    def map(
+        self,
+        op: typing.Callable[..., ApiResponse],
+        kwargs_iterable: typing.Iterable[typing.Dict[str, typing.Any]],
+        max_workers: typing.Optional[int] = None,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> typing.Iterator[typing.Union[ApiResponse, Exception]]:
+        """Not supported, gather the coroutines of the operations with asyncio.gather instead"""
+        raise ApiTypeError('map needs a blocking ApiClient, use asyncio.gather instead')
+
+    async def call_api(
+        self,
+        resource_path: str,
+        method: str,
+        headers: typing.Optional[HTTPHeaderDict] = None,
+        body: typing.Optional[typing.Union[str, bytes]] = None,
+        fields: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]] = None,
+        auth_settings: typing.Optional[typing.List[str]] = None,
+        async_req: typing.Optional[bool] = None,
+        stream: bool = False,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+        host: typing.Optional[str] = None,
+    ) -> urllib3.HTTPResponse:
+        """Makes the HTTP request on the running event loop, see ApiClient.call_api"""
+        url, used_headers = self._prepare_request(
+            resource_path, method, headers=headers, body=body, auth_settings=auth_settings,
+            host=host)
+        request = functools.partial(
+            self.request,
+            method,
+            url,
+            headers=used_headers,
+            fields=fields,
+            body=body,
+            stream=stream,
+        )
+        attempts = _Attempts(self, resource_path, method, url, used_headers, stream, timeout)
+        if not attempts.enabled:
+            return await request(timeout=timeout)
+        while True:
+            wait = attempts.admit()
+            try:
+                if wait > 0:
+                    await sleep_async(attempts.limiter.sleep, wait)
+                send = functools.partial(request, timeout=attempts.timeout())
+                if attempts.hedged:
+                    send = functools.partial(attempts.hedging.send_async, attempts.operation, send)
+                attempts.sending()
+                try:
+                    response = await send()
+                except Exception as error:
+                    delay = attempts.failed(error)
+                    if delay is None:
+                        raise
+                else:
+                    delay = attempts.completed(response)
+                    if delay is None:
+                        return response
+            finally:
+                # e.g. the deadline passed or the request was cancelled before it was recorded
+                attempts.release()
+            await sleep_async(attempts.policy.sleep, delay)
+
+    async def call_operation(
+        self,
+        resource_path: str,
+        method: str,
+        status_code_to_response: typing.Dict[str, OpenApiResponse],
+        headers: typing.Optional[HTTPHeaderDict] = None,
+        body: typing.Optional[typing.Union[str, bytes]] = None,
+        fields: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]] = None,
+        auth_settings: typing.Optional[typing.List[str]] = None,
+        stream: bool = False,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+        host: typing.Optional[str] = None,
+        skip_deserialization: bool = False,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        projection: typing.Optional[typing.Collection[str]] = None,
+    ) -> ApiResponse:
+        """Awaitable variant of ApiClient.call_operation"""
+        resource_path = self._prepare_operation(resource_path, response_format, projection)
+        send = functools.partial(
+            self._send_operation, resource_path, method, status_code_to_response,
+            headers=headers, body=body, fields=fields, auth_settings=auth_settings, stream=stream,
+            timeout=timeout, host=host,
+            skip_deserialization=skip_deserialization, validate_responses=validate_responses,
+            response_format=response_format, projection=projection)
+        flight_key = self._single_flight_key(
+            resource_path, method, headers, auth_settings, stream, host, skip_deserialization,
+            validate_responses, response_format, projection)
+        if flight_key is None:
+            return await send()
+        return await self.single_flight.do_async(flight_key, send)
+
+    async def _send_operation(
+        self,
+        resource_path: str,
+        method: str,
+        status_code_to_response: typing.Dict[str, OpenApiResponse],
+        headers: typing.Optional[HTTPHeaderDict] = None,
+        body: typing.Optional[typing.Union[str, bytes]] = None,
+        fields: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]] = None,
+        auth_settings: typing.Optional[typing.List[str]] = None,
+        stream: bool = False,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+        host: typing.Optional[str] = None,
+        skip_deserialization: bool = False,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        projection: typing.Optional[typing.Collection[str]] = None,
+    ) -> ApiResponse:
+        """Awaitable variant of ApiClient._send_operation"""
+        cache_key, entry, headers = self._cached_response(
+            resource_path, method, headers, stream, host)
+        if entry is None or entry.stale:
+            response = await self.call_api(
+                resource_path,
+                method,
+                headers=headers,
+                body=body,
+                fields=fields,
+                auth_settings=auth_settings,
+                stream=stream,
+                timeout=timeout,
+                host=host,
+            )
+            entry = self._cache_response(resource_path, method, cache_key, entry, response)
+            if entry is None:
+                return self.deserialize_operation_response(
+                    response, status_code_to_response, skip_deserialization, validate_responses,
+                    response_format, projection)
+        return self._deserialize_cached_response(
+            entry, status_code_to_response, skip_deserialization, validate_responses,
+            response_format, projection)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: typing.Optional[HTTPHeaderDict] = None,
+        fields: typing.Optional[typing.Tuple[typing.Tuple[str, str], ...]] = None,
+        body: typing.Optional[typing.Union[str, bytes]] = None,
+        stream: bool = False,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+    ) -> urllib3.HTTPResponse:
+        """Makes the HTTP request using AsyncRESTClientObject."""
+        if method not in {"GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"}:
+            raise ApiValueError(
+                "http method must be `GET`, `HEAD`, `OPTIONS`,"
+                " `POST`, `PATCH`, `PUT` or `DELETE`."
+            )
+        return await self.rest_client.request(
+            method,
+            url,
+            headers=headers,
+            fields=fields,
+            body=body,
+            stream=stream,
+            timeout=timeout,
+        )
+
+
 class Api:
     """NOTE: This class is auto generated by OpenAPI Generator
     Ref: https://openapi-generator.tech
@@ -0,0 +1,135 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+from dataclasses import dataclass, field
+import typing
+from urllib.parse import quote
+
+from urllib3._collections import HTTPHeaderDict
+
+from versify.api_client import ApiClient, AsyncApiClient
+from versify.deadline import Deadline
+from versify.exceptions import ApiTypeError
+from versify.resources import Resource, get_resource
+
+
+@dataclass
+class BatchResult:
+    """
+    The outcome of get_many
+
+    :param items: the body of each fetched item by id, in the order of the requested ids
+    :param errors: the exception raised for each id that could not be fetched, e.g. an
+        ApiException with status 404
+    """
+    items: typing.Dict[str, typing.Any] = field(default_factory=dict)
+    errors: typing.Dict[str, Exception] = field(default_factory=dict)
+
+
+def iter_many(
+    api_client: ApiClient,
+    resource: typing.Union[str, Resource],
+    ids: typing.Iterable[str],
+    concurrency: typing.Optional[int] = None,
+    header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+    validate_responses: typing.Optional[bool] = None,
+    response_format: str = 'schema',
+    fields: typing.Optional[typing.Tuple[str, ...]] = None,
+) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    """Fetches items of a resource by id, yielding (id, body) pairs as the responses arrive.
+
+    Duplicate ids are fetched once. Ids with a fresh entry in the client's response_cache are
+    yielded first, without using the executor; the others are requested over the client's
+    executor with at most concurrency requests in flight. When fetching an id raises, the
+    exception is yielded in place of its body.
+
+    :param concurrency: the maximum number of requests in flight, defaults to the client's
+        pool_threads
+    :param header_params: the header parameters of every request,
+        e.g. {'Versify-Account': account_id}
+    :param timeout: the timeout of each request, or a deadline.Deadline; ids not fetched before
+        it passed are yielded with a DeadlineExceededError
+    :param response_format: 'lazy', 'python' or 'slots' to build the bodies as in the get operation
+    :param fields: the properties of each item that are built
+    """
+    if isinstance(api_client, AsyncApiClient):
+        raise ApiTypeError('iter_many and get_many need a blocking ApiClient')
+    resource = get_resource(resource)
+    api = resource.item_api('get', api_client)
+    headers = HTTPHeaderDict(header_params or {})
+
+    def fetch(item_id: str) -> typing.Tuple[str, typing.Any]:
+        try:
+            api_response = api.get(
+                path_params={resource.id_param: item_id},
+                header_params=header_params or {},
+                timeout=timeout,
+                validate_responses=validate_responses,
+                response_format=response_format,
+                fields=fields,
+            )
+        except Exception as error:
+            return item_id, error
+        return item_id, api_response.body
+
+    misses = []
+    for item_id in dict.fromkeys(ids):
+        resource_path = '/v2/{}/{}'.format(resource.name, quote(str(item_id), safe=''))
+        if api_client.is_cached(
+                resource_path, headers, response_format=response_format, projection=fields):
+            yield fetch(item_id)
+        else:
+            misses.append({'item_id': item_id})
+    if misses:
+        yield from api_client.map(fetch, misses, max_workers=concurrency, ordered=False)
+
+
+def get_many(
+    api_client: ApiClient,
+    resource: typing.Union[str, Resource],
+    ids: typing.Iterable[str],
+    concurrency: typing.Optional[int] = None,
+    header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+    validate_responses: typing.Optional[bool] = None,
+    response_format: str = 'schema',
+    fields: typing.Optional[typing.Tuple[str, ...]] = None,
+) -> BatchResult:
+    """Fetches items of a resource by id concurrently, see iter_many
+
+    Example:
+        result = batch.get_many(api_client, 'contacts', contact_ids, concurrency=32)
+        for contact_id, error in result.errors.items():
+            ...
+
+    :return: a BatchResult of the fetched items and the per id errors
+    """
+    ids = list(dict.fromkeys(ids))
+    outcomes = dict(iter_many(
+        api_client,
+        resource,
+        ids,
+        concurrency=concurrency,
+        header_params=header_params,
+        timeout=timeout,
+        validate_responses=validate_responses,
+        response_format=response_format,
+        fields=fields,
+    ))
+    result = BatchResult()
+    for item_id in ids:
+        outcome = outcomes[item_id]
+        if isinstance(outcome, Exception):
+            result.errors[item_id] = outcome
+        else:
+            result.items[item_id] = outcome
+    return result
@@ -0,0 +1,545 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import collections
+import csv
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import typing
+
+import urllib3
+
+from versify.api_client import ApiClient, AsyncApiClient
+from versify.deadline import Deadline
+from versify.exceptions import ApiException, ApiTypeError, ApiValueError
+from versify.model.contact_create import ContactCreate
+from versify.resources import Resource, get_resource
+from versify.retry import RETRY_STATUSES
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a request that raised error may succeed when it is sent again"""
+    if isinstance(error, ApiException):
+        return error.status in RETRY_STATUSES
+    return isinstance(error, urllib3.exceptions.HTTPError)
+
+
+@dataclass
+class BulkFailure:
+    """
+    A record that could not be written
+
+    :param key: the position of the record in the input of bulk_create, its id for bulk_update
+        and bulk_delete
+    :param record: the input record, so it can be submitted again
+    :param error: the exception the request raised; an ApiException with status 422 holds the
+        HTTPValidationError in error.api_response.body
+    """
+    key: typing.Any
+    record: typing.Any
+    error: Exception
+
+    @property
+    def status(self) -> typing.Optional[int]:
+        return getattr(self.error, 'status', None)
+
+
+@dataclass
+class BulkReport:
+    """
+    The outcome of a bulk operation
+
+    :param successes: the (key, response body) of each written record, in completion order;
+        empty when the operation ran with keep_results=False
+    :param failures: the records rejected by the server or by client side validation, e.g.
+        422 HTTPValidationError responses
+    :param retryable: the records whose request failed with a connection error or a
+        status in retry.RETRY_STATUSES, the statuses a retry.RetryPolicy retries on
+    :param succeeded: the number of written records
+    :param elapsed: the seconds the operation ran for
+    :param deadline_exceeded: whether the operation stopped taking records because the
+        deadline.Deadline it ran with passed; the records left are not in the report
+    """
+    successes: typing.List[typing.Tuple[typing.Any, typing.Any]] = field(default_factory=list)
+    failures: typing.List[BulkFailure] = field(default_factory=list)
+    retryable: typing.List[BulkFailure] = field(default_factory=list)
+    succeeded: int = 0
+    elapsed: float = 0.0
+    deadline_exceeded: bool = False
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + len(self.failures) + len(self.retryable)
+
+    @property
+    def records_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    def add(self, key: typing.Any, record: typing.Any, outcome: typing.Any, keep_results: bool):
+        if isinstance(outcome, Exception):
+            failure = BulkFailure(key, record, outcome)
+            (self.retryable if is_retryable(outcome) else self.failures).append(failure)
+            return
+        self.succeeded += 1
+        if keep_results:
+            self.successes.append((key, outcome))
+
+
+def _run(
+    api_client: ApiClient,
+    send: typing.Callable[[typing.Any], typing.Any],
+    records: typing.Iterable[typing.Tuple[typing.Any, typing.Any]],
+    window: typing.Optional[int],
+    keep_results: bool,
+    report: typing.Optional[BulkReport] = None,
+    on_complete: typing.Optional[typing.Callable[[typing.Any], None]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+) -> BulkReport:
+    """
+    Sends every (key, record) over the client's executor with at most window requests in flight
+
+    :param on_complete: called with the key of each record once its outcome is in report
+    :param timeout: the timeout send uses; no more records are taken once a Deadline passed
+    """
+    if isinstance(api_client, AsyncApiClient):
+        raise ApiTypeError('bulk operations need a blocking ApiClient')
+
+    def call(
+        key: typing.Any, record: typing.Any
+    ) -> typing.Tuple[typing.Any, typing.Any, typing.Any]:
+        try:
+            return key, record, send(record).body
+        except Exception as error:
+            return key, record, error
+
+    if report is None:
+        report = BulkReport()
+    deadline = timeout if isinstance(timeout, Deadline) else None
+
+    def calls():
+        for key, record in records:
+            if deadline is not None and deadline.expired:
+                report.deadline_exceeded = True
+                return
+            yield {'key': key, 'record': record}
+
+    started = time.monotonic()
+    try:
+        outcomes = api_client.map(call, calls(), max_workers=window, ordered=False)
+        for key, record, outcome in outcomes:
+            report.add(key, record, outcome, keep_results)
+            if on_complete is not None:
+                on_complete(key)
+    finally:
+        report.elapsed += time.monotonic() - started
+    return report
+
+
+def bulk_create(
+    api_client: ApiClient,
+    resource: typing.Union[str, Resource],
+    bodies: typing.Iterable[typing.Any],
+    window: typing.Optional[int] = None,
+    header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+    keep_results: bool = True,
+) -> BulkReport:
+    """Creates one item of a resource per body, e.g. ContactCreate instances or dicts.
+
+    bodies is consumed lazily, so it can be a generator over a file, and at most window
+    requests are in flight over the connection pool; requests are serialized and their
+    responses deserialized on the client's executor.
+
+    Example:
+        bodies = (ContactCreate(email=email) for email in emails)
+        report = bulk.bulk_create(api_client, 'contacts', bodies)
+        for failure in report.retryable:
+            ...
+
+    :param window: the maximum number of requests in flight, defaults to and is effectively
+        capped by the client's pool_threads
+    :param timeout: the timeout of each request, or a deadline.Deadline after which no more
+        bodies are taken and report.deadline_exceeded is set
+    :param keep_results: if False the created items are counted but not kept in report.successes
+    :return: a BulkReport keyed by the position of each body in bodies
+    """
+    api = get_resource(resource).collection_api('post', api_client)
+
+    def send(body):
+        return api.post(body=body, header_params=header_params or {}, timeout=timeout)
+
+    return _run(api_client, send, enumerate(bodies), window, keep_results, timeout=timeout)
+
+
+def bulk_update(
+    api_client: ApiClient,
+    resource: typing.Union[str, Resource],
+    updates: typing.Iterable[typing.Tuple[str, typing.Any]],
+    window: typing.Optional[int] = None,
+    header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+    keep_results: bool = True,
+) -> BulkReport:
+    """Updates items of a resource from (id, body) pairs, see bulk_create
+
+    :return: a BulkReport keyed by item id
+    """
+    resource = get_resource(resource)
+    api = resource.item_api('put', api_client)
+
+    def send(update):
+        item_id, body = update
+        return api.put(
+            path_params={resource.id_param: item_id}, body=body, header_params=header_params or {},
+            timeout=timeout)
+
+    return _run(
+        api_client, send, ((update[0], update) for update in updates), window, keep_results,
+        timeout=timeout)
+
+
+def bulk_delete(
+    api_client: ApiClient,
+    resource: typing.Union[str, Resource],
+    ids: typing.Iterable[str],
+    window: typing.Optional[int] = None,
+    header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+    keep_results: bool = True,
+) -> BulkReport:
+    """Deletes items of a resource by id, see bulk_create
+
+    :return: a BulkReport keyed by item id
+    """
+    resource = get_resource(resource)
+    api = resource.item_api('delete', api_client)
+
+    def send(item_id):
+        return api.delete(
+            path_params={resource.id_param: item_id}, header_params=header_params or {},
+            timeout=timeout)
+
+    return _run(
+        api_client, send, ((item_id, item_id) for item_id in ids), window, keep_results,
+        timeout=timeout)
+
+
+CSV = 'csv'
+JSONL = 'jsonl'
+FILE_FORMATS = {'.csv': CSV, '.jsonl': JSONL, '.ndjson': JSONL}
+
+# ContactCreate property: column, or a mapping of nested property: column for object properties
+DEFAULT_CONTACT_MAPPING = {
+    'email': 'email',
+    'name': {'first_name': 'first_name', 'middle_name': 'middle_name', 'last_name': 'last_name'},
+    'phone_number': 'phone_number',
+    'metadata': 'metadata',
+}
+
+
+@dataclass
+class ImportReport(BulkReport):
+    """
+    The outcome of import_contacts, a BulkReport keyed by row number
+
+    :param rows: the number of rows read, including the rows before the checkpoint
+    :param duplicates: the rows skipped because an earlier row of the file has the same email
+    :param offset: the byte offset in the file before which every row has completed
+    """
+    rows: int = 0
+    duplicates: int = 0
+    offset: int = 0
+
+
+class _RecordReader:
+    """Reads the rows of a CSV or JSON lines file, tracking the byte offset the last row ends at"""
+
+    def __init__(self, file: typing.BinaryIO, file_format: str, encoding: str):
+        self.offset = 0
+        self._file = file
+        self._encoding = encoding
+        if file_format == CSV:
+            self._reader = csv.reader(self._lines())
+            self.columns = next(self._reader, [])
+        self._format = file_format
+
+    def _lines(self) -> typing.Iterator[str]:
+        for raw in self._file:
+            self.offset += len(raw)
+            yield raw.decode(self._encoding)
+
+    def seek(self, offset: int):
+        """Continues with the row that starts at offset, after the CSV header was read"""
+        self._file.seek(offset)
+        self.offset = offset
+
+    def __iter__(self) -> typing.Iterator[typing.Union[typing.Dict[str, typing.Any], Exception]]:
+        """Yields each row as a dict, or the exception that parsing it raised"""
+        if self._format == CSV:
+            for values in self._reader:
+                if values:
+                    yield dict(zip(self.columns, values))
+            return
+        for line in self._lines():
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as error:
+                yield error
+
+
+class _EmailIndex:
+    """
+    The digests of the emails of a file with the row each was first seen on, in sqlite
+
+    The index lives on disk rather than in memory, so it does not grow the process with the
+    number of distinct emails and a resumed import dedupes against it without re-reading the
+    rows before the checkpoint.
+    """
+
+    def __init__(self, path: typing.Optional[str]):
+        # an empty path is a temporary database that sqlite removes when it is closed
+        self._db = sqlite3.connect(path or '')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS emails (digest BLOB PRIMARY KEY, row INTEGER)'
+            ' WITHOUT ROWID')
+
+    def add(self, email: str, row: int) -> bool:
+        """Records the email of row, False when an earlier row has the same email"""
+        digest = _email_digest(email)
+        found = self._db.execute('SELECT row FROM emails WHERE digest = ?', (digest,)).fetchone()
+        if found is None:
+            self._db.execute('INSERT INTO emails VALUES (?, ?)', (digest, row))
+            return True
+        # rows after the checkpoint are validated again on resume and find themselves
+        return found[0] >= row
+
+    def clear(self):
+        self._db.execute('DELETE FROM emails')
+
+    def commit(self):
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+class _Checkpoint:
+    """
+    Tracks the rows in flight and saves the offset every row before which has completed
+
+    Rows complete out of order, so the offset only moves past a row once every earlier row
+    has completed too. The checkpoint file holds the offset and the number of rows before it,
+    and the email index is committed before it is written.
+    """
+
+    def __init__(
+        self, path: typing.Optional[str], every: int, report: ImportReport, index: _EmailIndex
+    ):
+        self.path = path
+        self.every = every
+        self.report = report
+        self.index = index
+        self.rows = 0
+        self._ends: typing.OrderedDict[int, int] = collections.OrderedDict()
+        self._done: typing.Set[int] = set()
+        self._unsaved = 0
+
+    def load(self) -> typing.Tuple[int, int]:
+        """The saved offset and the number of rows before it"""
+        if self.path is None or not os.path.exists(self.path):
+            return 0, 0
+        with open(self.path) as file:
+            offset, _, rows = file.read().strip().partition(' ')
+        return int(offset or 0), int(rows or 0)
+
+    def start(self, row: int, end: int):
+        self._ends[row] = end
+
+    def complete(self, row: int):
+        self._done.add(row)
+        while self._ends and next(iter(self._ends)) in self._done:
+            first, end = self._ends.popitem(last=False)
+            self._done.discard(first)
+            self.report.offset = end
+            self.rows = first + 1
+        self._unsaved += 1
+        if self._unsaved >= self.every:
+            self.save()
+
+    def save(self):
+        self._unsaved = 0
+        if self.path is None:
+            return
+        self.index.commit()
+        temporary = self.path + '.tmp'
+        with open(temporary, 'w') as file:
+            file.write('{} {}'.format(self.report.offset, self.rows))
+        os.replace(temporary, self.path)
+
+
+def _map_record(
+    record: typing.Dict[str, typing.Any], mapping: typing.Dict[str, typing.Any]
+) -> typing.Dict[str, typing.Any]:
+    values = {}
+    for name, source in mapping.items():
+        if isinstance(source, dict):
+            value = _map_record(record, source) or None
+        else:
+            value = record.get(source)
+        if value is not None and value != '':
+            values[name] = value
+    return values
+
+
+def _email_digest(email: str) -> bytes:
+    return hashlib.blake2b(email.encode('utf-8'), digest_size=16).digest()
+
+
+def import_contacts(
+    api_client: ApiClient,
+    path: str,
+    mapping: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    window: typing.Optional[int] = None,
+    batch_size: int = 1000,
+    checkpoint: typing.Optional[str] = None,
+    file_format: typing.Optional[str] = None,
+    encoding: str = 'utf-8-sig',
+    header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+    keep_results: bool = False,
+) -> ImportReport:
+    """Creates a contact per row of a CSV or JSON lines file.
+
+    The file is read incrementally, batch_size rows at a time: each batch is mapped to
+    ContactCreate bodies and validated, rows repeating an email seen earlier in the file are
+    skipped, and the bodies are created through the bulk_create pipeline with at most window
+    requests in flight. Memory stays bounded by batch_size and window plus the rows that failed,
+    which are kept in report.failures and report.retryable. The emails seen are deduplicated
+    through a sqlite index on disk rather than in memory: next to the checkpoint as
+    <checkpoint>.emails, or in a temporary database without a checkpoint.
+
+    With a checkpoint path the byte offset every row before which has completed is saved there
+    every batch_size rows and at the end, and a later call with the same checkpoint seeks to it
+    and dedupes against the saved index instead of re-reading the rows before it. Rows that
+    failed are reported, not retried, so report.retryable should be submitted again before the
+    checkpoint is relied on.
+
+    Example:
+        report = bulk.import_contacts(
+            api_client, 'contacts.csv',
+            mapping={
+                'email': 'Email',
+                'name': {'first_name': 'First name'},
+                'metadata': {'plan': 'Plan'},
+            },
+            checkpoint='contacts.csv.checkpoint')
+
+    :param mapping: the column, or JSON key, of each ContactCreate property; email, name,
+        phone_number and metadata. Object properties (name, metadata) take a mapping of their
+        properties to columns, or a column holding a JSON object. Defaults to
+        DEFAULT_CONTACT_MAPPING
+    :param batch_size: the number of rows read and validated at a time and between checkpoint saves
+    :param checkpoint: the path of the checkpoint offset file, the email index is saved at
+        this path + '.emails'
+    :param file_format: 'csv' or 'jsonl', defaults to the one of the file extension
+    :param keep_results: if True the created contacts are kept in report.successes
+    :return: an ImportReport keyed by row number; rows that failed validation are in
+        report.failures with their parsed row as record
+    """
+    mapping = DEFAULT_CONTACT_MAPPING if mapping is None else mapping
+    if 'email' not in mapping:
+        raise ApiValueError('mapping must map the email property')
+    if batch_size < 1:
+        raise ApiValueError('batch_size must be greater than 0')
+    if file_format is None:
+        file_format = FILE_FORMATS.get(os.path.splitext(path)[1].lower())
+    if file_format not in (CSV, JSONL):
+        raise ApiValueError(
+            'Invalid file_format {!r}, must be one of {}'.format(file_format, (CSV, JSONL)))
+    api = get_resource('contacts').collection_api('post', api_client)
+    report = ImportReport()
+    index = _EmailIndex(None if checkpoint is None else checkpoint + '.emails')
+    tracker = _Checkpoint(checkpoint, batch_size, report, index)
+    resume_offset, resume_rows = tracker.load()
+    if not resume_offset:
+        # left by an import that did not save a checkpoint
+        index.clear()
+
+    def contact(record: typing.Any) -> typing.Tuple[typing.Optional[str], typing.Any]:
+        """The normalized email and ContactCreate of a row, or the exception validation raised"""
+        if isinstance(record, Exception):
+            return None, record
+        if not isinstance(record, dict):
+            return None, ApiTypeError(
+                'Invalid row, must be an object, not {}'.format(type(record).__name__))
+        values = _map_record(record, mapping)
+        email = values.get('email')
+        if not isinstance(email, str) or not email.strip():
+            return None, ApiValueError('Invalid row, the email is missing')
+        values['email'] = email.strip()
+        try:
+            if isinstance(values.get('metadata'), str):
+                values['metadata'] = json.loads(values['metadata'])
+            return values['email'].lower(), ContactCreate(**values)
+        except (ValueError, TypeError) as error:
+            return values['email'].lower(), error
+
+    def validate(batch: typing.List[typing.Tuple[int, int, typing.Any]]):
+        for row, end, record in batch:
+            tracker.start(row, end)
+            email, body = contact(record)
+            if isinstance(body, Exception):
+                report.failures.append(BulkFailure(row, record, body))
+                tracker.complete(row)
+            elif not index.add(email, row):
+                report.duplicates += 1
+                tracker.complete(row)
+            else:
+                yield row, body
+
+    def rows(reader: _RecordReader):
+        batch = []
+        for record in reader:
+            row = report.rows
+            report.rows += 1
+            batch.append((row, reader.offset, record))
+            if len(batch) >= batch_size:
+                yield from validate(batch)
+                batch = []
+        yield from validate(batch)
+
+    def send(body):
+        return api.post(body=body, header_params=header_params or {}, timeout=timeout)
+
+    try:
+        with open(path, 'rb') as file:
+            reader = _RecordReader(file, file_format, encoding)
+            if resume_offset > reader.offset:
+                # the rows before the checkpoint were imported by an earlier call
+                reader.seek(resume_offset)
+                report.rows = tracker.rows = resume_rows
+            report.offset = reader.offset
+            try:
+                _run(
+                    api_client, send, rows(reader), window, keep_results, report=report,
+                    on_complete=tracker.complete,
+                    timeout=timeout)
+            finally:
+                tracker.save()
+    finally:
+        index.close()
+    return report
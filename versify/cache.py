@@ -0,0 +1,311 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import collections
+from dataclasses import dataclass, field, replace
+import re
+import threading
+import time
+import typing
+
+import urllib3
+from urllib3._collections import HTTPHeaderDict
+
+from versify.exceptions import ApiValueError
+
+ACCOUNT_HEADER = 'Versify-Account'
+# /v2/<resource>/<id>, the path of the get, put and delete operations of one document
+ITEM_PATH = re.compile(r'^/v2/(?P<resource>[a-z_]+)/(?P<id>[^/?]+)$')
+# segments in the place of an id that do not name a document, e.g. /v2/users/me whose
+# document depends on the credentials of the request
+NON_ID_SEGMENTS = frozenset(('search', 'me'))
+
+CacheKey = typing.Tuple[str, str, str, str]
+
+
+def fields_key(fields: typing.Any) -> typing.Hashable:
+    """A hashable key of a fields projection, a collection of names or a dict of projections"""
+    if fields is None:
+        return None
+    if isinstance(fields, dict):
+        return tuple(sorted((name, fields_key(nested)) for name, nested in fields.items()))
+    return tuple(sorted(fields))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    revalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class CachedResponse:
+    """
+    The status, headers and body of a cached response
+
+    models holds the ApiResponses deserialized from it by ApiClient.call_operation, keyed by
+    their deserialization options, so hits and 304 revalidations skip decoding the body again.
+    stale is True when the ttl of the entry has passed and it must be revalidated before use.
+    """
+    status: int
+    reason: typing.Optional[str]
+    headers: HTTPHeaderDict
+    data: bytes
+    expires: float
+    models: typing.Dict[typing.Hashable, typing.Any] = field(
+        default_factory=dict, compare=False, repr=False)
+    stale: bool = False
+
+    @classmethod
+    def from_response(cls, response: urllib3.HTTPResponse, expires: float) -> 'CachedResponse':
+        return cls(
+            status=response.status,
+            reason=response.reason,
+            headers=HTTPHeaderDict(response.headers),
+            data=response.data,
+            expires=expires,
+        )
+
+    def to_response(self) -> urllib3.HTTPResponse:
+        return urllib3.HTTPResponse(
+            body=self.data,
+            headers=HTTPHeaderDict(self.headers),
+            status=self.status,
+            reason=self.reason,
+            preload_content=False,
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def etag(self) -> typing.Optional[str]:
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self) -> typing.Optional[str]:
+        return self.headers.get('Last-Modified')
+
+    def conditional_headers(self) -> HTTPHeaderDict:
+        """The If-None-Match and If-Modified-Since headers that revalidate the entry"""
+        headers = HTTPHeaderDict()
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    The interface of ApiClient.response_cache
+
+    ApiClient.call_operation looks up GET requests whose key is not None before sending them and
+    stores their 200 responses, and invalidates the path of every other request before and after
+    sending it. Stale entries are revalidated with a conditional GET and refreshed on a 304.
+    Streamed requests bypass the cache.
+    """
+
+    def key(
+        self, resource_path: str, account: typing.Optional[str], host: typing.Optional[str]
+    ) -> typing.Optional[typing.Hashable]:
+        """The cache key of a GET request, None if the request is not cached"""
+        raise NotImplementedError()
+
+    def get(self, key: typing.Hashable) -> typing.Optional[CachedResponse]:
+        """The fresh entry of a key, or its stale entry when it can be revalidated"""
+        raise NotImplementedError()
+
+    def put(
+        self, key: typing.Hashable, response: urllib3.HTTPResponse
+    ) -> typing.Optional[CachedResponse]:
+        raise NotImplementedError()
+
+    def revalidate(
+        self, key: typing.Hashable, entry: CachedResponse, response: urllib3.HTTPResponse
+    ) -> CachedResponse:
+        """Refreshes a stale entry after the server answered its conditional GET with a 304"""
+        raise NotImplementedError()
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        """Whether key has a fresh entry"""
+        raise NotImplementedError()
+
+    def invalidate(self, resource_path: str):
+        """Drops the entries of a path, for every account and query string"""
+        raise NotImplementedError()
+
+    def clear(self):
+        raise NotImplementedError()
+
+
+class LRUResponseCache(ResponseCache):
+    """
+    Caches the responses of the get-by-id operations, /v2/<resource>/<id>, in memory
+
+    Entries are keyed by path, query string, Versify-Account header and host and expire after the
+    ttl of their resource. When more than max_entries entries or max_bytes body bytes are held the
+    least recently used entries are evicted. put and delete requests on a path invalidate its
+    entries.
+    Expired entries with an ETag or Last-Modified header are kept and revalidated with
+    If-None-Match and If-Modified-Since when revalidate is True. The cache is thread safe.
+
+    :param ttl: the seconds entries are fresh for, unless ttls has the resource
+    :param ttls: the ttl by resource name, e.g. {'contacts': 5, 'assets': 300}; 0 disables caching
+        of a resource
+    :param max_entries: the maximum number of entries
+    :param max_bytes: the maximum total size of the cached bodies
+    :param revalidate: whether expired entries with validators are revalidated instead of dropped
+    :param clock: returns the current time in seconds
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        ttls: typing.Optional[typing.Dict[str, float]] = None,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        revalidate: bool = True,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1 or max_bytes < 1:
+            raise ApiValueError('max_entries and max_bytes must be greater than 0')
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.revalidate_stale = revalidate
+        self.clock = clock
+        self._entries: typing.OrderedDict[CacheKey, CachedResponse] = collections.OrderedDict()
+        self._keys_by_path: typing.Dict[str, typing.Set[CacheKey]] = {}
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, resource: str) -> float:
+        return self.ttls.get(resource, self.ttl)
+
+    def key(
+        self, resource_path: str, account: typing.Optional[str], host: typing.Optional[str]
+    ) -> typing.Optional[CacheKey]:
+        path, _, query = resource_path.partition('?')
+        match = ITEM_PATH.match(path)
+        if match is None or match.group('id') in NON_ID_SEGMENTS:
+            return None
+        if self.ttl_for(match.group('resource')) <= 0:
+            return None
+        return path, query, account or '', host or ''
+
+    def get(self, key: CacheKey) -> typing.Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            if entry.expires <= self.clock():
+                self._stats.misses += 1
+                self._stats.expirations += 1
+                validators = entry.etag is not None or entry.last_modified is not None
+                if self.revalidate_stale and validators:
+                    self._entries.move_to_end(key)
+                    return replace(entry, stale=True)
+                self._remove(key)
+                return None
+            self._stats.hits += 1
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self, key: CacheKey, response: urllib3.HTTPResponse
+    ) -> typing.Optional[CachedResponse]:
+        entry = CachedResponse.from_response(response, self._expires(key))
+        if entry.size > self.max_bytes:
+            return None
+        with self._lock:
+            self._store(key, entry)
+        return entry
+
+    def revalidate(
+        self, key: CacheKey, entry: CachedResponse, response: urllib3.HTTPResponse
+    ) -> CachedResponse:
+        headers = HTTPHeaderDict(entry.headers)
+        for name in ('ETag', 'Last-Modified', 'Date', 'Cache-Control', 'Expires'):
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        refreshed = replace(entry, headers=headers, expires=self._expires(key), stale=False)
+        with self._lock:
+            self._store(key, refreshed)
+            self._stats.revalidations += 1
+        return refreshed
+
+    def _expires(self, key: CacheKey) -> float:
+        return self.clock() + self.ttl_for(ITEM_PATH.match(key[0]).group('resource'))
+
+    def _store(self, key: CacheKey, entry: CachedResponse):
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._keys_by_path.setdefault(key[0], set()).add(key)
+        self._bytes += entry.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def __contains__(self, key: CacheKey) -> bool:
+        """Whether key has a fresh entry, without counting a hit or miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.expires > self.clock()
+
+    def _remove(self, key: CacheKey):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        keys = self._keys_by_path[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_path[key[0]]
+
+    def invalidate(self, resource_path: str):
+        path = resource_path.partition('?')[0]
+        with self._lock:
+            for key in list(self._keys_by_path.get(path, ())):
+                self._remove(key)
+                self._stats.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_path.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """A snapshot of the counters and the current size"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                invalidations=self._stats.invalidations,
+                revalidations=self._stats.revalidations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,236 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import collections
+from dataclasses import dataclass
+import threading
+import time
+import typing
+
+import urllib3
+
+from versify.exceptions import ApiValueError, CircuitOpenError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+# statuses that count as a failure of the server
+FAILURE_STATUSES = frozenset((500, 502, 503, 504))
+
+CircuitKey = typing.Tuple[str, str]
+
+
+@dataclass
+class CircuitStats:
+    state: str = CLOSED
+    requests: int = 0
+    failures: int = 0
+    rejected: int = 0
+    opened: int = 0
+    changed_at: float = 0.0
+
+
+class _Circuit:
+
+    def __init__(self, now: float):
+        self.state = CLOSED
+        # (time, failed) of the requests completed in the window
+        self.outcomes: typing.Deque[typing.Tuple[float, bool]] = collections.deque()
+        self.failures = 0
+        self.probes = 0
+        self.probe_successes = 0
+        self.probed_at = now
+        self.rejected = 0
+        self.opened = 0
+        self.changed_at = now
+
+    def prune(self, since: float):
+        while self.outcomes and self.outcomes[0][0] < since:
+            _, failed = self.outcomes.popleft()
+            self.failures -= failed
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast while their host and path template keep failing
+
+    A circuit is kept per (host, path template), e.g. ('api.versifylabs.com', '/v2/contacts/{id}'),
+    so a broken endpoint does not stop traffic to healthy ones. A closed circuit opens once at
+    least min_requests completed within the last window seconds and failure_rate of them failed,
+    i.e. raised a connection error or got one of failure_statuses. An open circuit raises
+    CircuitOpenError without sending anything for open_for seconds, then turns half open and lets
+    half_open_requests probes through: the circuit closes when they all succeed and opens again
+    when one fails. A probe is given back with release when its request is not sent after all,
+    and probes that were neither recorded nor released within probe_timeout seconds expire, so
+    a lost probe does not keep the circuit half open forever.
+
+    :param failure_rate: the share of failed requests that opens the circuit
+    :param window: the seconds of completed requests the failure rate is computed over
+    :param min_requests: the requests needed in the window before the circuit may open
+    :param open_for: the seconds an open circuit rejects requests for
+    :param half_open_requests: the probes a half open circuit sends before closing
+    :param probe_timeout: the seconds after which probes that were not recorded expire
+    :param failure_statuses: the response statuses counted as failures
+    :param on_transition: called with the key, the old and the new state of a circuit
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: float = 30.0,
+        min_requests: int = 20,
+        open_for: float = 15.0,
+        half_open_requests: int = 3,
+        probe_timeout: float = 60.0,
+        failure_statuses: typing.Collection[int] = FAILURE_STATUSES,
+        on_transition: typing.Optional[typing.Callable[[CircuitKey, str, str], None]] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < failure_rate <= 1:
+            raise ApiValueError('failure_rate must be between 0 and 1')
+        if min_requests < 1 or half_open_requests < 1:
+            raise ApiValueError('min_requests and half_open_requests must be at least 1')
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_requests = min_requests
+        self.open_for = open_for
+        self.half_open_requests = half_open_requests
+        self.probe_timeout = probe_timeout
+        self.failure_statuses = frozenset(failure_statuses)
+        self.on_transition = on_transition
+        self.clock = clock
+        self._circuits: typing.Dict[CircuitKey, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, key: CircuitKey, now: float) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit(now)
+        return circuit
+
+    def _transition(
+        self,
+        key: CircuitKey,
+        circuit: _Circuit,
+        state: str,
+        now: float,
+        transitions: typing.List[tuple],
+    ):
+        transitions.append((key, circuit.state, state))
+        circuit.state = state
+        circuit.changed_at = now
+        circuit.probes = circuit.probe_successes = 0
+        if state == OPEN:
+            circuit.opened += 1
+        elif state == CLOSED:
+            circuit.outcomes.clear()
+            circuit.failures = 0
+
+    def _notify(self, transitions: typing.List[tuple]):
+        if self.on_transition is not None:
+            for transition in transitions:
+                self.on_transition(*transition)
+
+    def is_failure(
+        self,
+        response: typing.Optional[urllib3.HTTPResponse] = None,
+        error: typing.Optional[BaseException] = None,
+    ) -> bool:
+        if response is not None:
+            return response.status in self.failure_statuses
+        return error is not None
+
+    def allow(self, key: CircuitKey):
+        """Raises CircuitOpenError when a request to key must not be sent"""
+        transitions = []
+        with self._lock:
+            now = self.clock()
+            circuit = self._circuit(key, now)
+            if circuit.state == OPEN:
+                retry_in = circuit.changed_at + self.open_for - now
+                if retry_in > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(
+                        reason='Circuit open for {} {}'.format(*key), retry_in=retry_in)
+                self._transition(key, circuit, HALF_OPEN, now, transitions)
+            if circuit.state == HALF_OPEN:
+                lost = now - circuit.probed_at >= self.probe_timeout
+                if lost and circuit.probes > circuit.probe_successes:
+                    # the outstanding probes were neither recorded nor released
+                    circuit.probes = circuit.probe_successes
+                if circuit.probes >= self.half_open_requests:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(reason='Circuit half open for {} {}'.format(*key))
+                circuit.probes += 1
+                circuit.probed_at = now
+        self._notify(transitions)
+
+    def release(self, key: CircuitKey):
+        """Gives back a probe allowed by allow whose request was not sent or not recorded"""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state != HALF_OPEN:
+                return
+            if circuit.probes > circuit.probe_successes:
+                circuit.probes -= 1
+
+    def record(self, key: CircuitKey, failed: bool):
+        """Records the outcome of a request allowed by allow"""
+        transitions = []
+        with self._lock:
+            now = self.clock()
+            circuit = self._circuit(key, now)
+            if circuit.state == HALF_OPEN:
+                if failed:
+                    self._transition(key, circuit, OPEN, now, transitions)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_requests:
+                        self._transition(key, circuit, CLOSED, now, transitions)
+            elif circuit.state == CLOSED:
+                circuit.outcomes.append((now, failed))
+                circuit.failures += failed
+                circuit.prune(now - self.window)
+                requests = len(circuit.outcomes)
+                failing = circuit.failures >= self.failure_rate * requests
+                if requests >= self.min_requests and failing:
+                    self._transition(key, circuit, OPEN, now, transitions)
+        self._notify(transitions)
+
+    def state(self, key: CircuitKey) -> str:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and self.clock() >= circuit.changed_at + self.open_for:
+                return HALF_OPEN
+            return circuit.state
+
+    def stats(self) -> typing.Dict[CircuitKey, CircuitStats]:
+        """
+        A snapshot of the state and the counters of each circuit
+
+        requests and failures are counted within the window
+        """
+        with self._lock:
+            since = self.clock() - self.window
+            stats = {}
+            for key, circuit in self._circuits.items():
+                circuit.prune(since)
+                stats[key] = CircuitStats(
+                    state=circuit.state,
+                    requests=len(circuit.outcomes),
+                    failures=circuit.failures,
+                    rejected=circuit.rejected,
+                    opened=circuit.opened,
+                    changed_at=circuit.changed_at,
+                )
+            return stats
@@ -0,0 +1,402 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import array
+from datetime import date, datetime, timezone
+import decimal
+import math
+import typing
+
+from versify.exceptions import ApiTypeError, ApiValueError
+from versify.schemas import (
+    BoolBase,
+    BoolClass,
+    CompiledSchema,
+    DateBase,
+    DateTimeBase,
+    DEFAULT_ISOPARSER,
+    EnumBase,
+    IntBase,
+    NoneClass,
+    NumberBase,
+    Schema,
+)
+
+KINDS = ('int', 'float', 'bool', 'datetime', 'category', 'str', 'object')
+DEFAULT_TIMESTAMPS = ('created', 'updated')
+DEFAULT_MAX_CATEGORIES = 1024
+# numpy's NaT
+NAT = -2 ** 63
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+def _plain(value: typing.Any) -> typing.Any:
+    """Converts the value types of schema instances to their json types"""
+    if isinstance(value, decimal.Decimal):
+        if value == value.to_integral_value():
+            return int(value)
+        return float(value)
+    if isinstance(value, BoolClass):
+        return bool(value)
+    if isinstance(value, NoneClass):
+        return None
+    if isinstance(value, str) and type(value) is not str:
+        return str.__str__(value)
+    return value
+
+
+class Column:
+    """
+    The values of one field, stored in a typed buffer
+
+    int, float and bool values are stored in array.array buffers of int64, float64 and int8,
+    datetime values as int64 microseconds since the epoch (numpy's datetime64[us]) and category
+    values as int32 codes into categories. str and object values are kept in a list.
+    Missing values are NaN for float, NAT for datetime and -1 for category columns; int and bool
+    columns record them in mask.
+
+    :param name: the field name, dotted for nested properties
+    :param kind: one of KINDS, None to infer it from the first value that is not missing
+    :param timestamp: whether numbers are unix timestamps in seconds of a datetime column
+    :param max_categories: a category column with more distinct values becomes a str column
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: typing.Optional[str] = None,
+        timestamp: bool = False,
+        max_categories: int = DEFAULT_MAX_CATEGORIES,
+    ):
+        if kind is not None and kind not in KINDS:
+            raise ApiValueError('Invalid column kind {!r}, must be one of {}'.format(kind, KINDS))
+        self.name = name
+        self.kind = None
+        self.timestamp = timestamp
+        self.max_categories = max_categories
+        self.values: typing.Union[array.array, typing.List[typing.Any]] = []
+        self.mask: typing.Optional[array.array] = None
+        self.categories: typing.Optional[typing.List[str]] = None
+        self._codes: typing.Dict[str, int] = {}
+        self._length = 0
+        if kind is not None:
+            self._set_kind(kind)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _set_kind(self, kind: str):
+        # rows collected before the kind was known are all missing
+        missing = self._length
+        self.kind = kind
+        if kind == 'int':
+            self.values = array.array('q', bytes(8 * missing))
+            if missing:
+                self.mask = array.array('b', [1]) * missing
+        elif kind == 'float':
+            self.values = array.array('d', [math.nan]) * missing
+        elif kind == 'bool':
+            self.values = array.array('b', bytes(missing))
+            if missing:
+                self.mask = array.array('b', [1]) * missing
+        elif kind == 'datetime':
+            self.values = array.array('q', [NAT]) * missing
+        elif kind == 'category':
+            self.values = array.array('i', [-1]) * missing
+            self.categories = []
+            self._codes = {}
+        else:
+            self.values = [None] * missing
+
+    def _infer_kind(self, value: typing.Any) -> str:
+        if isinstance(value, bool):
+            return 'bool'
+        if isinstance(value, (int, float)):
+            if self.timestamp:
+                return 'datetime'
+            return 'int' if isinstance(value, int) else 'float'
+        if isinstance(value, (date, datetime)):
+            return 'datetime'
+        if isinstance(value, str):
+            return 'category'
+        return 'object'
+
+    def _type_error(self, value: typing.Any) -> ApiTypeError:
+        return ApiTypeError(
+            'Invalid value {!r} of type {} at row {} of the {} column {}'.format(
+                value, type(value).__name__, self._length, self.kind, self.name))
+
+    def _missing(self):
+        kind = self.kind
+        if kind == 'int' or kind == 'bool':
+            if self.mask is None:
+                self.mask = array.array('b', bytes(self._length))
+            self.values.append(0)
+            self.mask.append(1)
+        elif kind == 'float':
+            self.values.append(math.nan)
+        elif kind == 'datetime':
+            self.values.append(NAT)
+        elif kind == 'category':
+            self.values.append(-1)
+        elif kind is not None:
+            self.values.append(None)
+
+    def _microseconds(self, value: typing.Any) -> int:
+        if isinstance(value, str):
+            try:
+                value = DEFAULT_ISOPARSER.parse_isodatetime(value)
+            except ValueError:
+                try:
+                    value = DEFAULT_ISOPARSER.parse_isodate(value)
+                except ValueError:
+                    raise ApiValueError('Invalid datetime {!r} at row {} of column {}'.format(
+                        value, self._length, self.name))
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            delta = value - _EPOCH
+            return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+        if isinstance(value, date):
+            return (value - _EPOCH.date()).days * 86400000000
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return int(round(value * 1000000))
+        raise self._type_error(value)
+
+    def _to_float(self):
+        """Converts an int column to a float column when a non-integer number arrives"""
+        values = array.array('d', self.values)
+        if self.mask is not None:
+            for i, missing in enumerate(self.mask):
+                if missing:
+                    values[i] = math.nan
+        self.kind = 'float'
+        self.values = values
+        self.mask = None
+
+    def _to_str(self):
+        """Converts a category column to a str column once it has too many distinct values"""
+        categories = self.categories
+        self.values = [None if code == -1 else categories[code] for code in self.values]
+        self.kind = 'str'
+        self.categories = None
+        self._codes = {}
+
+    def append(self, value: typing.Any):
+        if type(value) not in _JSON_SCALARS:
+            value = _plain(value)
+        if value is None:
+            self._missing()
+            self._length += 1
+            return
+        if self.kind is None:
+            self._set_kind(self._infer_kind(value))
+        kind = self.kind
+        if kind == 'category':
+            if type(value) is not str:
+                raise self._type_error(value)
+            code = self._codes.get(value)
+            if code is None:
+                if len(self.categories) >= self.max_categories:
+                    self._to_str()
+                    self.values.append(value)
+                    self._length += 1
+                    return
+                code = self._codes[value] = len(self.categories)
+                self.categories.append(value)
+            self.values.append(code)
+        elif kind == 'int':
+            if type(value) is float:
+                self._to_float()
+                self.values.append(value)
+            elif type(value) is not int:
+                raise self._type_error(value)
+            else:
+                self.values.append(value)
+                if self.mask is not None:
+                    self.mask.append(0)
+        elif kind == 'float':
+            if type(value) is not float and type(value) is not int:
+                raise self._type_error(value)
+            self.values.append(value)
+        elif kind == 'datetime':
+            self.values.append(self._microseconds(value))
+        elif kind == 'bool':
+            if type(value) is not bool:
+                raise self._type_error(value)
+            self.values.append(value)
+            if self.mask is not None:
+                self.mask.append(0)
+        elif kind == 'str':
+            if type(value) is not str:
+                raise self._type_error(value)
+            self.values.append(value)
+        else:
+            self.values.append(value)
+        self._length += 1
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the typed buffers, 0 for list backed columns"""
+        size = 0
+        for buffer in (self.values, self.mask):
+            if isinstance(buffer, array.array):
+                size += buffer.itemsize * len(buffer)
+        return size
+
+    def to_numpy(self):
+        """
+        The values as a numpy array, requires numpy
+        int and bool columns with missing values become float64 with NaN; category columns
+        return their int32 codes, see categories.
+        """
+        import numpy
+
+        kind = self.kind
+        if kind == 'int' or kind == 'bool':
+            dtype = numpy.int64 if kind == 'int' else numpy.int8
+            values = numpy.frombuffer(self.values, dtype=dtype)
+            if self.mask is None:
+                return values.astype(bool) if kind == 'bool' else values.copy()
+            values = values.astype(numpy.float64)
+            values[numpy.frombuffer(self.mask, dtype=numpy.int8).astype(bool)] = numpy.nan
+            return values
+        if kind == 'float':
+            return numpy.frombuffer(self.values, dtype=numpy.float64).copy()
+        if kind == 'datetime':
+            return numpy.frombuffer(self.values, dtype=numpy.int64).view('datetime64[us]').copy()
+        if kind == 'category':
+            return numpy.frombuffer(self.values, dtype=numpy.int32).copy()
+        values = numpy.empty(self._length, dtype=object)
+        if kind is not None:
+            values[:] = self.values
+        return values
+
+    def to_pandas(self):
+        """The values as a pandas Series, category columns as pandas Categoricals; needs pandas"""
+        import pandas
+
+        if self.kind == 'category':
+            categorical = pandas.Categorical.from_codes(self.to_numpy(), self.categories)
+            return pandas.Series(categorical, name=self.name)
+        return pandas.Series(self.to_numpy(), name=self.name)
+
+    def __repr__(self) -> str:
+        return 'Column({!r}, kind={!r}, length={})'.format(self.name, self.kind, self._length)
+
+
+class Columns(typing.Mapping[str, Column]):
+    """The columns collected by collect_columns, in field order"""
+
+    def __init__(self, columns: typing.List[Column]):
+        self._columns = {column.name: column for column in columns}
+
+    def __getitem__(self, name: str) -> Column:
+        return self._columns[name]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @property
+    def num_rows(self) -> int:
+        for column in self._columns.values():
+            return len(column)
+        return 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values())
+
+    def to_numpy(self) -> typing.Dict[str, typing.Any]:
+        """The numpy array of each column, see Column.to_numpy"""
+        return {name: column.to_numpy() for name, column in self._columns.items()}
+
+    def to_pandas(self):
+        """A pandas DataFrame of the columns, requires pandas"""
+        import pandas
+
+        return pandas.DataFrame(
+            {name: column.to_pandas() for name, column in self._columns.items()})
+
+
+def _kind_from_model(model: typing.Type[Schema], path: typing.List[str]) -> typing.Optional[str]:
+    compiled = CompiledSchema.for_schema_classes((Schema._get_class_oapg(model),))
+    for name in path:
+        compiled = compiled.property_schema(name)
+        if compiled is None:
+            return None
+    if len(compiled.types - {NoneClass}) != 1:
+        # any type or composed schemas
+        return None
+    classes = compiled.classes
+    for bases, kind in (
+        ((DateTimeBase, DateBase), 'datetime'),
+        ((EnumBase,), 'category'),
+        ((IntBase,), 'int'),
+        ((NumberBase,), 'float'),
+        ((BoolBase,), 'bool'),
+    ):
+        if any(issubclass(schema_cls, bases) for schema_cls in classes):
+            return kind
+    return None
+
+
+def collect_columns(
+    items: typing.Iterable[typing.Any],
+    fields: typing.Sequence[str],
+    kinds: typing.Optional[typing.Dict[str, str]] = None,
+    model: typing.Optional[typing.Type[Schema]] = None,
+    timestamps: typing.Collection[str] = DEFAULT_TIMESTAMPS,
+    max_categories: int = DEFAULT_MAX_CATEGORIES,
+) -> Columns:
+    """
+    Accumulates fields of the items into typed column buffers without building a model per row
+    Items are decoded json dicts, e.g. from
+    pagination.iter_mints(api_client, response_format='python', fields=fields); schema instances
+    and other mappings work too. The kind of each column is taken from kinds, then from the
+    property's schema in model, and is otherwise inferred from the first value that is not
+    missing: numbers become int64 or float64 columns, str values category columns (dictionary
+    encoded until they have more than max_categories distinct values) and date/date-time strings
+    of datetime columns numpy datetime64[us] values.
+
+    :param fields: the property names to collect, nested properties are dotted e.g. 'location.city'
+    :param kinds: column kinds by field name, one of KINDS
+    :param model: the Schema class of the items, used to choose the column kinds
+    :param timestamps: the fields holding unix timestamps in seconds, collected as datetime columns
+    :return: the Columns, one per field
+    """
+    kinds = dict(kinds or {})
+    columns = []
+    for field in fields:
+        kind = kinds.get(field)
+        if kind is None and field in timestamps:
+            kind = 'datetime'
+        if kind is None and model is not None:
+            kind = _kind_from_model(model, field.split('.'))
+        columns.append(Column(
+            field, kind, timestamp=field in timestamps, max_categories=max_categories))
+    getters = []
+    for column in columns:
+        path = column.name.split('.')
+        getters.append((column.append, path[0], path[1:]))
+    for item in items:
+        for append, name, nested in getters:
+            value = item.get(name)
+            for name in nested:
+                if value is None:
+                    break
+                value = value.get(name)
+            append(value)
+    return Columns(columns)
@@ -0,0 +1,137 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import collections
+from dataclasses import dataclass, field
+import threading
+import time
+import typing
+
+from versify.exceptions import ApiValueError
+
+# statuses that mean the server is overloaded
+OVERLOAD_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+@dataclass
+class ConcurrencyStats:
+    limit: int = 0
+    # the baseline latency of each operation
+    min_latencies: typing.Dict[typing.Optional[str], float] = field(default_factory=dict)
+    requests: int = 0
+    increases: int = 0
+    decreases: int = 0
+
+
+class AdaptiveConcurrency:
+    """
+    An AIMD limit of the requests in flight, driven by the latency and the errors of responses
+
+    Every request sent by an ApiClient with this limiter reports its latency and whether it
+    failed, i.e. raised or got one of OVERLOAD_STATUSES. A success within latency_tolerance
+    times the lowest latency of the last window requests of the same operation, e.g.
+    'GET /v2/contacts/{id}', adds increase / limit, so the limit grows by increase per limit
+    requests; a failure or a slower response multiplies it by decrease. Every operation has
+    its own baseline, so slow list pages are not compared with fast gets. Only one decrease
+    is applied per round trip: responses to requests sent before the last decrease do not
+    decrease it again. ApiClient.map, and through it the batch and
+    bulk helpers, and the prefetch of pagination.Paginator keep at most limit requests in flight.
+
+    :param initial_limit: the limit before any response was seen
+    :param min_limit: the lowest limit
+    :param max_limit: the highest limit, the pool_threads of the client cap it as well
+    :param increase: the limit added per limit successful requests
+    :param decrease: the factor a failure or a slow response multiplies the limit by
+    :param latency_tolerance: how many times slower than the lowest latency a response may be
+        before it counts as a sign of overload
+    :param window: the requests per operation whose lowest latency is the baseline
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        decrease: float = 0.7,
+        latency_tolerance: float = 2.0,
+        window: int = 500,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ApiValueError(
+                'min_limit <= initial_limit <= max_limit must hold and min_limit be at least 1')
+        if not 0 < decrease < 1:
+            raise ApiValueError('decrease must be between 0 and 1')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self.clock = clock
+        self._limit = float(initial_limit)
+        self._latencies: typing.Dict[typing.Optional[str], typing.Deque[float]] = {}
+        self._decreased_at = float('-inf')
+        self._stats = ConcurrencyStats(limit=initial_limit)
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """The number of requests that may be in flight"""
+        return int(self._limit)
+
+    def is_failure(self, status: typing.Optional[int]) -> bool:
+        """Whether a response with status, None for a request that raised, is a sign of overload"""
+        return status is None or status in OVERLOAD_STATUSES
+
+    def record(
+        self, started: float, status: typing.Optional[int], operation: typing.Optional[str] = None
+    ):
+        """
+        Adjusts the limit to a completed request
+
+        :param started: the clock time the request was sent at
+        :param status: the status of the response, None when the request raised
+        :param operation: the operation whose latencies the request is compared with,
+            e.g. 'GET /v2/contacts/{id}'
+        """
+        with self._lock:
+            now = self.clock()
+            latency = now - started
+            self._stats.requests += 1
+            overloaded = self.is_failure(status)
+            if not overloaded:
+                latencies = self._latencies.get(operation)
+                if latencies is None:
+                    latencies = self._latencies[operation] = collections.deque(maxlen=self.window)
+                latencies.append(latency)
+                overloaded = latency > self.latency_tolerance * min(latencies)
+            if overloaded:
+                if started >= self._decreased_at:
+                    self._limit = max(self.min_limit, self._limit * self.decrease)
+                    self._decreased_at = now
+                    self._stats.decreases += 1
+            elif self._limit < self.max_limit:
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+                self._stats.increases += 1
+
+    def stats(self) -> ConcurrencyStats:
+        """A snapshot of the current limit, the baseline latencies and the counters"""
+        with self._lock:
+            return ConcurrencyStats(
+                limit=self.limit,
+                min_latencies={
+                    operation: min(latencies) for operation, latencies in self._latencies.items()},
+                requests=self._stats.requests,
+                increases=self._stats.increases,
+                decreases=self._stats.decreases,
+            )
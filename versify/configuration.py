@@ -155,6 +155,19 @@ class Configuration(object):
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
         """
+        self.connection_pool_block = False
+        """If True a request waits for a pooled connection while connection_pool_maxsize
+           are in use, instead of opening a connection that is discarded afterwards.
+        """
+        self.connection_pool_idle_timeout = None
+        """The seconds a pooled connection may stay idle and still be reused; older ones
+           are closed and reopened, e.g. shorter than the keep-alive timeout of a proxy.
+        """
+        self.connection_pool_per_host = {}
+        """maxsize, block and idle_timeout overrides by host, e.g.
+           {'api.versifylabs.com': {'maxsize': 64, 'block': True, 'idle_timeout': 30}}.
+           RESTClientObject.pool_stats() reports the connections of each host.
+        """
 
         self.proxy = None
         """Proxy URL
@@ -171,6 +184,18 @@ class Configuration(object):
         # Enable client side validation
         self.client_side_validation = True
 
+        self.validate_responses = True
+        """Set this to False to build response models from trusted server data
+           without schema validation; values are only cast to their allowed types.
+           Can be overridden per call with the validate_responses argument.
+        """
+
+        self.fields_query_param = None
+        """The query parameter the fields projection of an operation is sent in,
+           e.g. 'fields'. None (the default) applies projections client side only,
+           as the Versify API does not support them yet.
+        """
+
         # Options to pass down to the underlying urllib3 socket
         self.socket_options = None
 
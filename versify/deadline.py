@@ -0,0 +1,86 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import time
+import typing
+
+from versify.exceptions import ApiValueError, DeadlineExceededError
+
+
+class Deadline:
+    """
+    The time a chain of requests must finish by
+
+    Pass a Deadline as the timeout of an operation, a pagination helper, batch.get_many or a
+    bulk helper. Every request then gets the time left as its timeout, capped by
+    request_timeout, and retries and rate limit waits that would end after the deadline are
+    given up. Once it passed, no request is sent and DeadlineExceededError is raised instead.
+
+    Example:
+        deadline = Deadline(2.0, request_timeout=0.5)
+        me = users_me_api.get(timeout=deadline)
+        contacts = list(pagination.iter_resource(api_client, 'contacts', timeout=deadline))
+
+    :param seconds: the seconds from now the deadline is at
+    :param request_timeout: the longest timeout of a single request
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        request_timeout: typing.Optional[float] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if seconds < 0:
+            raise ApiValueError('seconds must not be negative')
+        self.clock = clock
+        self.expires_at = clock() + seconds
+        self.request_timeout = request_timeout
+
+    def __repr__(self):
+        return '{}(remaining={:.3f})'.format(type(self).__name__, self.remaining())
+
+    def remaining(self) -> float:
+        """The seconds left, 0 once the deadline passed"""
+        return max(0.0, self.expires_at - self.clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.clock() >= self.expires_at
+
+    def exceeded(self) -> DeadlineExceededError:
+        late = self.clock() - self.expires_at
+        return DeadlineExceededError(reason='Deadline exceeded by {:.3f}s'.format(late))
+
+    def check(self):
+        """Raises DeadlineExceededError once the deadline passed"""
+        if self.expired:
+            raise self.exceeded()
+
+    def timeout(self) -> float:
+        """The timeout of the next request, raises DeadlineExceededError once it passed"""
+        remaining = self.expires_at - self.clock()
+        if remaining <= 0:
+            raise self.exceeded()
+        if self.request_timeout is not None:
+            return min(remaining, self.request_timeout)
+        return remaining
+
+    def budget(self, seconds: float, request_timeout: typing.Optional[float] = None) -> 'Deadline':
+        """A Deadline at most seconds from now that does not end after this one, for one step"""
+        deadline = Deadline(seconds, request_timeout or self.request_timeout, self.clock)
+        deadline.expires_at = min(deadline.expires_at, self.expires_at)
+        return deadline
+
+
+def time_left(deadline: typing.Optional[Deadline]) -> typing.Optional[float]:
+    """The seconds left until deadline, None without one"""
+    return None if deadline is None else deadline.remaining()
@@ -136,6 +136,30 @@ class ApiException(OpenApiException, typing.Generic[T]):
         return error_message
 
 
+@dataclasses.dataclass
+class CircuitOpenError(ApiException):
+    """
+    Raised without sending a request while the circuit of its host and path template is open
+
+    status is 503 so callers treat it like the server being unavailable; retry_in is the
+    seconds until the circuit lets a probe request through again.
+    """
+    status: int = 503
+    reason: str = 'Circuit open'
+    retry_in: float = 0.0
+
+
+@dataclasses.dataclass
+class DeadlineExceededError(ApiException):
+    """
+    Raised instead of sending a request, or waiting to send it, after its deadline.Deadline passed
+
+    status is 504 so callers treat it like a gateway timeout.
+    """
+    status: int = 504
+    reason: str = 'Deadline exceeded'
+
+
 def render_path(path_to_item):
     """Returns a string representation of a path"""
     result = ""
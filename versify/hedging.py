@@ -0,0 +1,233 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+from dataclasses import dataclass
+import threading
+import time
+import typing
+
+import urllib3
+
+from versify.exceptions import ApiValueError
+from versify.retry import RetryBudget
+
+T = typing.TypeVar('T')
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    delay: typing.Optional[float] = None
+
+
+def _release(future: concurrent.futures.Future):
+    """Returns the connection of a losing request to the pool"""
+    if not future.cancelled() and future.exception() is None:
+        response = future.result()
+        if isinstance(response, urllib3.HTTPResponse):
+            response.release_conn()
+
+
+class HedgingPolicy:
+    """
+    Sends a second request when a GET takes longer than usual, and uses whichever answers first
+
+    The latencies of the last window requests of each operation, e.g. 'GET /v2/users/me', are
+    kept; once min_samples are known a request still waiting after their percentile is sent
+    again on another pooled connection. The first successful response is returned and the other
+    request is cancelled, or its connection released when it completes. Hedges are paid from a
+    retry.RetryBudget, so they add at most max_hedge_rate extra load.
+
+    ApiClient has to wait for both requests, so it sends a request on the executor of the policy
+    only when the budget can pay for its hedge, and otherwise on the calling thread. The delay
+    counts from when the request starts on the executor, and a request the busy executor did not
+    start within the delay is sent on the calling thread instead.
+
+    :param paths: the path templates that are hedged, e.g. {'/v2/contacts/{id}', '/v2/users/me'};
+        None hedges every GET
+    :param percentile: the latency percentile after which a request is hedged
+    :param min_samples: the latencies an operation needs before its requests are hedged
+    :param window: the latencies kept per operation
+    :param max_hedge_rate: the hedges allowed per request sent
+    :param max_workers: the threads ApiClient sends hedged requests on
+    """
+
+    def __init__(
+        self,
+        paths: typing.Optional[typing.Collection[str]] = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200,
+        max_hedge_rate: float = 0.05,
+        max_workers: int = 32,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < percentile < 1:
+            raise ApiValueError('percentile must be between 0 and 1')
+        if min_samples < 1 or window < min_samples:
+            raise ApiValueError('min_samples must be at least 1 and window at least min_samples')
+        self.paths = None if paths is None else frozenset(paths)
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.budget = RetryBudget(ratio=max_hedge_rate, reserve=1.0)
+        self.max_workers = max_workers
+        self.clock = clock
+        self._latencies: typing.Dict[str, typing.Deque[float]] = {}
+        self._stats: typing.Dict[str, HedgeStats] = {}
+        self._lock = threading.Lock()
+        self._executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def applies(self, method: str, path: str) -> bool:
+        return method == 'GET' and (self.paths is None or path in self.paths)
+
+    def observe(self, operation: str, seconds: float):
+        """Records the latency of a request of operation"""
+        with self._lock:
+            latencies = self._latencies.get(operation)
+            if latencies is None:
+                latencies = self._latencies[operation] = collections.deque(maxlen=self.window)
+            latencies.append(seconds)
+
+    def delay(self, operation: str) -> typing.Optional[float]:
+        """The seconds after which a request of operation is hedged, None before min_samples"""
+        with self._lock:
+            latencies = self._latencies.get(operation)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            ordered = sorted(latencies)
+        return ordered[int(self.percentile * (len(ordered) - 1))]
+
+    def _count(self, operation: str, counter: str):
+        with self._lock:
+            stats = self._stats.get(operation)
+            if stats is None:
+                stats = self._stats[operation] = HedgeStats()
+            setattr(stats, counter, getattr(stats, counter) + 1)
+
+    def stats(self) -> typing.Dict[str, HedgeStats]:
+        """A snapshot of the counters and the current hedge delay of each operation"""
+        with self._lock:
+            stats = {
+                operation: HedgeStats(**stats.__dict__)
+                for operation, stats in self._stats.items()
+            }
+        for operation, operation_stats in stats.items():
+            operation_stats.delay = self.delay(operation)
+        return stats
+
+    def _start(self, operation: str) -> typing.Optional[float]:
+        self.budget.deposit()
+        self._count(operation, 'requests')
+        return self.delay(operation)
+
+    def _timed(self, operation: str, send: typing.Callable[[], T]) -> typing.Callable[[], T]:
+        def timed():
+            start = self.clock()
+            result = send()
+            self.observe(operation, self.clock() - start)
+            return result
+        return timed
+
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='versify-hedge')
+            return self._executor
+
+    def close(self):
+        """Stops the threads of the executor, ApiClient.close calls it"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def send(self, operation: str, send: typing.Callable[[], T]) -> T:
+        """Calls send, and calls it again on another thread when the first call is slow"""
+        delay = self._start(operation)
+        send = self._timed(operation, send)
+        if delay is None or self.budget.balance < 1:
+            # no hedge can be sent, so the request is sent on the calling thread
+            return send()
+        started = threading.Event()
+
+        def primary_send():
+            started.set()
+            return send()
+
+        primary = self.executor.submit(primary_send)
+        if not started.wait(delay) and primary.cancel():
+            # the pool is busy; waiting for it must not count as the latency of the request
+            return send()
+        done, _ = concurrent.futures.wait([primary], timeout=delay)
+        if done or not self.budget.withdraw():
+            return primary.result()
+        self._count(operation, 'hedged')
+        hedge = self.executor.submit(send)
+        winner = None
+        for future in concurrent.futures.as_completed([primary, hedge]):
+            if future.exception() is None:
+                winner = future
+                break
+        for future in (primary, hedge):
+            if future is not winner:
+                future.cancel()
+                future.add_done_callback(_release)
+        if winner is None:
+            # both failed
+            return primary.result()
+        if winner is hedge:
+            self._count(operation, 'hedge_wins')
+        return winner.result()
+
+    async def send_async(
+        self, operation: str, send: typing.Callable[[], typing.Awaitable[T]]
+    ) -> T:
+        """Awaits send(), and sends it again when it is slow, cancelling the slower request"""
+        delay = self._start(operation)
+
+        async def timed():
+            start = self.clock()
+            result = await send()
+            self.observe(operation, self.clock() - start)
+            return result
+
+        if delay is None:
+            return await timed()
+        primary = asyncio.ensure_future(timed())
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self.budget.withdraw():
+                return await primary
+            self._count(operation, 'hedged')
+            hedge = asyncio.ensure_future(timed())
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._count(operation, 'hedge_wins')
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -0,0 +1,164 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import typing
+
+import frozendict
+
+from versify.configuration import Configuration
+from versify.exceptions import ApiTypeError
+from versify.schemas import CompiledSchema, Schema, Unset, unset
+
+
+class LazyModel:
+    """
+    A model built from decoded json whose properties are validated and built on first access
+    Only the object itself is checked when the LazyModel is made: its type, its required
+    properties and its other object keywords. Each property value is validated and built into its
+    schema class instance the first time it is read and the instance is cached, so validation
+    errors of a property are raised when that property is accessed. Properties that are never
+    read are never built. to_model() builds the eager instance of the whole object.
+    """
+    __slots__ = ('_compiled', '_data', '_configuration', '_validate', '_disabled', '_cache')
+
+    def __init__(
+        self,
+        compiled: CompiledSchema,
+        data: typing.Dict[str, typing.Any],
+        _configuration: typing.Optional[Configuration] = None,
+        validate: bool = True,
+    ):
+        self._compiled = compiled
+        self._data = data
+        self._configuration = _configuration
+        self._validate = validate
+        self._disabled = ()
+        if _configuration is not None:
+            self._disabled = getattr(
+                _configuration, '_disabled_client_side_validations', None) or ()
+        self._cache = {}
+
+    @classmethod
+    def from_server_data(
+        cls,
+        model: typing.Type[Schema],
+        data: typing.Any,
+        _configuration: typing.Optional[Configuration] = None,
+        validate: typing.Optional[bool] = None,
+    ) -> typing.Union['LazyModel', Schema]:
+        """
+        Makes the LazyModel of an object response
+        Values that are not objects, and objects of oneOf/anyOf/not/discriminator schemas, are
+        built eagerly with model.from_server_data_oapg.
+
+        :param validate: whether values are validated,
+            defaults to _configuration.validate_responses
+        """
+        if validate is None:
+            validate = _configuration is None or _configuration.validate_responses
+        compiled = CompiledSchema.for_schema_classes((Schema._get_class_oapg(model),))
+        if (
+            type(data) is not dict
+            or compiled.interpreted
+            or compiled.composed
+            or frozendict.frozendict not in compiled.types
+        ):
+            return model.from_server_data_oapg(
+                data, _configuration=_configuration, validate=validate)
+        if validate:
+            checks = compiled.checks(frozendict.frozendict)
+            if checks is None:
+                return model.from_server_data_oapg(
+                    data, _configuration=_configuration, validate=validate)
+            instance = cls(compiled, data, _configuration=_configuration, validate=validate)
+            for keyword, check in checks:
+                if keyword is None or keyword not in instance._disabled:
+                    check(data, ('args[0]',))
+            return instance
+        return cls(compiled, data, _configuration=_configuration, validate=validate)
+
+    @property
+    def model(self) -> typing.Type[Schema]:
+        """The Schema class the object is validated against"""
+        return self._compiled.primary
+
+    def __getitem__(self, name: str) -> Schema:
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        value = self._data[name]
+        compiled = self._compiled.property_schema(name)
+        if compiled is None:
+            raise ApiTypeError(
+                '{} was passed 1 invalid argument: {}'.format(self.model.__name__, [name]))
+        built = self._cache[name] = compiled._build(
+            value, self._configuration, self._validate, True, self._disabled, ('args[0]', name))
+        return built
+
+    def __getattr__(self, name: str) -> Schema:
+        # only called for names that are not LazyModel attributes
+        if name.startswith('__') or name not in self._data:
+            raise AttributeError("{} has no attribute '{}'".format(self.model.__name__, name))
+        return self[name]
+
+    def get_item_oapg(self, name: str) -> typing.Union[Schema, Unset]:
+        if name not in self._data:
+            return unset
+        return self[name]
+
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        if name not in self._data:
+            return default
+        return self[name]
+
+    def keys(self) -> typing.KeysView:
+        return self._data.keys()
+
+    def items(self) -> typing.Iterator[typing.Tuple[str, Schema]]:
+        for name in self._data:
+            yield name, self[name]
+
+    def values(self) -> typing.Iterator[Schema]:
+        for name in self._data:
+            yield self[name]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._data
+
+    def is_built(self, name: str) -> bool:
+        """Whether the property has been validated and built"""
+        return name in self._cache
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """The decoded json the object was made from"""
+        return dict(self._data)
+
+    def to_model(self) -> Schema:
+        """Validates and builds the whole object, as the eager deserialization does"""
+        return self._compiled.build(self._data, self._configuration, validate=self._validate)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not isinstance(other, LazyModel):
+            return NotImplemented
+        return self._compiled is other._compiled and self._data == other._data
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return 'LazyModel({}, {!r})'.format(self.model.__name__, self._data)
+
@@ -0,0 +1,392 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import collections
+from dataclasses import dataclass
+import json
+import math
+import typing
+
+import urllib3
+
+from versify import slots
+from versify.api_client import ApiClient, AsyncApiClient, project_json
+from versify.deadline import Deadline
+from versify.exceptions import ApiTypeError, ApiValueError
+from versify.lazy import LazyModel
+from versify.resources import Resource, get_resource
+from versify.schemas import Schema
+from versify.streaming import StreamingList
+
+DEFAULT_PAGE_SIZE = 100
+
+
+@dataclass
+class Page:
+    """One decoded page of a list operation
+
+    items holds the decoded json objects of the page's data array; they are
+    validated against the resource model when iterated through a Paginator.
+    """
+    page_num: int
+    items: typing.List[typing.Dict[str, typing.Any]]
+    count: typing.Optional[int] = None
+    has_more: bool = False
+
+
+class Paginator:
+    """Iterates over every item of a /v2/<resource> list operation.
+
+    Pages are requested lazily as iteration proceeds. With prefetch=N the next N
+    pages are requested on the client's executor while the current page is being
+    consumed, so at most N + 1 pages are held in memory at any time.
+
+    ApiListResponse declares its data items as Account for every resource, so
+    pages are fetched with skip_deserialization and each item is validated
+    against the resource's own model instead.
+
+    :param api_client: the ApiClient requests are made with, an AsyncApiClient raises ApiTypeError
+    :param resource: a resource name like 'contacts' or a Resource
+    :param page_size: the number of items requested per page
+    :param prefetch: the number of pages requested ahead of the current one, capped by the
+        limit of the client's concurrency_limiter
+    :param query_params: extra list filters, e.g. {'status': 'active'}
+    :param header_params: header parameters, e.g. {'Versify-Account': 'acc_123'}
+    :param start_page: the first page to request, pages are numbered from 1
+    :param timeout: the timeout of each page request, or a deadline.Deadline every page
+        request has to complete by
+    :param stream: if True each page is requested with stream=True and its items
+        are decoded and validated as they are read from the socket, so only one
+        item rather than one page is held in memory. Cannot be combined with prefetch.
+    :param validate_responses: whether items are validated against the resource model,
+        defaults to configuration.validate_responses
+    :param response_format: 'schema' yields resource model instances, 'lazy' yields
+        lazy.LazyModel instances that validate and build each property on first access,
+        'python' yields the decoded json dicts without building models and 'slots' the
+        slots.SlotsModel instances of the resource model
+    :param fields: the properties built for each item, e.g. ('_id', 'email'); other
+        properties are dropped while decoding. Cannot be combined with response_format='slots'.
+    """
+
+    def __init__(
+        self,
+        api_client: ApiClient,
+        resource: typing.Union[str, Resource],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        query_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        start_page: int = 1,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+        stream: bool = False,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
+    ):
+        if isinstance(api_client, AsyncApiClient):
+            raise ApiTypeError('pagination needs a blocking ApiClient')
+        if page_size < 1:
+            raise ApiValueError('page_size must be greater than 0')
+        if prefetch < 0:
+            raise ApiValueError('prefetch must not be negative')
+        if stream and prefetch:
+            raise ApiValueError('prefetch cannot be combined with stream')
+        if response_format not in ('schema', 'lazy', 'python', 'slots'):
+            raise ApiValueError("response_format must be 'schema', 'lazy', 'python' or 'slots'")
+        if fields is not None and response_format == 'slots':
+            raise ApiValueError("fields cannot be combined with response_format='slots'")
+        self.api_client = api_client
+        self.resource = get_resource(resource)
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.query_params = dict(query_params or {})
+        self.header_params = dict(header_params or {})
+        self.start_page = start_page
+        self.timeout = timeout
+        self.stream = stream
+        self.validate_responses = validate_responses
+        self.response_format = response_format
+        self.fields = None if fields is None else tuple(fields)
+        self._api = self.resource.collection_api('get', api_client)
+
+    def _request_page(self, page_num: int, stream: bool = False) -> urllib3.HTTPResponse:
+        kwargs = {}
+        query_params = dict(self.query_params)
+        if self.resource.paginated:
+            query_params.update(page_num=page_num, page_size=self.page_size)
+        if query_params:
+            kwargs['query_params'] = query_params
+        if self.header_params:
+            kwargs['header_params'] = self.header_params
+        api_response = self._api.get(
+            skip_deserialization=True, stream=stream, timeout=self.timeout, fields=self.fields,
+            **kwargs)
+        return api_response.response
+
+    def fetch_page(self, page_num: int) -> Page:
+        """Requests and decodes one page"""
+        return self.decode_page(page_num, self._request_page(page_num).data)
+
+    def stream_page(self, page_num: int) -> StreamingList:
+        """Requests one page, its items are decoded as they are read from the socket"""
+        return StreamingList(
+            self._request_page(page_num, stream=True),
+            model=self.model,
+            configuration=self.api_client.configuration,
+            validate_responses=self.validate_responses,
+            # items yielded as json are projected by build_item
+            fields=self.fields if self.model is not None else None,
+        )
+
+    @property
+    def model(self) -> typing.Optional[typing.Type[Schema]]:
+        """The Schema class items are built with, None when items are not schema instances"""
+        if self.response_format != 'schema':
+            return None
+        return self.resource.model
+
+    def build_item(
+        self,
+        item: typing.Dict[str, typing.Any]
+    ) -> typing.Union[Schema, LazyModel, slots.SlotsModel, typing.Dict[str, typing.Any]]:
+        model = self.model
+        if model is None:
+            if self.response_format == 'lazy':
+                return LazyModel.from_server_data(
+                    self.resource.model, item, _configuration=self.api_client.configuration,
+                    validate=self.validate_responses)
+            if self.response_format == 'slots':
+                return slots.from_json(self.resource.model, item)
+            return project_json(item, self.fields)
+        return model.from_server_data_oapg(
+            item, _configuration=self.api_client.configuration, validate=self.validate_responses,
+            fields=self.fields)
+
+    def decode_page(self, page_num: int, data: bytes) -> Page:
+        body = json.loads(data)
+        return Page(
+            page_num=page_num,
+            items=body.get('data') or [],
+            count=body.get('count'),
+            has_more=bool(self.resource.paginated and body.get('has_more')),
+        )
+
+    def last_page(self, page: Page) -> typing.Optional[int]:
+        """The last page number implied by a page's count, if the server sent one"""
+        if page.count is None:
+            return None
+        return max(math.ceil(page.count / self.page_size), 1)
+
+    def pages(self) -> typing.Iterator[Page]:
+        """Yields the pages in order, stopping after the first page without has_more"""
+        page = self.fetch_page(self.start_page)
+        yield page
+        if not page.has_more or not page.items:
+            return
+        last_page = self.last_page(page)
+        next_page_num = page.page_num + 1
+        window = self.prefetch + 1
+        pending = collections.deque()
+
+        def fill():
+            # count only bounds how far ahead pages are prefetched, the page after one with
+            # has_more is always requested, so items added during the scan are not dropped
+            nonlocal next_page_num
+            while (len(pending) < self.api_client.concurrency_window(window)
+                   and (not pending or last_page is None or next_page_num <= last_page)):
+                if self.prefetch:
+                    pending.append(self.api_client.submit(self.fetch_page, page_num=next_page_num))
+                else:
+                    pending.append(next_page_num)
+                next_page_num += 1
+
+        try:
+            fill()
+            while pending:
+                head = pending.popleft()
+                page = head.result() if self.prefetch else self.fetch_page(head)
+                if not page.has_more or not page.items:
+                    yield page
+                    return
+                if last_page is not None:
+                    last_page = max(last_page, self.last_page(page) or last_page)
+                fill()
+                yield page
+        finally:
+            for future in pending:
+                if self.prefetch:
+                    future.cancel()
+
+    def _streamed_items(self) -> typing.Iterator[Schema]:
+        page_num = self.start_page
+        while True:
+            items = self.stream_page(page_num)
+            empty = True
+            for item in items:
+                empty = False
+                yield item if self.model is not None else self.build_item(item)
+            if empty or not self.resource.paginated or not items.has_more:
+                return
+            page_num += 1
+
+    def __iter__(self) -> typing.Iterator[Schema]:
+        if self.stream:
+            yield from self._streamed_items()
+            return
+        for page in self.pages():
+            for item in page.items:
+                yield self.build_item(item)
+
+
+def iter_resource(
+    api_client: ApiClient,
+    resource: typing.Union[str, Resource],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    query_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+    stream: bool = False,
+    validate_responses: typing.Optional[bool] = None,
+    response_format: str = 'schema',
+    fields: typing.Optional[typing.Tuple[str, ...]] = None,
+) -> typing.Iterator[Schema]:
+    """Lazily yields every item of a resource, see Paginator"""
+    return iter(Paginator(
+        api_client,
+        resource,
+        page_size=page_size,
+        prefetch=prefetch,
+        query_params=query_params,
+        header_params=header_params,
+        timeout=timeout,
+        stream=stream,
+        validate_responses=validate_responses,
+        response_format=response_format,
+        fields=fields,
+    ))
+
+
+def _iter_function(resource_name: str):
+    resource = get_resource(resource_name)
+
+    def iter_items(
+        api_client: ApiClient,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        query_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+        stream: bool = False,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
+    ) -> typing.Iterator[Schema]:
+        return iter_resource(
+            api_client,
+            resource,
+            page_size=page_size,
+            prefetch=prefetch,
+            query_params=query_params,
+            header_params=header_params,
+            timeout=timeout,
+            stream=stream,
+            validate_responses=validate_responses,
+            response_format=response_format,
+            fields=fields,
+        )
+
+    iter_items.__name__ = iter_items.__qualname__ = 'iter_' + resource_name
+    iter_items.__doc__ = 'Lazily yields every {} instance of /v2/{}, see Paginator'.format(
+        resource.model_name, resource_name)
+    return iter_items
+
+
+iter_accounts = _iter_function('accounts')
+iter_assets = _iter_function('assets')
+iter_claims = _iter_function('claims')
+iter_collections = _iter_function('collections')
+iter_contacts = _iter_function('contacts')
+iter_events = _iter_function('events')
+iter_journeys = _iter_function('journeys')
+iter_messages = _iter_function('messages')
+iter_mints = _iter_function('mints')
+iter_notes = _iter_function('notes')
+iter_redemptions = _iter_function('redemptions')
+iter_rewards = _iter_function('rewards')
+iter_tags = _iter_function('tags')
+iter_webhooks = _iter_function('webhooks')
+
+
+def fetch_all(
+    api_client: ApiClient,
+    resource: typing.Union[str, Resource],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: typing.Optional[int] = None,
+    query_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple, Deadline]] = None,
+    validate_responses: typing.Optional[bool] = None,
+    response_format: str = 'schema',
+    fields: typing.Optional[typing.Tuple[str, ...]] = None,
+) -> typing.List[Schema]:
+    """Fetches every item of a resource, requesting pages concurrently.
+
+    The first page's count gives the number of pages; the remaining pages are
+    then requested over the client's executor with at most concurrency requests
+    in flight and reassembled in page order. Items inserted while the scan runs
+    shift later items onto the next page, so items are de-duplicated on _id, and
+    pages past the initial count are followed sequentially while has_more is set.
+
+    :param concurrency: the maximum number of pages in flight, defaults to the
+        client's pool_threads
+    :param validate_responses: whether items are validated against the resource model,
+        defaults to configuration.validate_responses
+    :param response_format: 'lazy' returns lazy.LazyModel instances, 'python' the decoded
+        json dicts and 'slots' the slots.SlotsModel instances instead of models
+    :return: the items in list order
+    """
+    paginator = Paginator(
+        api_client,
+        resource,
+        page_size=page_size,
+        query_params=query_params,
+        header_params=header_params,
+        timeout=timeout,
+        validate_responses=validate_responses,
+        response_format=response_format,
+        fields=fields,
+    )
+    seen_ids = set()
+    items = []
+
+    def add(page: Page):
+        for item in page.items:
+            item_id = item.get('_id')
+            if item_id is not None:
+                if item_id in seen_ids:
+                    continue
+                seen_ids.add(item_id)
+            items.append(paginator.build_item(item))
+
+    page = paginator.fetch_page(paginator.start_page)
+    add(page)
+    if page.has_more and page.items:
+        last_page = paginator.last_page(page) or page.page_num
+        page_nums = range(page.page_num + 1, last_page + 1)
+        for page in api_client.map(
+                paginator.fetch_page, ({'page_num': n} for n in page_nums),
+                max_workers=concurrency):
+            add(page)
+        while page.has_more and page.items:
+            page = paginator.fetch_page(page.page_num + 1)
+            add(page)
+    return items
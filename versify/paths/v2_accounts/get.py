@@ -66,6 +66,9 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -78,6 +81,9 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -86,6 +92,9 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -97,6 +106,9 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
         skip_deserialization: bool = False,
     ):
         """
@@ -104,6 +116,14 @@ class BaseApi(api_client.Api):
         :param skip_deserialization: If true then api_response.response will be set but
             api_response.body and api_response.headers will not be deserialized into schema
             class instances
+        :param validate_responses: If false then the response body is built from the trusted
+            server data without schema validation, defaults to configuration.validate_responses
+        :param response_format: 'lazy' builds the properties of the body on first access with
+            versify.lazy, 'python' returns the json.loads output of the body, 'slots' the body
+            converted by versify.slots and 'bytes' the undecoded body in an
+            api_client.ApiResponseWithoutSchema instead of schema class instances
+        :param fields: the properties built for the body, or for each data item of a list or search
+            response, e.g. ('_id', 'email'); other properties are dropped while decoding
         """
         used_path = path.value
 
@@ -113,33 +133,20 @@ class BaseApi(api_client.Api):
             for accept_content_type in accept_content_types:
                 _headers.add('Accept', accept_content_type)
 
-        response = self.api_client.call_api(
+        return self.api_client.call_operation(
             resource_path=used_path,
             method='get'.upper(),
+            status_code_to_response=_status_code_to_response,
             headers=_headers,
             auth_settings=_auth,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
+            projection=fields,
+            skip_deserialization=skip_deserialization,
         )
 
-        if skip_deserialization:
-            api_response = api_client.ApiResponseWithoutDeserialization(response=response)
-        else:
-            response_for_status = _status_code_to_response.get(str(response.status))
-            if response_for_status:
-                api_response = response_for_status.deserialize(response, self.api_client.configuration)
-            else:
-                api_response = api_client.ApiResponseWithoutDeserialization(response=response)
-
-        if not 200 <= response.status <= 299:
-            raise exceptions.ApiException(
-                status=response.status,
-                reason=response.reason,
-                api_response=api_response
-            )
-
-        return api_response
-
 
 class ListAccountsV2AccountsGet(BaseApi):
     # this class is used by api classes that refer to endpoints with operationId fn names
@@ -150,6 +157,9 @@ class ListAccountsV2AccountsGet(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -162,6 +172,9 @@ class ListAccountsV2AccountsGet(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -170,6 +183,9 @@ class ListAccountsV2AccountsGet(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -181,12 +197,18 @@ class ListAccountsV2AccountsGet(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
         skip_deserialization: bool = False,
     ):
         return self._list_accounts_v2_accounts_get_oapg(
             accept_content_types=accept_content_types,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
+            fields=fields,
             skip_deserialization=skip_deserialization
         )
 
@@ -200,6 +222,9 @@ class ApiForget(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -212,6 +237,9 @@ class ApiForget(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -220,6 +248,9 @@ class ApiForget(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -231,12 +262,18 @@ class ApiForget(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
         skip_deserialization: bool = False,
     ):
         return self._list_accounts_v2_accounts_get_oapg(
             accept_content_types=accept_content_types,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
+            fields=fields,
             skip_deserialization=skip_deserialization
         )
 
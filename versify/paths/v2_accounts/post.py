@@ -136,6 +136,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -149,6 +151,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -164,6 +168,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -174,6 +180,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -187,6 +195,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = False,
     ):
         """
@@ -194,6 +204,12 @@ class BaseApi(api_client.Api):
         :param skip_deserialization: If true then api_response.response will be set but
             api_response.body and api_response.headers will not be deserialized into schema
             class instances
+        :param validate_responses: If false then the response body is built from the trusted
+            server data without schema validation, defaults to configuration.validate_responses
+        :param response_format: 'lazy' builds the properties of the body on first access with
+            versify.lazy, 'python' returns the json.loads output of the body, 'slots' the body
+            converted by versify.slots and 'bytes' the undecoded body in an
+            api_client.ApiResponseWithoutSchema instead of schema class instances
         """
         used_path = path.value
 
@@ -214,35 +230,21 @@ class BaseApi(api_client.Api):
             _fields = serialized_data['fields']
         elif 'body' in serialized_data:
             _body = serialized_data['body']
-        response = self.api_client.call_api(
+        return self.api_client.call_operation(
             resource_path=used_path,
             method='post'.upper(),
+            status_code_to_response=_status_code_to_response,
             headers=_headers,
             fields=_fields,
             body=_body,
             auth_settings=_auth,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
+            skip_deserialization=skip_deserialization,
         )
 
-        if skip_deserialization:
-            api_response = api_client.ApiResponseWithoutDeserialization(response=response)
-        else:
-            response_for_status = _status_code_to_response.get(str(response.status))
-            if response_for_status:
-                api_response = response_for_status.deserialize(response, self.api_client.configuration)
-            else:
-                api_response = api_client.ApiResponseWithoutDeserialization(response=response)
-
-        if not 200 <= response.status <= 299:
-            raise exceptions.ApiException(
-                status=response.status,
-                reason=response.reason,
-                api_response=api_response
-            )
-
-        return api_response
-
 
 class CreateAccountV2AccountsPost(BaseApi):
     # this class is used by api classes that refer to endpoints with operationId fn names
@@ -255,6 +257,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -268,6 +272,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -283,6 +289,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -293,6 +301,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -306,6 +316,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = False,
     ):
         return self._create_account_v2_accounts_post_oapg(
@@ -314,6 +326,8 @@ class CreateAccountV2AccountsPost(BaseApi):
             accept_content_types=accept_content_types,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
             skip_deserialization=skip_deserialization
         )
 
@@ -329,6 +343,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -342,6 +358,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -357,6 +375,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -367,6 +387,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -380,6 +402,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = False,
     ):
         return self._create_account_v2_accounts_post_oapg(
@@ -388,6 +412,8 @@ class ApiForpost(BaseApi):
             accept_content_types=accept_content_types,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
             skip_deserialization=skip_deserialization
         )
 
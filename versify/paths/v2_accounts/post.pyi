@@ -127,6 +127,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -140,6 +142,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -155,6 +159,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -165,6 +171,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -178,6 +186,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = False,
     ):
         """
@@ -185,6 +195,12 @@ class BaseApi(api_client.Api):
         :param skip_deserialization: If true then api_response.response will be set but
             api_response.body and api_response.headers will not be deserialized into schema
             class instances
+        :param validate_responses: If false then the response body is built from the trusted
+            server data without schema validation, defaults to configuration.validate_responses
+        :param response_format: 'lazy' builds the properties of the body on first access with
+            versify.lazy, 'python' returns the json.loads output of the body, 'slots' the body
+            converted by versify.slots and 'bytes' the undecoded body in an
+            api_client.ApiResponseWithoutSchema instead of schema class instances
         """
         used_path = path.value
 
@@ -205,35 +221,21 @@ class BaseApi(api_client.Api):
             _fields = serialized_data['fields']
         elif 'body' in serialized_data:
             _body = serialized_data['body']
-        response = self.api_client.call_api(
+        return self.api_client.call_operation(
             resource_path=used_path,
             method='post'.upper(),
+            status_code_to_response=_status_code_to_response,
             headers=_headers,
             fields=_fields,
             body=_body,
             auth_settings=_auth,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
+            skip_deserialization=skip_deserialization,
         )
 
-        if skip_deserialization:
-            api_response = api_client.ApiResponseWithoutDeserialization(response=response)
-        else:
-            response_for_status = _status_code_to_response.get(str(response.status))
-            if response_for_status:
-                api_response = response_for_status.deserialize(response, self.api_client.configuration)
-            else:
-                api_response = api_client.ApiResponseWithoutDeserialization(response=response)
-
-        if not 200 <= response.status <= 299:
-            raise exceptions.ApiException(
-                status=response.status,
-                reason=response.reason,
-                api_response=api_response
-            )
-
-        return api_response
-
 
 class CreateAccountV2AccountsPost(BaseApi):
     # this class is used by api classes that refer to endpoints with operationId fn names
@@ -246,6 +248,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -259,6 +263,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -274,6 +280,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -284,6 +292,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -297,6 +307,8 @@ class CreateAccountV2AccountsPost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = False,
     ):
         return self._create_account_v2_accounts_post_oapg(
@@ -305,6 +317,8 @@ class CreateAccountV2AccountsPost(BaseApi):
             accept_content_types=accept_content_types,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
             skip_deserialization=skip_deserialization
         )
 
@@ -320,6 +334,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -333,6 +349,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -348,6 +366,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -358,6 +378,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor201,
@@ -371,6 +393,8 @@ class ApiForpost(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = False,
     ):
         return self._create_account_v2_accounts_post_oapg(
@@ -379,6 +403,8 @@ class ApiForpost(BaseApi):
             accept_content_types=accept_content_types,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
             skip_deserialization=skip_deserialization
         )
 
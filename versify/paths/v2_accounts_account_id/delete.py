@@ -114,6 +114,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -127,6 +129,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -136,6 +140,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -148,6 +154,8 @@ class BaseApi(api_client.Api):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = False,
     ):
         """
@@ -155,6 +163,12 @@ class BaseApi(api_client.Api):
         :param skip_deserialization: If true then api_response.response will be set but
             api_response.body and api_response.headers will not be deserialized into schema
             class instances
+        :param validate_responses: If false then the response body is built from the trusted
+            server data without schema validation, defaults to configuration.validate_responses
+        :param response_format: 'lazy' builds the properties of the body on first access with
+            versify.lazy, 'python' returns the json.loads output of the body, 'slots' the body
+            converted by versify.slots and 'bytes' the undecoded body in an
+            api_client.ApiResponseWithoutSchema instead of schema class instances
         """
         self._verify_typed_dict_inputs_oapg(RequestPathParams, path_params)
         used_path = path.value
@@ -178,33 +192,19 @@ class BaseApi(api_client.Api):
             for accept_content_type in accept_content_types:
                 _headers.add('Accept', accept_content_type)
 
-        response = self.api_client.call_api(
+        return self.api_client.call_operation(
             resource_path=used_path,
             method='delete'.upper(),
+            status_code_to_response=_status_code_to_response,
             headers=_headers,
             auth_settings=_auth,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
+            skip_deserialization=skip_deserialization,
         )
 
-        if skip_deserialization:
-            api_response = api_client.ApiResponseWithoutDeserialization(response=response)
-        else:
-            response_for_status = _status_code_to_response.get(str(response.status))
-            if response_for_status:
-                api_response = response_for_status.deserialize(response, self.api_client.configuration)
-            else:
-                api_response = api_client.ApiResponseWithoutDeserialization(response=response)
-
-        if not 200 <= response.status <= 299:
-            raise exceptions.ApiException(
-                status=response.status,
-                reason=response.reason,
-                api_response=api_response
-            )
-
-        return api_response
-
 
 class DeleteAccountV2AccountsAccountIdDelete(BaseApi):
     # this class is used by api classes that refer to endpoints with operationId fn names
@@ -216,6 +216,8 @@ class DeleteAccountV2AccountsAccountIdDelete(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -229,6 +231,8 @@ class DeleteAccountV2AccountsAccountIdDelete(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -238,6 +242,8 @@ class DeleteAccountV2AccountsAccountIdDelete(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -250,6 +256,8 @@ class DeleteAccountV2AccountsAccountIdDelete(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = False,
     ):
         return self._delete_account_v2_accounts_account_id_delete_oapg(
@@ -257,6 +265,8 @@ class DeleteAccountV2AccountsAccountIdDelete(BaseApi):
             accept_content_types=accept_content_types,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
             skip_deserialization=skip_deserialization
         )
 
@@ -271,6 +281,8 @@ class ApiFordelete(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: typing_extensions.Literal[False] = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -284,6 +296,8 @@ class ApiFordelete(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
     ) -> api_client.ApiResponseWithoutDeserialization: ...
 
     @typing.overload
@@ -293,6 +307,8 @@ class ApiFordelete(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = ...,
     ) -> typing.Union[
         ApiResponseFor200,
@@ -305,6 +321,8 @@ class ApiFordelete(BaseApi):
         accept_content_types: typing.Tuple[str] = _all_accept_content_types,
         stream: bool = False,
         timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+        validate_responses: typing.Optional[bool] = None,
+        response_format: str = 'schema',
         skip_deserialization: bool = False,
     ):
         return self._delete_account_v2_accounts_account_id_delete_oapg(
@@ -312,6 +330,8 @@ class ApiFordelete(BaseApi):
             accept_content_types=accept_content_types,
             stream=stream,
             timeout=timeout,
+            validate_responses=validate_responses,
+            response_format=response_format,
             skip_deserialization=skip_deserialization
         )
 
@@ -0,0 +1,182 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+from dataclasses import dataclass
+import threading
+import time
+import typing
+
+from versify.exceptions import ApiValueError
+from versify.retry import parse_retry_after, sleep_async
+
+THROTTLED_STATUS = 429
+
+
+@dataclass
+class RateLimitStats:
+    rate: float = 0.0
+    requests: int = 0
+    delayed: int = 0
+    waited: float = 0.0
+    throttled: int = 0
+
+
+class TokenBucket:
+    """
+    Hands out up to rate tokens per second after an initial burst
+
+    reserve takes a token even when the bucket is empty and returns how long the caller has to
+    wait for it, so concurrent callers queue in the order they reserved instead of racing.
+
+    :param rate: the tokens added per second
+    :param burst: the tokens the bucket holds, i.e. the requests sent without waiting after a pause
+    """
+
+    def __init__(
+        self, rate: float, burst: float, clock: typing.Callable[[], float] = time.monotonic
+    ):
+        if rate <= 0 or burst < 1:
+            raise ApiValueError('rate must be positive and burst at least 1')
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = burst
+        self.blocked_until = 0.0
+        self._updated = clock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Takes a token, returns the seconds to wait before using it"""
+        now = self.clock()
+        self._refill(now)
+        self.tokens -= 1
+        wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+        return max(wait, self.blocked_until - now)
+
+    def set_rate(self, rate: float):
+        self._refill(self.clock())
+        self.rate = rate
+
+    def block(self, seconds: float):
+        """Holds every reservation for seconds and drops the burst"""
+        now = self.clock()
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class RateLimiter:
+    """
+    Paces requests with a token bucket per account and path template
+
+    Requests are keyed by their Versify-Account header and their path template, e.g.
+    (acc_1, '/v2/contacts/{id}'), so one account's import does not slow down another and
+    searches are paced separately from writes. A 429 response multiplies the rate of its
+    bucket by decrease and holds the bucket for the Retry-After of the response; every
+    other response raises the rate by recovery times the configured rate until it is back.
+
+    :param rate: the requests per second of each bucket
+    :param burst: the requests a bucket sends without waiting, defaults to one second of rate
+    :param rates: the rate of path templates paced differently, e.g. {'/v2/contacts/search': 2}
+    :param decrease: the factor a 429 multiplies the rate by
+    :param recovery: the share of the configured rate each other response adds back
+    :param min_rate: the rate 429 responses do not slow a bucket down below
+    :param sleep: waits for a number of seconds, AsyncApiClient and wait_async await its result
+        when it is awaitable and use asyncio.sleep in place of the default time.sleep
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: typing.Optional[float] = None,
+        rates: typing.Optional[typing.Mapping[str, float]] = None,
+        decrease: float = 0.5,
+        recovery: float = 0.02,
+        min_rate: float = 0.1,
+        sleep: typing.Callable[[float], None] = time.sleep,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < decrease <= 1:
+            raise ApiValueError('decrease must be between 0 and 1')
+        if rate <= 0 or min_rate <= 0 or any(value <= 0 for value in (rates or {}).values()):
+            raise ApiValueError('rates must be positive')
+        self.rate = rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self.decrease = decrease
+        self.recovery = recovery
+        self.min_rate = min_rate
+        self.sleep = sleep
+        self.clock = clock
+        self._buckets: typing.Dict[typing.Tuple[typing.Optional[str], str], TokenBucket] = {}
+        self._stats: typing.Dict[typing.Tuple[typing.Optional[str], str], RateLimitStats] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: typing.Tuple[typing.Optional[str], str]) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate = self.rates.get(key[1], self.rate)
+            burst = self.burst or max(1.0, rate)
+            bucket = self._buckets[key] = TokenBucket(rate, burst, self.clock)
+            self._stats[key] = RateLimitStats(rate=rate)
+        return bucket
+
+    def acquire(self, account: typing.Optional[str], path: str) -> float:
+        """Reserves a request of account to path, returns the seconds to wait before sending it"""
+        key = (account, path)
+        with self._lock:
+            wait = self._bucket(key).reserve()
+            stats = self._stats[key]
+            stats.requests += 1
+            if wait > 0:
+                stats.delayed += 1
+                stats.waited += wait
+        return wait
+
+    def wait(self, account: typing.Optional[str], path: str):
+        wait = self.acquire(account, path)
+        if wait > 0:
+            self.sleep(wait)
+
+    async def wait_async(self, account: typing.Optional[str], path: str):
+        wait = self.acquire(account, path)
+        if wait > 0:
+            await sleep_async(self.sleep, wait)
+
+    def record(
+        self,
+        account: typing.Optional[str],
+        path: str,
+        status: int,
+        retry_after: typing.Optional[str] = None,
+    ):
+        """Slows the bucket of account and path down on a 429, speeds it back up otherwise"""
+        key = (account, path)
+        limit = self.rates.get(path, self.rate)
+        with self._lock:
+            bucket = self._bucket(key)
+            if status == THROTTLED_STATUS:
+                bucket.set_rate(max(self.min_rate, bucket.rate * self.decrease))
+                bucket.block(parse_retry_after(retry_after) or 0.0)
+                self._stats[key].throttled += 1
+            elif bucket.rate < limit:
+                bucket.set_rate(min(limit, bucket.rate + limit * self.recovery))
+            else:
+                return
+            self._stats[key].rate = bucket.rate
+
+    def stats(self) -> typing.Dict[typing.Tuple[typing.Optional[str], str], RateLimitStats]:
+        """A snapshot of the counters and current rate of each (account, path template)"""
+        with self._lock:
+            return {key: RateLimitStats(**stats.__dict__) for key, stats in self._stats.items()}
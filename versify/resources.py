@@ -0,0 +1,106 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+from dataclasses import dataclass
+import importlib
+import typing
+
+from versify.api_client import Api, ApiClient
+from versify.exceptions import ApiValueError
+from versify.schemas import Schema
+
+
+@dataclass(frozen=True)
+class Resource:
+    """Describes where the operations and model of a REST resource live.
+
+    :param name: plural resource name, e.g. contacts
+    :param model_module: module in versify.model holding the resource model
+    :param model_name: class name of the resource model
+    :param id_param: name of the path parameter identifying one item
+    :param paginated: whether the list operation accepts page_num/page_size
+    :param searchable: whether the resource has a search operation
+    """
+    name: str
+    model_module: str
+    model_name: str
+    id_param: str
+    paginated: bool = True
+    searchable: bool = True
+
+    @property
+    def collection_path(self) -> str:
+        return 'v2_' + self.name
+
+    @property
+    def item_path(self) -> str:
+        return '{}_{}'.format(self.collection_path, self.id_param)
+
+    @property
+    def search_path(self) -> str:
+        if not self.searchable:
+            raise ApiValueError('{} cannot be searched'.format(self.name))
+        return self.collection_path + '_search'
+
+    @property
+    def model(self) -> typing.Type[Schema]:
+        module = importlib.import_module('versify.model.' + self.model_module)
+        return getattr(module, self.model_name)
+
+    @staticmethod
+    def _api(path: str, method: str, api_client: typing.Optional[ApiClient]) -> Api:
+        module = importlib.import_module('versify.paths.{}.{}'.format(path, method))
+        return getattr(module, 'ApiFor' + method)(api_client)
+
+    def collection_api(self, method: str, api_client: typing.Optional[ApiClient] = None) -> Api:
+        """The path api of /v2/<name> for method get (list) or post (create)"""
+        return self._api(self.collection_path, method, api_client)
+
+    def item_api(self, method: str, api_client: typing.Optional[ApiClient] = None) -> Api:
+        """The path api of /v2/<name>/{id} for method get, put or delete"""
+        return self._api(self.item_path, method, api_client)
+
+    def search_api(self, api_client: typing.Optional[ApiClient] = None) -> Api:
+        """The path api of /v2/<name>/search"""
+        return self._api(self.search_path, 'post', api_client)
+
+
+RESOURCES: typing.Dict[str, Resource] = {
+    resource.name: resource for resource in (
+        Resource(
+            'accounts', 'account', 'Account', 'account_id', paginated=False, searchable=False),
+        Resource('assets', 'asset', 'Asset', 'asset_id'),
+        Resource('claims', 'claim', 'Claim', 'claim_id'),
+        Resource('collections', 'collection', 'Collection', 'collection_id'),
+        Resource('contacts', 'contact', 'Contact', 'contact_id'),
+        Resource('events', 'event', 'Event', 'event_id'),
+        Resource('journeys', 'journey', 'Journey', 'journey_id'),
+        Resource('messages', 'message', 'Message', 'message_id'),
+        Resource('mints', 'mint', 'Mint', 'mint_id'),
+        Resource('notes', 'note', 'Note', 'note_id'),
+        Resource('redemptions', 'redemption', 'Redemption', 'redemption_id'),
+        Resource('rewards', 'reward', 'Reward', 'reward_id'),
+        Resource('tags', 'tag', 'Tag', 'tag_id'),
+        Resource('webhooks', 'webhook', 'Webhook', 'webhook_id'),
+    )
+}
+
+
+def get_resource(resource: typing.Union[str, Resource]) -> Resource:
+    """Looks up a resource by name, e.g. 'contacts'"""
+    if isinstance(resource, Resource):
+        return resource
+    try:
+        return RESOURCES[resource]
+    except KeyError:
+        raise ApiValueError(
+            "Invalid resource '{}', must be one of {}".format(resource, sorted(RESOURCES))
+        ) from None
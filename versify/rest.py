@@ -9,8 +9,11 @@
     Generated by: https://openapi-generator.tech
 """
 
+from dataclasses import dataclass
 import logging
 import ssl
+import threading
+import time
 from urllib.parse import urlencode
 import typing
 
@@ -23,6 +26,132 @@ from versify.exceptions import ApiException, ApiValueError
 
 logger = logging.getLogger(__name__)
 
+# the settings Configuration.connection_pool_per_host may override per host
+POOL_SETTINGS = frozenset(('maxsize', 'block', 'idle_timeout'))
+
+
+@dataclass
+class PoolStats:
+    """
+    The connection counters of the pool of one host
+
+    :param created: the connections created
+    :param reused: the requests sent on an open connection
+    :param connects: the requests that opened a connection, i.e. a TCP and, for https, a TLS
+        handshake; new connections and ones the server or idle_timeout closed
+    :param discarded: the connections closed by the pool: returned to a full pool, idle for
+        longer than idle_timeout or broken by an error
+    :param exhausted: the requests that found maxsize connections checked out, so they waited
+        (block=True) or got a connection that is discarded afterwards
+    :param wait_time: the seconds spent waiting for a connection
+    :param checked_out: the connections in use
+    :param max_checked_out: the most connections in use at once
+    """
+    created: int = 0
+    reused: int = 0
+    connects: int = 0
+    discarded: int = 0
+    exhausted: int = 0
+    wait_time: float = 0.0
+    checked_out: int = 0
+    max_checked_out: int = 0
+
+
+class _InstrumentedPool:
+    """Counts the connections of a urllib3 connection pool into its PoolStats"""
+
+    stats: PoolStats
+    stats_lock: threading.Lock
+    idle_timeout: typing.Optional[float] = None
+
+    def _new_conn(self):
+        with self.stats_lock:
+            self.stats.created += 1
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        with self.stats_lock:
+            if self.pool is not None and self.stats.checked_out >= self.pool.maxsize:
+                self.stats.exhausted += 1
+            self.stats.checked_out += 1
+            self.stats.max_checked_out = max(self.stats.max_checked_out, self.stats.checked_out)
+        started = time.monotonic()
+        try:
+            conn = super()._get_conn(timeout=timeout)
+        except BaseException:
+            with self.stats_lock:
+                self.stats.checked_out -= 1
+            raise
+        now = time.monotonic()
+        discarded = False
+        if conn.sock is not None and self.idle_timeout is not None:
+            if now - getattr(conn, 'released_at', now) > self.idle_timeout:
+                conn.close()
+                discarded = True
+        with self.stats_lock:
+            self.stats.wait_time += now - started
+            self.stats.discarded += discarded
+            if conn.sock is None:
+                self.stats.connects += 1
+            else:
+                self.stats.reused += 1
+        return conn
+
+    def _put_conn(self, conn):
+        # urllib3 returns None in place of a connection it closed after an error
+        discarded = conn is None or self.pool is None or self.pool.full()
+        if conn is not None:
+            conn.released_at = time.monotonic()
+        with self.stats_lock:
+            self.stats.checked_out -= 1
+            self.stats.discarded += discarded
+        super()._put_conn(conn)
+
+
+class _InstrumentedHTTPConnectionPool(_InstrumentedPool, urllib3.HTTPConnectionPool):
+    pass
+
+
+class _InstrumentedHTTPSConnectionPool(_InstrumentedPool, urllib3.HTTPSConnectionPool):
+    pass
+
+
+class _TunedPoolManager:
+    """Applies per host pool settings to the pools of a urllib3 PoolManager and instruments them"""
+
+    def __init__(self, *args, per_host=None, idle_timeout=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_classes_by_scheme = {
+            'http': _InstrumentedHTTPConnectionPool, 'https': _InstrumentedHTTPSConnectionPool}
+        self.per_host = per_host or {}
+        self.idle_timeout = idle_timeout
+        self.pool_stats: typing.Dict[str, PoolStats] = {}
+        self.pool_stats_lock = threading.Lock()
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        if request_context is None:
+            request_context = self.connection_pool_kw
+        request_context = dict(request_context)
+        settings = self.per_host.get(host, {})
+        for key in ('maxsize', 'block'):
+            if key in settings:
+                request_context[key] = settings[key]
+        pool = super()._new_pool(scheme, host, port, request_context)
+        with self.pool_stats_lock:
+            pool_key = '{}://{}:{}'.format(scheme, host, port)
+            pool.stats = self.pool_stats.setdefault(pool_key, PoolStats())
+        pool.stats_lock = self.pool_stats_lock
+        pool.idle_timeout = settings.get('idle_timeout', self.idle_timeout)
+        return pool
+
+
+class _PoolManager(_TunedPoolManager, urllib3.PoolManager):
+    pass
+
+
+class _ProxyManager(_TunedPoolManager, urllib3.ProxyManager):
+    pass
+
 
 class RESTClientObject(object):
 
@@ -62,9 +191,21 @@ class RESTClientObject(object):
             else:
                 maxsize = 4
 
+        per_host = configuration.connection_pool_per_host or {}
+        for host, settings in per_host.items():
+            unknown = set(settings) - POOL_SETTINGS
+            if unknown:
+                raise ApiValueError('Invalid pool settings {} for {}, must be in {}'.format(
+                    sorted(unknown), host, sorted(POOL_SETTINGS)))
+        # keep a pool for every tuned host, and one more, instead of evicting them
+        pools_size = max(pools_size, len(per_host) + 1)
+        addition_pool_args['block'] = configuration.connection_pool_block
+        addition_pool_args['per_host'] = per_host
+        addition_pool_args['idle_timeout'] = configuration.connection_pool_idle_timeout
+
         # https pool manager
         if configuration.proxy:
-            self.pool_manager = urllib3.ProxyManager(
+            self.pool_manager = _ProxyManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
                 cert_reqs=cert_reqs,
@@ -76,7 +217,7 @@ class RESTClientObject(object):
                 **addition_pool_args
             )
         else:
-            self.pool_manager = urllib3.PoolManager(
+            self.pool_manager = _PoolManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
                 cert_reqs=cert_reqs,
@@ -197,6 +338,14 @@ class RESTClientObject(object):
 
         return r
 
+    def pool_stats(self) -> typing.Dict[str, PoolStats]:
+        """A snapshot of the connection counters of each host, keyed by scheme://host:port"""
+        with self.pool_manager.pool_stats_lock:
+            return {
+                host: PoolStats(**stats.__dict__)
+                for host, stats in self.pool_manager.pool_stats.items()
+            }
+
     def GET(self, url, headers=None, stream=False,
             timeout=None, fields=None) -> urllib3.HTTPResponse:
         return self.request("GET", url,
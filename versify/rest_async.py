@@ -0,0 +1,464 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+import collections
+import io
+import logging
+import ssl
+import typing
+from urllib.parse import urlencode, urlsplit
+
+import certifi
+import urllib3
+from urllib3._collections import HTTPHeaderDict
+
+from versify.exceptions import ApiException, ApiValueError
+
+
+logger = logging.getLogger(__name__)
+
+_NO_BODY_STATUSES = {204, 304}
+
+
+class AsyncConnection(object):
+    """An HTTP/1.1 connection over an asyncio stream pair"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def is_dropped(self) -> bool:
+        return self.reader.at_eof() or self.writer.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncConnectionPool(object):
+    """Keep-alive pool of connections to one scheme/host/port.
+
+    At most maxsize requests are in flight at once; further requests wait for a
+    connection to be released instead of opening new sockets.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        ssl_context: typing.Optional[ssl.SSLContext] = None,
+        server_hostname: typing.Optional[str] = None,
+        maxsize: int = 4,
+        socket_options: typing.Optional[typing.List[typing.Tuple]] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.server_hostname = server_hostname
+        self.maxsize = maxsize
+        self.socket_options = socket_options
+        self._idle = collections.deque()
+        # created on first use so that it binds to the running event loop
+        self._semaphore = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.maxsize)
+        return self._semaphore
+
+    async def _new_conn(self, connect_timeout: typing.Optional[float]) -> AsyncConnection:
+        kwargs = {}
+        if self.ssl_context is not None:
+            kwargs['ssl'] = self.ssl_context
+            kwargs['server_hostname'] = self.server_hostname or self.host
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, **kwargs), connect_timeout)
+        except asyncio.TimeoutError:
+            raise urllib3.exceptions.ConnectTimeoutError(
+                "Connection to {0} timed out. (connect timeout={1})".format(
+                    self.host, connect_timeout))
+        if self.socket_options:
+            sock = writer.get_extra_info('socket')
+            for opt in self.socket_options:
+                sock.setsockopt(*opt)
+        return AsyncConnection(reader, writer)
+
+    async def _get_conn(
+        self, connect_timeout: typing.Optional[float]
+    ) -> typing.Tuple[AsyncConnection, bool]:
+        while self._idle:
+            conn = self._idle.pop()
+            if not conn.is_dropped:
+                return conn, True
+            conn.close()
+        return await self._new_conn(connect_timeout), False
+
+    def _put_conn(self, conn: AsyncConnection, keep_alive: bool):
+        if keep_alive and not conn.is_dropped and len(self._idle) < self.maxsize:
+            self._idle.append(conn)
+        else:
+            conn.close()
+
+    async def urlopen(
+        self,
+        method: str,
+        url: str,
+        request_bytes: bytes,
+        connect_timeout: typing.Optional[float] = None,
+        read_timeout: typing.Optional[float] = None,
+    ) -> typing.Tuple[int, str, int, HTTPHeaderDict, bytes]:
+        async with self.semaphore:
+            while True:
+                conn, reused = await self._get_conn(connect_timeout)
+                try:
+                    conn.writer.write(request_bytes)
+                    await conn.writer.drain()
+                    result, keep_alive = await asyncio.wait_for(
+                        _read_response(conn.reader, method), read_timeout)
+                except asyncio.TimeoutError:
+                    conn.close()
+                    raise urllib3.exceptions.ReadTimeoutError(
+                        None, url, "Read timed out. (read timeout={0})".format(read_timeout))
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    conn.close()
+                    if reused:
+                        # the server closed an idle keep-alive connection, retry on a new one
+                        continue
+                    raise urllib3.exceptions.ProtocolError('Connection aborted.', e)
+                except BaseException:
+                    conn.close()
+                    raise
+                self._put_conn(conn, keep_alive)
+                return result
+
+    async def close(self):
+        while self._idle:
+            conn = self._idle.pop()
+            conn.close()
+            try:
+                await conn.writer.wait_closed()
+            except (ConnectionError, ssl.SSLError):
+                pass
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> HTTPHeaderDict:
+    headers = HTTPHeaderDict()
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n'):
+            return headers
+        if not line:
+            raise asyncio.IncompleteReadError(b'', None)
+        name, _, value = line.decode('latin-1').partition(':')
+        headers.add(name.strip(), value.strip())
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise asyncio.IncompleteReadError(b'', None)
+        try:
+            size = int(size_line.split(b';', 1)[0].strip(), 16)
+        except ValueError:
+            raise ApiException(status=0, reason='Invalid chunk size line {!r}'.format(size_line))
+        if size == 0:
+            # trailers are read and discarded
+            await _read_headers(reader)
+            return b''.join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+async def _read_response(
+    reader: asyncio.StreamReader,
+    method: str
+) -> typing.Tuple[typing.Tuple[int, str, int, HTTPHeaderDict, bytes], bool]:
+    while True:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('Remote end closed connection without response')
+        parts = status_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+        version, status, reason = (parts + [''])[:3]
+        status = int(status)
+        headers = await _read_headers(reader)
+        # skip informational responses like 100 Continue
+        if not 100 <= status < 200:
+            break
+
+    connection = headers.get('connection', '').lower()
+    if version == 'HTTP/1.1':
+        keep_alive = connection != 'close'
+    else:
+        keep_alive = connection == 'keep-alive'
+
+    if method == 'HEAD' or status in _NO_BODY_STATUSES:
+        data = b''
+    elif 'chunked' in headers.get('transfer-encoding', '').lower():
+        data = await _read_chunked(reader)
+    elif 'content-length' in headers:
+        data = await reader.readexactly(int(headers['content-length']))
+    else:
+        # the body is delimited by the server closing the connection
+        data = await reader.read()
+        keep_alive = False
+    int_version = 11 if version == 'HTTP/1.1' else 10
+    return (status, reason, int_version, headers, data), keep_alive
+
+
+class AsyncRESTClientObject(object):
+    """Non-blocking counterpart of RESTClientObject built on asyncio streams.
+
+    Connections are kept alive and pooled per scheme/host/port, so a single event
+    loop can drive many concurrent requests without a thread per request.
+    Responses are returned as urllib3.HTTPResponse instances so that
+    OpenApiResponse.deserialize and ApiException work unchanged.
+    Note: proxies, urllib3 Retry configuration and stream=True are not supported by this
+    transport. The body is read before the response is returned, and an urllib3.HTTPResponse
+    cannot read from the event loop's StreamReader without blocking it.
+    """
+
+    def __init__(self, configuration, maxsize=None):
+        if configuration.proxy:
+            raise ApiValueError("proxy is not supported by AsyncRESTClientObject")
+
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+        self.maxsize = maxsize
+        self.socket_options = configuration.socket_options
+        self.assert_hostname = configuration.assert_hostname
+
+        # ca_certs
+        if configuration.ssl_ca_cert:
+            ca_certs = configuration.ssl_ca_cert
+        else:
+            # if not set certificate file, use Mozilla's root certificates.
+            ca_certs = certifi.where()
+        self.ssl_context = ssl.create_default_context(cafile=ca_certs)
+        if not configuration.verify_ssl:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+        elif configuration.assert_hostname is False:
+            self.ssl_context.check_hostname = False
+        if configuration.cert_file:
+            self.ssl_context.load_cert_chain(configuration.cert_file, configuration.key_file)
+
+        self.pools: typing.Dict[typing.Tuple[str, str, int], AsyncConnectionPool] = {}
+
+    def connection_from_url(self, url: str) -> AsyncConnectionPool:
+        parsed = urlsplit(url)
+        scheme = parsed.scheme.lower()
+        port = parsed.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parsed.hostname, port)
+        pool = self.pools.get(key)
+        if pool is None:
+            server_hostname = None
+            if isinstance(self.assert_hostname, str):
+                server_hostname = self.assert_hostname
+            pool = AsyncConnectionPool(
+                parsed.hostname,
+                port,
+                ssl_context=self.ssl_context if scheme == 'https' else None,
+                server_hostname=server_hostname,
+                maxsize=self.maxsize,
+                socket_options=self.socket_options,
+            )
+            self.pools[key] = pool
+        return pool
+
+    @staticmethod
+    def __split_timeout(
+        timeout: typing.Optional[typing.Union[int, float, typing.Tuple]]
+    ) -> typing.Tuple[typing.Optional[float], typing.Optional[float]]:
+        if not timeout:
+            return None, None
+        if isinstance(timeout, (int, float)):
+            return timeout, timeout
+        if isinstance(timeout, tuple) and len(timeout) == 2:
+            return timeout[0], timeout[1]
+        raise ApiValueError("timeout must be a number or a (connection, read) tuple")
+
+    @staticmethod
+    def __encode_body(
+        method: str,
+        headers: HTTPHeaderDict,
+        fields: typing.Optional[typing.Tuple[typing.Tuple[str, typing.Any], ...]],
+        body: typing.Optional[typing.Union[str, bytes]]
+    ) -> typing.Optional[bytes]:
+        if method not in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            return None
+        if 'Content-Type' not in headers and body is None:
+            return None
+        elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+            if body is None:
+                body = urlencode(fields or {})
+        elif headers['Content-Type'] == 'multipart/form-data':
+            # the Content-Type with the generated boundary replaces the passed one
+            body, content_type = urllib3.encode_multipart_formdata(fields or {})
+            headers['Content-Type'] = content_type
+        elif not isinstance(body, (str, bytes)):
+            # Cannot generate the request from given parameters
+            msg = """Cannot prepare a request message for provided
+                     arguments. Please check that your arguments match
+                     declared content type."""
+            raise ApiException(status=0, reason=msg)
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        return body
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: typing.Optional[HTTPHeaderDict] = None,
+        fields: typing.Optional[typing.Tuple[typing.Tuple[str, typing.Any], ...]] = None,
+        body: typing.Optional[typing.Union[str, bytes]] = None,
+        stream: bool = False,
+        timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+    ) -> urllib3.HTTPResponse:
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request body, for other types
+        :param fields: request parameters for
+                                `application/x-www-form-urlencoded`
+                                or `multipart/form-data`
+        :param stream: not supported, True raises ApiValueError.
+                                Default is False.
+        :param timeout: timeout setting for this request. If one
+                                number provided, it will be used as the
+                                connection and the read timeout. It can also
+                                be a pair (tuple) of (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if fields and body:
+            raise ApiValueError(
+                "body parameter cannot be used with fields parameter."
+            )
+        if stream:
+            raise ApiValueError("stream is not supported by AsyncRESTClientObject")
+
+        headers = HTTPHeaderDict(headers or {})
+        request_body = self.__encode_body(method, headers, fields, body)
+        connect_timeout, read_timeout = self.__split_timeout(timeout)
+
+        parsed = urlsplit(url)
+        target = parsed.path or '/'
+        if parsed.query:
+            target += '?' + parsed.query
+        if 'Host' not in headers:
+            headers['Host'] = parsed.netloc
+        if request_body is not None:
+            headers['Content-Length'] = str(len(request_body))
+        elif method in ['POST', 'PUT', 'PATCH']:
+            headers['Content-Length'] = '0'
+        lines = ['{0} {1} HTTP/1.1'.format(method, target)]
+        lines.extend('{0}: {1}'.format(name, value) for name, value in headers.iteritems())
+        request_bytes = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        if request_body:
+            request_bytes += request_body
+
+        pool = self.connection_from_url(url)
+        try:
+            status, reason, version, response_headers, data = await pool.urlopen(
+                method, url, request_bytes, connect_timeout=connect_timeout,
+                read_timeout=read_timeout)
+        except ssl.SSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+
+        r = urllib3.HTTPResponse(
+            body=io.BytesIO(data),
+            headers=response_headers,
+            status=status,
+            reason=reason,
+            version=version,
+            request_method=method,
+            request_url=url,
+        )
+
+        # log response body
+        logger.debug("response body: %s", r.data)
+
+        return r
+
+    async def close(self):
+        pools, self.pools = self.pools, {}
+        for pool in pools.values():
+            await pool.close()
+
+    async def GET(self, url, headers=None, stream=False,
+                  timeout=None, fields=None) -> urllib3.HTTPResponse:
+        return await self.request("GET", url,
+                                  headers=headers,
+                                  stream=stream,
+                                  timeout=timeout,
+                                  fields=fields)
+
+    async def HEAD(self, url, headers=None, stream=False,
+                   timeout=None, fields=None) -> urllib3.HTTPResponse:
+        return await self.request("HEAD", url,
+                                  headers=headers,
+                                  stream=stream,
+                                  timeout=timeout,
+                                  fields=fields)
+
+    async def OPTIONS(self, url, headers=None,
+                      body=None, stream=False, timeout=None, fields=None) -> urllib3.HTTPResponse:
+        return await self.request("OPTIONS", url,
+                                  headers=headers,
+                                  stream=stream,
+                                  timeout=timeout,
+                                  body=body, fields=fields)
+
+    async def DELETE(self, url, headers=None, body=None,
+                     stream=False, timeout=None, fields=None) -> urllib3.HTTPResponse:
+        return await self.request("DELETE", url,
+                                  headers=headers,
+                                  stream=stream,
+                                  timeout=timeout,
+                                  body=body, fields=fields)
+
+    async def POST(self, url, headers=None,
+                   body=None, stream=False, timeout=None, fields=None) -> urllib3.HTTPResponse:
+        return await self.request("POST", url,
+                                  headers=headers,
+                                  stream=stream,
+                                  timeout=timeout,
+                                  body=body, fields=fields)
+
+    async def PUT(self, url, headers=None,
+                  body=None, stream=False, timeout=None, fields=None) -> urllib3.HTTPResponse:
+        return await self.request("PUT", url,
+                                  headers=headers,
+                                  stream=stream,
+                                  timeout=timeout,
+                                  body=body, fields=fields)
+
+    async def PATCH(self, url, headers=None,
+                    body=None, stream=False, timeout=None, fields=None) -> urllib3.HTTPResponse:
+        return await self.request("PATCH", url,
+                                  headers=headers,
+                                  stream=stream,
+                                  timeout=timeout,
+                                  body=body, fields=fields)
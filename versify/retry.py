@@ -0,0 +1,235 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import inspect
+import random
+import threading
+import time
+import typing
+
+import urllib3
+
+from versify.exceptions import ApiValueError
+
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+# statuses an idempotent request is retried on
+RETRY_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+# statuses that mean the server did not process the request, so any method is retried on them
+UNPROCESSED_STATUSES = frozenset((429,))
+# connection errors raised before the request was sent, so any method is retried on them
+UNSENT_ERRORS = (
+    urllib3.exceptions.NewConnectionError,
+    urllib3.exceptions.ConnectTimeoutError,
+    ConnectionRefusedError,
+)
+
+
+async def sleep_async(sleep: typing.Callable[[float], typing.Any], seconds: float):
+    """Waits with sleep, or with asyncio.sleep in place of time.sleep so the loop is not blocked"""
+    if sleep is time.sleep:
+        await asyncio.sleep(seconds)
+        return
+    result = sleep(seconds)
+    if inspect.isawaitable(result):
+        await result
+
+
+def parse_retry_after(
+    value: typing.Optional[str], now: typing.Optional[datetime] = None
+) -> typing.Optional[float]:
+    """The seconds a Retry-After header, in seconds or as an HTTP date, asks to wait for"""
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class RetryBudget:
+    """
+    Caps retries to a ratio of the requests sent
+
+    Every first attempt deposits ratio tokens and every retry withdraws one, so once the reserve
+    is spent retries add at most ratio extra load, e.g. 10%, instead of multiplying the load on a
+    struggling server. The balance never exceeds reserve, which lets a quiet client still retry.
+
+    :param ratio: the retries allowed per request sent
+    :param reserve: the retries allowed before any request was sent, and the cap of the balance
+    """
+
+    def __init__(self, ratio: float = 0.1, reserve: float = 10.0):
+        if ratio < 0 or reserve < 0:
+            raise ApiValueError('ratio and reserve must not be negative')
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spends one retry, False when the budget is exhausted"""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+
+@dataclass
+class RetryStats:
+    requests: int = 0
+    retries: int = 0
+    give_ups: int = 0
+    budget_exhausted: int = 0
+
+
+class RetryPolicy:
+    """
+    Decides whether and when ApiClient sends a failed request again
+
+    Idempotent methods are retried on RETRY_STATUSES and on connection errors; other methods,
+    e.g. POST, only on UNPROCESSED_STATUSES and on errors raised before the request was sent.
+    Retries wait for the Retry-After of the response when it has one, otherwise for a random
+    time between 0 and min(max_backoff, backoff * 2 ** retry) (full jitter). Retries are
+    counted per operation, e.g. 'GET /v2/contacts/{id}'.
+
+    :param max_retries: the maximum number of retries of a request
+    :param backoff: the base of the exponential backoff in seconds
+    :param max_backoff: the cap of the exponential backoff in seconds
+    :param max_retry_after: a response asking to wait longer than this is not retried
+    :param retry_statuses: the statuses idempotent requests are retried on
+    :param budget: the RetryBudget shared by every request sent with the policy, defaults to
+        RetryBudget(), which allows 10% extra load
+    :param sleep: waits for a number of seconds, AsyncApiClient awaits its result when it is
+        awaitable and uses asyncio.sleep in place of the default time.sleep
+    :param rng: the random.Random the jitter is drawn from
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 60.0,
+        retry_statuses: typing.Collection[int] = RETRY_STATUSES,
+        budget: typing.Optional[RetryBudget] = None,
+        sleep: typing.Callable[[float], None] = time.sleep,
+        rng: typing.Optional[random.Random] = None,
+    ):
+        if max_retries < 0:
+            raise ApiValueError('max_retries must not be negative')
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = RetryBudget() if budget is None else budget
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self._stats: typing.Dict[str, RetryStats] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, operation: str, counter: str):
+        with self._lock:
+            stats = self._stats.get(operation)
+            if stats is None:
+                stats = self._stats[operation] = RetryStats()
+            setattr(stats, counter, getattr(stats, counter) + 1)
+
+    def stats(self) -> typing.Dict[str, RetryStats]:
+        """A snapshot of the counters of each operation"""
+        with self._lock:
+            return {
+                operation: RetryStats(**stats.__dict__)
+                for operation, stats in self._stats.items()
+            }
+
+    def is_retryable(
+        self,
+        method: str,
+        response: typing.Optional[urllib3.HTTPResponse] = None,
+        error: typing.Optional[BaseException] = None,
+    ) -> bool:
+        """Whether a request that got response, or raised error, may be sent again"""
+        idempotent = method in IDEMPOTENT_METHODS
+        if response is not None:
+            if idempotent:
+                return response.status in self.retry_statuses
+            return response.status in UNPROCESSED_STATUSES
+        if isinstance(error, urllib3.exceptions.MaxRetryError):
+            error = error.reason
+        if isinstance(error, urllib3.exceptions.SSLError):
+            return False
+        if idempotent:
+            return isinstance(error, (urllib3.exceptions.HTTPError, ConnectionError))
+        return isinstance(error, UNSENT_ERRORS)
+
+    def started(self, operation: str):
+        """Records the first attempt of a request"""
+        self.budget.deposit()
+        self._count(operation, 'requests')
+
+    def delay(
+        self,
+        operation: str,
+        method: str,
+        retry: int,
+        response: typing.Optional[urllib3.HTTPResponse] = None,
+        error: typing.Optional[BaseException] = None,
+        max_delay: typing.Optional[float] = None,
+    ) -> typing.Optional[float]:
+        """
+        The seconds to wait before sending a request again, None when it is not retried
+
+        :param retry: the number of retries sent so far
+        :param max_delay: a retry that would wait longer than this is given up, e.g. the
+            time left until a deadline.Deadline
+        """
+        if not self.is_retryable(method, response, error):
+            return None
+        if retry >= self.max_retries:
+            self._count(operation, 'give_ups')
+            return None
+        delay = None
+        if response is not None:
+            delay = parse_retry_after(response.headers.get('Retry-After'))
+        if delay is not None and delay > self.max_retry_after:
+            self._count(operation, 'give_ups')
+            return None
+        if delay is None:
+            delay = self.rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** retry))
+        if max_delay is not None and delay >= max_delay:
+            self._count(operation, 'give_ups')
+            return None
+        if not self.budget.withdraw():
+            self._count(operation, 'budget_exhausted')
+            self._count(operation, 'give_ups')
+            return None
+        self._count(operation, 'retries')
+        return delay
@@ -313,7 +313,7 @@ class Schema:
         return msg
 
     @classmethod
-    def __get_type_error(cls, var_value, path_to_item, valid_classes, key_type=False):
+    def _get_type_error_oapg(cls, var_value, path_to_item, valid_classes, key_type=False):
         error_msg = cls.__type_error_message(
             var_name=path_to_item[-1],
             var_value=var_value,
@@ -347,7 +347,7 @@ class Schema:
         """
         base_class = type(arg)
         if base_class not in cls._types:
-            raise cls.__get_type_error(
+            raise cls._get_type_error_oapg(
                 arg,
                 validation_metadata.path_to_item,
                 cls._types,
@@ -414,29 +414,44 @@ class Schema:
         # do not modify the returned result because it is cached and we would be modifying the cached value
         path_to_schemas = {}
         for path, schema_classes in _path_to_schemas.items():
-            """
-            Use cases
-            1. N number of schema classes + enum + type != bool/None, classes in path_to_schemas: tuple/frozendict.frozendict/str/Decimal/bytes/FileIo
-                needs Singleton added
-            2. N number of schema classes + enum + type == bool/None, classes in path_to_schemas: BoolClass/NoneClass
-                Singleton already added
-            3. N number of schema classes, classes in path_to_schemas: BoolClass/NoneClass/tuple/frozendict.frozendict/str/Decimal/bytes/FileIo
-            """
-            cls._process_schema_classes_oapg(schema_classes)
-            enum_schema = any(
-                issubclass(this_cls, EnumBase) for this_cls in schema_classes)
-            inheritable_primitive_type = schema_classes.intersection(cls.__inheritable_primitive_types_set)
-            chosen_schema_classes = schema_classes - inheritable_primitive_type
-            suffix = tuple(inheritable_primitive_type)
-            if enum_schema and suffix[0] not in {NoneClass, BoolClass}:
-                suffix = (Singleton,) + suffix
-
-            used_classes = tuple(sorted(chosen_schema_classes, key=lambda a_cls: a_cls.__name__)) + suffix
-            mfg_cls = get_new_class(class_name='DynamicSchema', bases=used_classes)
-            path_to_schemas[path] = mfg_cls
+            path_to_schemas[path] = cls._get_new_cls_for_schema_classes_oapg(schema_classes)
 
         return path_to_schemas
 
+    @classmethod
+    def _get_new_cls_for_schema_classes_oapg(
+        cls,
+        schema_classes: typing.Set[typing.Union[
+            'Schema', str, decimal.Decimal, BoolClass, NoneClass, frozendict.frozendict, tuple]]
+    ) -> typing.Type['Schema']:
+        """
+        Makes the dynamic class for the schema classes and primitive type validated at one path
+        Processes and mutates schema_classes
+
+        Use cases
+        1. N number of schema classes + enum + type != bool/None,
+           classes in path_to_schemas: tuple/frozendict.frozendict/str/Decimal/bytes/FileIo
+            needs Singleton added
+        2. N number of schema classes + enum + type == bool/None,
+           classes in path_to_schemas: BoolClass/NoneClass
+            Singleton already added
+        3. N number of schema classes, classes in path_to_schemas:
+           BoolClass/NoneClass/tuple/frozendict.frozendict/str/Decimal/bytes/FileIo
+        """
+        cls._process_schema_classes_oapg(schema_classes)
+        enum_schema = any(
+            issubclass(this_cls, EnumBase) for this_cls in schema_classes)
+        inheritable_primitive_type = schema_classes.intersection(
+            cls.__inheritable_primitive_types_set)
+        chosen_schema_classes = schema_classes - inheritable_primitive_type
+        suffix = tuple(inheritable_primitive_type)
+        if enum_schema and suffix[0] not in {NoneClass, BoolClass}:
+            suffix = (Singleton,) + suffix
+
+        used_classes = tuple(
+            sorted(chosen_schema_classes, key=lambda a_cls: a_cls.__name__)) + suffix
+        return get_new_class(class_name='DynamicSchema', bases=used_classes)
+
     @classmethod
     def _get_new_instance_without_conversion_oapg(
         cls,
@@ -484,6 +499,23 @@ class Schema:
     ):
         """
         Schema from_openapi_data_oapg
+        Plain json payloads are built with the cached CompiledSchema of cls, other payloads
+        with the interpreted validation
+        """
+        try:
+            return CompiledSchema.for_schema_classes((cls,)).build(arg, _configuration)
+        except UncompiledPayloadError:
+            return cls._from_openapi_data_interpreted_oapg(arg, _configuration)
+
+    @classmethod
+    def _from_openapi_data_interpreted_oapg(
+        cls,
+        arg: typing.Any,
+        _configuration: typing.Optional[Configuration] = None
+    ):
+        """
+        Schema _from_openapi_data_interpreted_oapg
+        Validates the payload by walking the MetaOapg of each schema class
         """
         from_server = True
         validated_path_to_schemas = {}
@@ -499,6 +531,54 @@ class Schema:
         )
         return new_inst
 
+    @classmethod
+    def from_trusted_data_oapg(
+        cls,
+        arg: typing.Union[str, int, float, bool, None, dict, list],
+        _configuration: typing.Optional[Configuration] = None
+    ):
+        """
+        Schema from_trusted_data_oapg
+        Builds an instance from decoded json that is trusted to match the schema, like responses
+        from the Versify server. Values are only cast to their allowed types and wrapped in the
+        same dynamic classes that from_openapi_data_oapg would make, keyword validation
+        (required, enum, format, min/max, ...) is skipped.
+        Values whose json type does not fit the schema still raise ApiTypeError, and
+        oneOf/anyOf/not/discriminator schemas are still validated to pick their classes.
+        """
+        try:
+            return CompiledSchema.for_schema_classes((cls,)).build(
+                arg, _configuration, validate=False)
+        except UncompiledPayloadError:
+            return cls.from_openapi_data_oapg(arg, _configuration=_configuration)
+
+    @classmethod
+    def from_server_data_oapg(
+        cls,
+        arg: typing.Union[str, int, float, bool, None, dict, list],
+        _configuration: typing.Optional[Configuration] = None,
+        validate: typing.Optional[bool] = None,
+        fields: typing.Optional[typing.Collection[str]] = None,
+    ):
+        """
+        Schema from_server_data_oapg
+        Uses from_openapi_data_oapg or from_trusted_data_oapg depending upon validate,
+        which defaults to _configuration.validate_responses
+        With fields only the named properties of an object are built, see
+        CompiledSchema.build_projection; values that are not compiled are built whole
+        """
+        if validate is None:
+            validate = _configuration is None or _configuration.validate_responses
+        if fields is not None:
+            try:
+                return CompiledSchema.for_schema_classes((cls,)).build_projection(
+                    arg, fields, _configuration, validate=validate)
+            except UncompiledPayloadError:
+                pass
+        if validate:
+            return cls.from_openapi_data_oapg(arg, _configuration=_configuration)
+        return cls.from_trusted_data_oapg(arg, _configuration=_configuration)
+
     @staticmethod
     def __get_input_dict(*args, **kwargs) -> frozendict.frozendict:
         input_dict = {}
@@ -535,6 +615,11 @@ class Schema:
         else:
             __arg = cls.__get_input_dict(*_args, **__kwargs)
         __from_server = False
+        try:
+            return CompiledSchema.for_schema_classes((cls,)).build(
+                __arg, _configuration, from_server=__from_server)
+        except UncompiledPayloadError:
+            pass
         __validated_path_to_schemas = {}
         __arg = cast_to_allowed_types(
             __arg, __from_server, __validated_path_to_schemas)
@@ -2467,6 +2552,608 @@ def get_new_class(
     return new_cls
 
 
+class UncompiledPayloadError(Exception):
+    """
+    Raised by CompiledSchema.build for payloads holding values other than plain json
+    (Schema instances, dates, bytes, files, ...), those are built by the interpreted validation
+    """
+
+
+def _raise_format_error_oapg(arg, type_name: str, path_to_item, prefix: str = ''):
+    raise ApiValueError(
+        "{}Invalid value '{}' for type {} at {}".format(prefix, arg, type_name, path_to_item)
+    )
+
+
+def _check_uuid_format_oapg(arg: str, path_to_item):
+    try:
+        uuid.UUID(arg)
+    except ValueError:
+        _raise_format_error_oapg(arg, 'UUID', path_to_item)
+
+
+def _check_date_format_oapg(arg: str, path_to_item):
+    try:
+        DEFAULT_ISOPARSER.parse_isodate(arg)
+    except ValueError:
+        _raise_format_error_oapg(
+            arg, 'date', path_to_item,
+            prefix='Value does not conform to the required ISO-8601 date format. ')
+
+
+def _check_datetime_format_oapg(arg: str, path_to_item):
+    try:
+        DEFAULT_ISOPARSER.parse_isodatetime(arg)
+    except ValueError:
+        _raise_format_error_oapg(
+            arg, 'datetime', path_to_item,
+            prefix='Value does not conform to the required ISO-8601 datetime format. ')
+
+
+def _check_decimal_format_oapg(arg: str, path_to_item):
+    try:
+        decimal.Decimal(arg)
+    except decimal.InvalidOperation:
+        _raise_format_error_oapg(
+            arg, 'decimal', path_to_item, prefix='Value cannot be converted to a decimal. ')
+
+
+def _check_int_format_oapg(arg: decimal.Decimal, path_to_item):
+    if arg.as_integer_ratio()[-1] != 1:
+        _raise_format_error_oapg(arg, 'integer', path_to_item)
+
+
+def _range_format_check_oapg(
+    type_name: str, inclusive_minimum, inclusive_maximum, integers_only: bool
+):
+    inclusive_minimum = decimal.Decimal(inclusive_minimum)
+    inclusive_maximum = decimal.Decimal(inclusive_maximum)
+
+    def check(arg: decimal.Decimal, path_to_item):
+        if integers_only and arg.as_tuple().exponent != 0:
+            return
+        if not inclusive_minimum <= arg <= inclusive_maximum:
+            _raise_format_error_oapg(arg, type_name, path_to_item)
+    return check
+
+
+# the format checks of the format base classes, matching the __validate_format methods of those
+# classes
+_FORMAT_CHECKS = (
+    (UUIDBase, str, _check_uuid_format_oapg),
+    (DateBase, str, _check_date_format_oapg),
+    (DateTimeBase, str, _check_datetime_format_oapg),
+    (DecimalBase, str, _check_decimal_format_oapg),
+    (IntBase, decimal.Decimal, _check_int_format_oapg),
+    (Int32Base, decimal.Decimal, _range_format_check_oapg('int32', -2147483648, 2147483647, True)),
+    (Int64Base, decimal.Decimal, _range_format_check_oapg(
+        'int64', -9223372036854775808, 9223372036854775807, True)),
+    (Float32Base, decimal.Decimal, _range_format_check_oapg(
+        'float', -3.4028234663852886e+38, 3.4028234663852886e+38, False)),
+    (Float64Base, decimal.Decimal, _range_format_check_oapg(
+        'double', -1.7976931348623157E+308, 1.7976931348623157E+308, False)),
+)
+
+
+class CompiledSchema:
+    """
+    The schema classes validated at one location in a payload, compiled into flat checks
+    A CompiledSchema is made once per combination of schema classes on first use and cached.
+    Building an instance from plain json then runs the precomputed keyword checks of each location
+    and wraps each value in the same dynamic class that the interpreted validation would make,
+    instead of walking MetaOapg and making ValidationMetadata at every node.
+    Locations with oneOf/anyOf/not/discriminator schemas are built by the interpreted validation.
+    """
+    _compiled = {}
+
+    def __init__(self, schema_classes: typing.Tuple[typing.Type[Schema], ...]):
+        self.schema_classes = tuple(
+            Schema._get_class_oapg(schema_cls) for schema_cls in schema_classes)
+        # allOf classes are validated at the same location so their checks are compiled in
+        classes = []
+        pending = list(self.schema_classes)
+        while pending:
+            schema_cls = Schema._get_class_oapg(pending.pop(0))
+            if schema_cls in classes:
+                continue
+            classes.append(schema_cls)
+            all_of = getattr(getattr(schema_cls, 'MetaOapg', None), 'all_of', None)
+            if all_of is not None:
+                pending.extend(all_of())
+        self.primary = classes[0]
+        self.classes = tuple(classes)
+        self.interpreted = any(
+            hasattr(schema_cls.MetaOapg, keyword)
+            for schema_cls in classes
+            for keyword in ('not_schema', 'discriminator')
+        )
+        self.composed = any(
+            hasattr(schema_cls.MetaOapg, keyword)
+            for schema_cls in classes
+            for keyword in ('one_of', 'any_of')
+        )
+        self._compositions = None
+        self.types = frozenset.intersection(
+            *(frozenset(schema_cls._types) for schema_cls in classes))
+        self._property_schemas = {}
+        self._items_schema = None
+        self._new_classes = {}
+        self._checks = {}
+
+    @classmethod
+    def for_schema_classes(
+        cls, schema_classes: typing.Tuple[typing.Type[Schema], ...]
+    ) -> 'CompiledSchema':
+        try:
+            return cls._compiled[schema_classes]
+        except KeyError:
+            compiled = cls._compiled[schema_classes] = cls(schema_classes)
+            return compiled
+
+    def new_class(
+        self,
+        primitive_type: type,
+        schema_classes: typing.Optional[typing.FrozenSet[typing.Type[Schema]]] = None
+    ) -> typing.Type[Schema]:
+        """The dynamic class of values of primitive_type, schema_classes default to self.classes"""
+        key = primitive_type if schema_classes is None else schema_classes | {primitive_type}
+        try:
+            return self._new_classes[key]
+        except KeyError:
+            new_cls = self._new_classes[key] = Schema._get_new_cls_for_schema_classes_oapg(
+                set(self.classes if schema_classes is None else schema_classes) | {primitive_type})
+            return new_cls
+
+    def compositions(self) -> typing.Tuple[
+        typing.Tuple[typing.Type[Schema], str, typing.Tuple['CompiledSchema', ...]], ...
+    ]:
+        """The (composed class, 'one_of' or 'any_of', compiled schemas) of oneOf/anyOf classes"""
+        if self._compositions is None:
+            compositions = []
+            for schema_cls in self.classes:
+                for keyword in ('one_of', 'any_of'):
+                    composed_classes = getattr(schema_cls.MetaOapg, keyword, None)
+                    if composed_classes is not None:
+                        compositions.append((schema_cls, keyword, tuple(
+                            self.for_schema_classes((composed_cls,))
+                            for composed_cls in composed_classes())))
+            self._compositions = tuple(compositions)
+        return self._compositions
+
+    def property_schema(self, name: str) -> typing.Optional['CompiledSchema']:
+        """The compiled schema of a property value, None if no schema class allows the property"""
+        try:
+            return self._property_schemas[name]
+        except KeyError:
+            pass
+        property_classes = []
+        allowed = True
+        for schema_cls in self.classes:
+            if not issubclass(schema_cls, DictBase):
+                continue
+            properties = getattr(schema_cls.MetaOapg, 'properties', None)
+            property_annotations = getattr(properties, '__annotations__', {})
+            if name in property_annotations:
+                property_classes.append(property_annotations[name])
+                continue
+            additional_properties = getattr(
+                schema_cls.MetaOapg, 'additional_properties', UnsetAnyTypeSchema)
+            if additional_properties is NotAnyTypeSchema:
+                allowed = False
+                break
+            property_classes.append(additional_properties)
+        compiled = None
+        if allowed:
+            compiled = self.for_schema_classes(tuple(property_classes or (UnsetAnyTypeSchema,)))
+        self._property_schemas[name] = compiled
+        return compiled
+
+    def items_schema(self) -> 'CompiledSchema':
+        if self._items_schema is None:
+            item_classes = tuple(
+                getattr(schema_cls.MetaOapg, 'items', UnsetAnyTypeSchema)
+                for schema_cls in self.classes if issubclass(schema_cls, ListBase)
+            )
+            self._items_schema = self.for_schema_classes(item_classes or (UnsetAnyTypeSchema,))
+        return self._items_schema
+
+    def checks(
+        self, primitive_type: type
+    ) -> typing.Optional[typing.Tuple[typing.Tuple[typing.Optional[str], typing.Callable], ...]]:
+        """
+        The (json schema keyword, check) pairs run on values of primitive_type, None if values of
+        primitive_type need the interpreted validation
+        Checks are called with the value and its path_to_item and raise on invalid values; the
+        value is the cast str or Decimal, the input dict, or the list of built items of a list.
+        Checks whose keyword is disabled in the configuration are skipped.
+        """
+        try:
+            return self._checks[primitive_type]
+        except KeyError:
+            pass
+        checks = []
+        for schema_cls in self.classes:
+            meta = getattr(schema_cls, 'MetaOapg', None)
+            if issubclass(schema_cls, EnumBase):
+                if primitive_type in {frozendict.frozendict, tuple}:
+                    checks = None
+                    break
+                checks.append((None, self.__enum_check(schema_cls)))
+            for base, format_type, format_check in _FORMAT_CHECKS:
+                if format_type is primitive_type and issubclass(schema_cls, base):
+                    checks.append((None, format_check))
+            if meta is None:
+                continue
+            if primitive_type is str and issubclass(schema_cls, StrBase):
+                checks.extend(self.__str_checks(meta))
+            elif primitive_type is decimal.Decimal and issubclass(schema_cls, NumberBase):
+                checks.extend(self.__number_checks(meta))
+            elif primitive_type is tuple and issubclass(schema_cls, ListBase):
+                checks.extend(self.__list_checks(meta))
+            elif primitive_type is frozendict.frozendict and issubclass(schema_cls, DictBase):
+                checks.extend(self.__dict_checks(schema_cls, meta))
+        if checks is not None:
+            checks = tuple(checks)
+        self._checks[primitive_type] = checks
+        return checks
+
+    @staticmethod
+    def __enum_check(schema_cls: typing.Type[Schema]):
+        enum_value_to_name = schema_cls.MetaOapg.enum_value_to_name
+
+        def check(arg, path_to_item):
+            if arg not in enum_value_to_name:
+                raise ApiValueError("Invalid value {} passed in to {}, allowed_values={}".format(
+                    arg, schema_cls, enum_value_to_name.keys()))
+        return check
+
+    @staticmethod
+    def __limit_check(constraint_msg: str, constraint_value, is_invalid: typing.Callable):
+        def check(arg, path_to_item):
+            if is_invalid(arg):
+                ValidatorBase._raise_validation_error_message_oapg(
+                    value=arg,
+                    constraint_msg=constraint_msg,
+                    constraint_value=constraint_value,
+                    path_to_item=path_to_item
+                )
+        return check
+
+    @classmethod
+    def __str_checks(cls, meta):
+        if hasattr(meta, 'max_length'):
+            max_length = meta.max_length
+            yield 'maxLength', cls.__limit_check(
+                "length must be less than or equal to", max_length,
+                lambda arg: len(arg) > max_length)
+        if hasattr(meta, 'min_length'):
+            min_length = meta.min_length
+            yield 'minLength', cls.__limit_check(
+                "length must be greater than or equal to", min_length,
+                lambda arg: len(arg) < min_length)
+        for regex_dict in getattr(meta, 'regex', ()):
+            flags = regex_dict.get('flags', 0)
+            pattern = re.compile(regex_dict['pattern'], flags=flags)
+            additional_txt = " with flags=`{}`".format(flags) if flags != 0 else ""
+
+            def check(arg, path_to_item, pattern=pattern, additional_txt=additional_txt):
+                if not pattern.search(arg):
+                    ValidatorBase._raise_validation_error_message_oapg(
+                        value=arg,
+                        constraint_msg="must match regular expression",
+                        constraint_value=pattern.pattern,
+                        path_to_item=path_to_item,
+                        additional_txt=additional_txt
+                    )
+            yield 'pattern', check
+
+    @classmethod
+    def __number_checks(cls, meta):
+        if hasattr(meta, 'multiple_of'):
+            multiple_of = meta.multiple_of
+            yield 'multipleOf', cls.__limit_check(
+                "value must be a multiple of", multiple_of,
+                lambda arg: not (float(arg) / multiple_of).is_integer())
+        if hasattr(meta, 'exclusive_maximum'):
+            exclusive_maximum = meta.exclusive_maximum
+            yield 'exclusiveMaximum', cls.__limit_check(
+                "must be a value less than", exclusive_maximum,
+                lambda arg: arg >= exclusive_maximum)
+        if hasattr(meta, 'inclusive_maximum'):
+            inclusive_maximum = meta.inclusive_maximum
+            yield 'maximum', cls.__limit_check(
+                "must be a value less than or equal to", inclusive_maximum,
+                lambda arg: arg > inclusive_maximum)
+        if hasattr(meta, 'exclusive_minimum'):
+            exclusive_minimum = meta.exclusive_minimum
+            yield 'exclusiveMinimum', cls.__limit_check(
+                "must be a value greater than", exclusive_minimum,
+                lambda arg: arg <= exclusive_minimum)
+        if hasattr(meta, 'inclusive_minimum'):
+            inclusive_minimum = meta.inclusive_minimum
+            yield 'minimum', cls.__limit_check(
+                "must be a value greater than or equal to", inclusive_minimum,
+                lambda arg: arg < inclusive_minimum)
+
+    @classmethod
+    def __list_checks(cls, meta):
+        if hasattr(meta, 'max_items'):
+            max_items = meta.max_items
+            yield 'maxItems', cls.__limit_check(
+                "number of items must be less than or equal to", max_items,
+                lambda arg: len(arg) > max_items)
+        if hasattr(meta, 'min_items'):
+            min_items = meta.min_items
+            yield 'minItems', cls.__limit_check(
+                "number of items must be greater than or equal to", min_items,
+                lambda arg: len(arg) < min_items)
+        if getattr(meta, 'unique_items', False):
+            yield 'uniqueItems', cls.__limit_check(
+                "duplicate items were found, and the tuple must not contain duplicates because",
+                'unique_items==True', lambda arg: len(arg) > len(set(arg)))
+
+    @classmethod
+    def __dict_checks(cls, schema_cls, meta):
+        if hasattr(meta, 'max_properties'):
+            max_properties = meta.max_properties
+            yield 'maxProperties', cls.__limit_check(
+                "number of properties must be less than or equal to", max_properties,
+                lambda arg: len(arg) > max_properties)
+        if hasattr(meta, 'min_properties'):
+            min_properties = meta.min_properties
+            yield 'minProperties', cls.__limit_check(
+                "number of properties must be greater than or equal to", min_properties,
+                lambda arg: len(arg) < min_properties)
+        required = frozenset(getattr(meta, 'required', ()))
+        known = None
+        if getattr(meta, 'additional_properties', UnsetAnyTypeSchema) is NotAnyTypeSchema:
+            properties = getattr(meta, 'properties', None)
+            known = required | frozenset(getattr(properties, '__annotations__', {}))
+        if not required and known is None:
+            return
+
+        def check(arg, path_to_item):
+            # matches DictBase.__validate_arg_presence
+            missing_required_arguments = sorted(required.difference(arg))
+            if missing_required_arguments:
+                raise ApiTypeError(
+                    "{} is missing {} required argument{}: {}".format(
+                        schema_cls.__name__,
+                        len(missing_required_arguments),
+                        "s" if len(missing_required_arguments) > 1 else "",
+                        missing_required_arguments
+                    )
+                )
+            if known is None:
+                return
+            invalid_arguments = sorted(name for name in arg if name not in known)
+            if invalid_arguments:
+                raise ApiTypeError(
+                    "{} was passed {} invalid argument{}: {}".format(
+                        schema_cls.__name__,
+                        len(invalid_arguments),
+                        "s" if len(invalid_arguments) > 1 else "",
+                        invalid_arguments
+                    )
+                )
+        yield None, check
+
+    def build(
+        self,
+        arg: typing.Any,
+        configuration: typing.Optional[Configuration] = None,
+        validate: bool = True,
+        from_server: bool = True,
+    ) -> Schema:
+        """
+        Builds an instance from a plain json payload (dict, list, str, int, float, bool, None)
+        With validate=False the keyword checks are skipped, values are only cast and wrapped
+
+        Raises:
+            UncompiledPayloadError: when the payload holds other values
+        """
+        disabled = ()
+        if configuration is not None:
+            disabled = getattr(configuration, '_disabled_client_side_validations', None) or ()
+        return self._build(arg, configuration, validate, from_server, disabled, ('args[0]',))
+
+    def build_projection(
+        self,
+        arg: typing.Any,
+        fields: typing.Union[typing.Collection[str], typing.Dict[str, typing.Any]],
+        configuration: typing.Optional[Configuration] = None,
+        validate: bool = True,
+    ) -> Schema:
+        """
+        Builds an instance from a plain json payload keeping only the object properties in fields
+        fields is a collection of property names, or a dict of property name to the fields of that
+        property's value (None keeps the value whole). The fields of an array apply to its items.
+        The kept values are built as build does. The object and array keywords (required,
+        minProperties, minItems, ...) are not checked as they apply to the whole value.
+
+        Raises:
+            UncompiledPayloadError: when a projected value is built by the interpreted validation
+        """
+        disabled = ()
+        if configuration is not None:
+            disabled = getattr(configuration, '_disabled_client_side_validations', None) or ()
+        return self._build_projection(arg, fields, configuration, validate, disabled, ('args[0]',))
+
+    def _build_projection(self, arg, fields, configuration, validate, disabled, path_to_item):
+        arg_type = type(arg)
+        if fields is None or (arg_type is not dict and arg_type is not list):
+            return self._build(arg, configuration, validate, True, disabled, path_to_item)
+        if self.interpreted or self.composed:
+            raise UncompiledPayloadError(path_to_item)
+        if arg_type is list:
+            if tuple not in self.types:
+                self._raise_type_error(arg, True, path_to_item)
+            compiled = self.items_schema()
+            value = [
+                compiled._build_projection(
+                    item, fields, configuration, validate, disabled, path_to_item + (i,))
+                for i, item in enumerate(arg)
+            ]
+            new_cls = self.new_class(tuple)
+        else:
+            if frozendict.frozendict not in self.types:
+                self._raise_type_error(arg, True, path_to_item)
+            if validate and self.checks(frozendict.frozendict) is None:
+                raise UncompiledPayloadError(path_to_item)
+            if not isinstance(fields, dict):
+                fields = dict.fromkeys(fields)
+            value = {}
+            for property_name, property_fields in fields.items():
+                if property_name not in arg:
+                    continue
+                compiled = self.property_schema(property_name)
+                if compiled is None:
+                    raise UncompiledPayloadError(path_to_item + (property_name,))
+                value[property_name] = compiled._build_projection(
+                    arg[property_name], property_fields, configuration, validate, disabled,
+                    path_to_item + (property_name,))
+            new_cls = self.new_class(frozendict.frozendict)
+        return super(Schema, new_cls).__new__(new_cls, value)
+
+    def _build(self, arg, configuration, validate, from_server, disabled, path_to_item):
+        arg_type = type(arg)
+        value = arg
+        if arg_type is str:
+            primitive_type = str
+        elif arg_type is dict or arg_type is frozendict.frozendict:
+            primitive_type = frozendict.frozendict
+        elif arg_type is list or arg_type is tuple:
+            primitive_type = tuple
+        elif arg_type is bool:
+            primitive_type, value = BoolClass, BoolClass.TRUE if arg else BoolClass.FALSE
+        elif arg is None:
+            primitive_type, value = NoneClass, NoneClass.NONE
+        elif arg_type is int:
+            primitive_type, value = decimal.Decimal, decimal.Decimal(arg)
+        elif arg_type is float or arg_type is decimal.Decimal:
+            primitive_type = decimal.Decimal
+            value = cast_to_allowed_types(arg, from_server, {}, path_to_item)
+        else:
+            raise UncompiledPayloadError(path_to_item)
+        if self.interpreted:
+            return self._build_interpreted(arg, configuration, from_server, path_to_item)
+        if self.composed:
+            if primitive_type is frozendict.frozendict or primitive_type is tuple:
+                return self._build_interpreted(arg, configuration, from_server, path_to_item)
+            schema_classes = self._scalar_classes(
+                primitive_type, value, validate, from_server, disabled, path_to_item)
+            new_cls = self.new_class(primitive_type, schema_classes)
+            return super(Schema, new_cls).__new__(new_cls, value)
+        if primitive_type not in self.types:
+            self._raise_type_error(arg, from_server, path_to_item)
+        checks = ()
+        if validate:
+            checks = self.checks(primitive_type)
+            if checks is None:
+                return self._build_interpreted(arg, configuration, from_server, path_to_item)
+
+        if primitive_type is frozendict.frozendict:
+            for keyword, check in checks:
+                if keyword is None or keyword not in disabled:
+                    check(arg, path_to_item)
+            value = {}
+            for property_name, property_value in arg.items():
+                compiled = self.property_schema(property_name)
+                if compiled is None:
+                    return self._build_interpreted(arg, configuration, from_server, path_to_item)
+                value[property_name] = compiled._build(
+                    property_value, configuration, validate, from_server, disabled,
+                    path_to_item + (property_name,))
+        elif primitive_type is tuple:
+            compiled = self.items_schema()
+            value = [
+                compiled._build(
+                    item, configuration, validate, from_server, disabled, path_to_item + (i,))
+                for i, item in enumerate(arg)
+            ]
+            for keyword, check in checks:
+                if keyword is None or keyword not in disabled:
+                    check(value, path_to_item)
+        else:
+            for keyword, check in checks:
+                if keyword is None or keyword not in disabled:
+                    check(value, path_to_item)
+        new_cls = self.new_class(primitive_type)
+        return super(Schema, new_cls).__new__(new_cls, value)
+
+    def _scalar_classes(
+        self, primitive_type, value, validate, from_server, disabled, path_to_item
+    ) -> typing.FrozenSet[typing.Type[Schema]]:
+        """
+        Checks a str, Decimal, BoolClass or NoneClass value and returns the schema classes it is
+        validated by: self.classes plus the classes of its matching oneOf/anyOf schemas
+        This matches ComposedBase._validate_oapg for values that are not dicts or lists
+        """
+        if self.interpreted:
+            raise UncompiledPayloadError(path_to_item)
+        if primitive_type not in self.types:
+            self._raise_type_error(value, from_server, path_to_item)
+        if validate:
+            for keyword, check in self.checks(primitive_type):
+                if keyword is None or keyword not in disabled:
+                    check(value, path_to_item)
+        schema_classes = frozenset(self.classes)
+        for composed_cls, keyword, compiled_schemas in self.compositions():
+            matched_classes = []
+            matches = []
+            for compiled in compiled_schemas:
+                try:
+                    matches.append(compiled._scalar_classes(
+                        primitive_type, value, True, from_server, disabled, path_to_item))
+                except (ApiValueError, ApiTypeError):
+                    continue
+                matched_classes.append(compiled.primary)
+            if not matches:
+                raise ApiValueError(
+                    "Invalid inputs given to generate an instance of {}. None "
+                    "of the {} schemas matched the input data.".format(
+                        composed_cls, 'oneOf' if keyword == 'one_of' else 'anyOf')
+                )
+            if keyword == 'one_of' and len(matches) > 1:
+                raise ApiValueError(
+                    "Invalid inputs given to generate an instance of {}. Multiple "
+                    "oneOf schemas {} matched the inputs, but a max of one is allowed.".format(
+                        composed_cls, matched_classes)
+                )
+            schema_classes = schema_classes.union(*matches)
+        return schema_classes
+
+    def _raise_type_error(self, arg, from_server: bool, path_to_item):
+        value = cast_to_allowed_types(arg, from_server, {}, path_to_item)
+        for schema_cls in self.classes:
+            # EnumBase._validate_oapg runs before the type check
+            if issubclass(schema_cls, EnumBase):
+                self.__enum_check(schema_cls)(value, path_to_item)
+            if type(value) not in schema_cls._types:
+                raise schema_cls._get_type_error_oapg(value, path_to_item, schema_cls._types)
+
+    def _build_interpreted(self, arg, configuration, from_server: bool, path_to_item):
+        """Builds the value at path_to_item with the interpreted validation of schema_classes"""
+        validated_path_to_schemas = {}
+        arg = cast_to_allowed_types(arg, from_server, validated_path_to_schemas, path_to_item)
+        validation_metadata = ValidationMetadata(
+            path_to_item=path_to_item,
+            from_server=from_server,
+            configuration=configuration,
+            validated_path_to_schemas=validated_path_to_schemas
+        )
+        _path_to_schemas = {}
+        for schema_cls in self.schema_classes:
+            other_path_to_schemas = schema_cls._validate_oapg(
+                arg, validation_metadata=validation_metadata)
+            update(_path_to_schemas, other_path_to_schemas)
+        path_to_schemas = {}
+        for path, schema_classes in _path_to_schemas.items():
+            path_to_schemas[path] = Schema._get_new_cls_for_schema_classes_oapg(schema_classes)
+        return path_to_schemas[path_to_item]._get_new_instance_without_conversion_oapg(
+            arg, path_to_item, path_to_schemas)
+
+
 LOG_CACHE_USAGE = False
 
 
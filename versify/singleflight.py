@@ -0,0 +1,121 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+import concurrent.futures
+from dataclasses import dataclass
+import threading
+import typing
+
+T = typing.TypeVar('T')
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates identical concurrent calls
+
+    While a call for a key is in flight, other calls with the same key wait for it and receive
+    its result, or its exception, instead of running themselves. Threads use do and coroutines
+    do_async; the two never share a call. When the coroutine running a call is cancelled, one
+    of the coroutines waiting for it runs the call instead. ApiClient coalesces GET operations
+    through it when created with single_flight=True.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: typing.Dict[typing.Hashable, concurrent.futures.Future] = {}
+        self._async_futures: typing.Dict[typing.Hashable, asyncio.Future] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    def do(self, key: typing.Hashable, fn: typing.Callable[[], T]) -> T:
+        """Returns fn(), or the result of the call in flight for key"""
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._futures[key] = concurrent.futures.Future()
+                self._calls += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as error:
+            self._done(self._futures, key)
+            future.set_exception(error)
+            raise
+        self._done(self._futures, key)
+        future.set_result(result)
+        return result
+
+    async def do_async(
+        self, key: typing.Hashable, fn: typing.Callable[[], typing.Awaitable[T]]
+    ) -> T:
+        """Returns await fn(), or the result of the call in flight for key"""
+        while True:
+            with self._lock:
+                future = self._async_futures.get(key)
+                if future is None:
+                    future = self._async_futures[key] = asyncio.get_running_loop().create_future()
+                    # marks the exception retrieved when no call was waiting for it
+                    future.add_done_callback(lambda done: done.cancelled() or done.exception())
+                    self._calls += 1
+                    leader = True
+                else:
+                    self._coalesced += 1
+                    leader = False
+            if leader:
+                break
+            try:
+                # a cancelled follower must not cancel the call the others wait for
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # the call was cancelled rather than this follower, which takes over or waits
+                # for the follower that did
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._done(self._async_futures, key)
+            future.cancel()
+            raise
+        except BaseException as error:
+            self._done(self._async_futures, key)
+            future.set_exception(error)
+            raise
+        self._done(self._async_futures, key)
+        future.set_result(result)
+        return result
+
+    def _done(self, futures: typing.Dict[typing.Hashable, typing.Any], key: typing.Hashable):
+        # later calls start a new request instead of reusing a finished one
+        with self._lock:
+            del futures[key]
+
+    def stats(self) -> SingleFlightStats:
+        """The number of calls that ran, of calls that waited for one and of calls in flight"""
+        with self._lock:
+            return SingleFlightStats(
+                calls=self._calls,
+                coalesced=self._coalesced,
+                in_flight=len(self._futures) + len(self._async_futures),
+            )
@@ -0,0 +1,365 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+from datetime import date, datetime
+import decimal
+import typing
+import uuid
+
+import frozendict
+
+from versify.exceptions import ApiTypeError, ApiValueError
+from versify.schemas import (
+    BoolClass,
+    CompiledSchema,
+    DateBase,
+    DateTimeBase,
+    DEFAULT_ISOPARSER,
+    DecimalBase,
+    DictBase,
+    IntBase,
+    NoneClass,
+    Schema,
+    UUIDBase,
+    unset,
+)
+
+# the primitive type schema classes allow -> the json types decoded for it
+_PRIMITIVE_TO_JSON = {
+    str: (str,),
+    decimal.Decimal: (int, float),
+    BoolClass: (bool,),
+    NoneClass: (type(None),),
+    frozendict.frozendict: (dict,),
+    tuple: (list,),
+}
+
+
+class SlotsModel:
+    """
+    The base class of the __slots__ classes that slots_class makes for each model
+    Instances store each declared property in a slot as a native python value: str, int, float,
+    bool, None, date, datetime, uuid.UUID, decimal.Decimal (decimal formatted strings), list, dict
+    (free-form objects) or the SlotsModel of a nested model. Properties that were not sent read as
+    schemas.unset. Properties that are not declared, or whose names cannot be slots, are kept in
+    _extra and are only reachable by item access.
+    """
+    __slots__ = ('_extra',)
+    # the Schema class the slots class was made from
+    _model: typing.ClassVar[typing.Type[Schema]]
+    # the declared property names stored in slots, in declaration order
+    _fields: typing.ClassVar[typing.Tuple[str, ...]] = ()
+    _required: typing.ClassVar[typing.FrozenSet[str]] = frozenset()
+    # property name -> converter of the json value, for properties whose value is not kept as is
+    _converters: typing.ClassVar[typing.Dict[str, typing.Callable]] = {}
+
+    def __init__(self, **kwargs: typing.Any):
+        extra = None
+        for name, value in kwargs.items():
+            if name in self._converters or name in self._fields:
+                setattr(self, name, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[name] = value
+        if extra is not None:
+            self._extra = extra
+
+    def __getattr__(self, name: str):
+        # only called for slots that were never assigned
+        if name == '_extra':
+            return None
+        if name in type(self)._fields:
+            return unset
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+    @classmethod
+    def from_json(
+        cls,
+        data: typing.Dict[str, typing.Any],
+        path_to_item: typing.Tuple[typing.Union[str, int], ...] = ('args[0]',),
+    ) -> 'SlotsModel':
+        """
+        Builds an instance from decoded json
+        The json type of each declared property and the required properties are checked, and
+        date, date-time, uuid and number formatted values are converted to their python types.
+        Other keywords (enum, lengths, patterns, ...) are not validated.
+        """
+        if not isinstance(data, dict):
+            raise Schema._get_type_error_oapg(data, path_to_item, (dict,))
+        missing_required_arguments = sorted(cls._required.difference(data))
+        if missing_required_arguments:
+            raise ApiTypeError(
+                "{} is missing {} required argument{}: {}".format(
+                    cls.__name__,
+                    len(missing_required_arguments),
+                    "s" if len(missing_required_arguments) > 1 else "",
+                    missing_required_arguments
+                )
+            )
+        instance = cls.__new__(cls)
+        fields = cls._fields
+        converters = cls._converters
+        extra = None
+        for name, value in data.items():
+            converter = converters.get(name)
+            if converter is not None:
+                setattr(instance, name, converter(value, path_to_item + (name,)))
+            elif name in fields:
+                setattr(instance, name, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[name] = value
+        if extra is not None:
+            instance._extra = extra
+        return instance
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """The json compatible dict of the set properties, the inverse of from_json"""
+        result = {}
+        for name in self._fields:
+            value = getattr(self, name)
+            if value is not unset:
+                result[name] = _to_json(value)
+        extra = self._extra
+        if extra:
+            for name, value in extra.items():
+                result[name] = _to_json(value)
+        return result
+
+    def to_model(self, _configuration=None) -> Schema:
+        """Validates the instance into the Schema class it was made from"""
+        return self._model.from_openapi_data_oapg(self.to_dict(), _configuration=_configuration)
+
+    def keys(self) -> typing.List[str]:
+        keys = [name for name in self._fields if getattr(self, name) is not unset]
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name, unset) is not unset
+
+    def __getitem__(self, name: str) -> typing.Any:
+        value = self.get(name, unset)
+        if value is unset:
+            raise KeyError(name)
+        return value
+
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        if name in self._fields:
+            value = getattr(self, name)
+            return default if value is unset else value
+        extra = self._extra
+        if extra and name in extra:
+            return extra[name]
+        return default
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields) and (
+            (self._extra or {}) == (other._extra or {}))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(
+            type(self).__name__,
+            ', '.join('{}={!r}'.format(name, self[name]) for name in self.keys())
+        )
+
+
+def _to_json(value: typing.Any) -> typing.Any:
+    if isinstance(value, SlotsModel):
+        return value.to_dict()
+    if isinstance(value, (str, int, float)) or value is None:
+        return value
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    return value
+
+
+_SchemaClasses = typing.Tuple[typing.Type[Schema], ...]
+_slots_classes: typing.Dict[_SchemaClasses, typing.Type[SlotsModel]] = {}
+_converters: typing.Dict[_SchemaClasses, typing.Optional[typing.Callable]] = {}
+
+
+def _properties(schema_cls: typing.Type[Schema]) -> typing.Dict[str, typing.Type[Schema]]:
+    if not issubclass(schema_cls, DictBase):
+        return {}
+    properties = getattr(getattr(schema_cls, 'MetaOapg', None), 'properties', None)
+    return getattr(properties, '__annotations__', {})
+
+
+def _make_slots_class(model_classes: _SchemaClasses) -> typing.Type[SlotsModel]:
+    try:
+        return _slots_classes[model_classes]
+    except KeyError:
+        pass
+    compiled = CompiledSchema.for_schema_classes(model_classes)
+    fields = []
+    for schema_cls in compiled.classes:
+        for name in _properties(schema_cls):
+            if name not in fields and name.isidentifier() and not hasattr(SlotsModel, name):
+                fields.append(name)
+    required = set()
+    for schema_cls in compiled.classes:
+        required.update(getattr(getattr(schema_cls, 'MetaOapg', None), 'required', ()))
+    model = compiled.primary
+    slots_cls = type(model.__name__, (SlotsModel,), {
+        '__slots__': tuple(fields),
+        '__module__': __name__,
+        '__qualname__': model.__name__,
+        '__doc__': 'The __slots__ representation of {}.{}'.format(
+            model.__module__, model.__name__),
+        '_model': model,
+        '_fields': tuple(fields),
+        '_required': frozenset(required),
+        '_converters': {},
+    })
+    # registered before the converters are made so recursive models resolve to this class
+    _slots_classes[model_classes] = slots_cls
+    for name in fields:
+        converter = _converter(compiled.property_schema(name))
+        if converter is not None:
+            slots_cls._converters[name] = converter
+    return slots_cls
+
+
+def _format_converter(
+    parse: typing.Callable[[str], typing.Any],
+    type_name: str
+) -> typing.Callable[[str, typing.Tuple[typing.Union[str, int], ...]], typing.Any]:
+    def convert(value, path_to_item):
+        try:
+            return parse(value)
+        except (ValueError, decimal.InvalidOperation):
+            raise ApiValueError(
+                "Invalid value '{}' for type {} at {}".format(value, type_name, path_to_item))
+    return convert
+
+
+def _int(
+    value: typing.Union[int, float], path_to_item: typing.Tuple[typing.Union[str, int], ...]
+) -> int:
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ApiValueError(
+                "Invalid non-integer value '{}' for type int at {}".format(value, path_to_item))
+        return int(value)
+    return value
+
+
+def _converter(compiled: typing.Optional[CompiledSchema]) -> typing.Optional[typing.Callable]:
+    """
+    The function converting a json value at the location of compiled, None if values are kept as is
+    Values of properties that no schema allows and of oneOf/anyOf/not locations are kept as is.
+    """
+    if compiled is None or compiled.composed or compiled.interpreted:
+        return None
+    key = compiled.schema_classes
+    try:
+        return _converters[key]
+    except KeyError:
+        pass
+    # recursive references to a list location resolve to no conversion while it is being made
+    _converters[key] = None
+    classes = compiled.classes
+    allowed = tuple(
+        json_type
+        for primitive_type in compiled.types
+        for json_type in _PRIMITIVE_TO_JSON[primitive_type])
+    convert_str = None
+    for base, parse, type_name in (
+        (DateTimeBase, DEFAULT_ISOPARSER.parse_isodatetime, 'datetime'),
+        (DateBase, DEFAULT_ISOPARSER.parse_isodate, 'date'),
+        (UUIDBase, uuid.UUID, 'uuid'),
+        (DecimalBase, decimal.Decimal, 'decimal'),
+    ):
+        if any(issubclass(schema_cls, base) for schema_cls in classes):
+            convert_str = _format_converter(parse, type_name)
+            break
+    convert_int = _int if any(issubclass(schema_cls, IntBase) for schema_cls in classes) else None
+    convert_dict = None
+    if frozendict.frozendict in compiled.types:
+        model_classes = tuple(schema_cls for schema_cls in classes if _properties(schema_cls))
+        if model_classes:
+            convert_dict = _make_slots_class(model_classes).from_json
+    convert_list = None
+    if tuple in compiled.types:
+        convert_list = _converter(compiled.items_schema())
+    all_types = len(allowed) == sum(len(json_types) for json_types in _PRIMITIVE_TO_JSON.values())
+
+    def convert(value, path_to_item):
+        if isinstance(value, bool):
+            if bool not in allowed:
+                raise Schema._get_type_error_oapg(value, path_to_item, allowed)
+            return value
+        if not isinstance(value, allowed):
+            raise Schema._get_type_error_oapg(value, path_to_item, allowed)
+        if isinstance(value, str):
+            return value if convert_str is None else convert_str(value, path_to_item)
+        if isinstance(value, dict):
+            return value if convert_dict is None else convert_dict(value, path_to_item)
+        if isinstance(value, list):
+            if convert_list is None:
+                return value
+            return [convert_list(item, path_to_item + (i,)) for i, item in enumerate(value)]
+        if isinstance(value, (int, float)) and convert_int is not None:
+            return convert_int(value, path_to_item)
+        return value
+
+    keep = all_types and convert_str is convert_dict is convert_list is convert_int is None
+    converter = None if keep else convert
+    _converters[key] = converter
+    return converter
+
+
+def slots_class(model: typing.Type[Schema]) -> typing.Type[SlotsModel]:
+    """
+    The __slots__ class of a model, e.g. slots_class(Contact)
+    The class is made on first use from the model's MetaOapg properties and cached; it has the
+    model's name and one slot per declared property.
+    """
+    model = Schema._get_class_oapg(model)
+    compiled = CompiledSchema.for_schema_classes((model,))
+    model_classes = tuple(
+        schema_cls for schema_cls in compiled.classes if _properties(schema_cls))
+    if not _properties(model) and not model_classes:
+        raise ApiValueError('{} is not an object schema with properties'.format(model.__name__))
+    return _make_slots_class(model_classes)
+
+
+def from_json(model: typing.Type[Schema], data: typing.Any) -> typing.Any:
+    """
+    Converts decoded json into the __slots__ representation of model
+    Objects of models with properties become SlotsModel instances, lists of them lists
+    of instances; values of other schemas are converted to their python types.
+    """
+    model = Schema._get_class_oapg(model)
+    converter = _converter(CompiledSchema.for_schema_classes((model,)))
+    if converter is None:
+        return data
+    return converter(data, ('args[0]',))
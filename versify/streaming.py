@@ -0,0 +1,221 @@
+# coding: utf-8
+
+"""
+    Versify API
+
+    Versify API  # noqa: E501
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by: https://openapi-generator.tech
+"""
+
+import codecs
+import json
+import typing
+
+import urllib3
+
+from versify.api_client import ApiClient, project_json
+from versify.configuration import Configuration
+from versify.exceptions import ApiValueError
+from versify.resources import Resource, get_resource
+from versify.schemas import Schema
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+class JsonArrayStream:
+    """Incrementally decodes the top level object of a json document.
+
+    The members of the object are decoded as they arrive; the items of the
+    array member named array_key are yielded one at a time instead of being
+    accumulated, so only one item is held in memory at a time. All other
+    members are collected in envelope.
+
+    :param chunks: an iterable of the document's bytes
+    :param array_key: the name of the member holding the array to stream
+    """
+
+    def __init__(self, chunks: typing.Iterable[bytes], array_key: str = 'data'):
+        self._chunks = iter(chunks)
+        self._utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self.array_key = array_key
+        self.envelope: typing.Dict[str, typing.Any] = {}
+
+    def _read(self) -> bool:
+        """Appends the next chunk to the buffer, returns False at the end of the document"""
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            self._buffer = self._buffer[self._pos:] + self._utf8_decoder.decode(b'', final=True)
+        else:
+            self._buffer = self._buffer[self._pos:] + self._utf8_decoder.decode(chunk)
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> ApiValueError:
+        return ApiValueError('Invalid json document: {}'.format(message))
+
+    def _next_char(self) -> str:
+        """Skips whitespace and returns the next character without consuming it"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                raise self._error('unexpected end of document')
+
+    def _expect(self, chars: str) -> str:
+        char = self._next_char()
+        if char not in chars:
+            raise self._error("expected one of {!r} but found {!r}".format(chars, char))
+        self._pos += 1
+        return char
+
+    def _value(self) -> typing.Any:
+        """Decodes the next complete json value"""
+        self._next_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as error:
+                if self._read():
+                    continue
+                raise self._error(str(error)) from None
+            # a number ending at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and not self._eof and self._read():
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        self._expect('{')
+        if self._next_char() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise self._error('object keys must be strings')
+            self._expect(':')
+            if key == self.array_key and self._next_char() == '[':
+                self._pos += 1
+                if self._next_char() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(',]') == ']':
+                            break
+            else:
+                self.envelope[key] = self._value()
+            if self._expect(',}') == '}':
+                return
+
+
+class StreamingList:
+    """Yields the items of a list or search response as they are read from the socket.
+
+    Each item is validated against model as soon as it is complete. The other
+    members of the response (count, has_more, ...) are available in envelope
+    once iteration has finished. The connection is released back to the pool
+    when the whole body was read, and closed when iteration stops early.
+
+    :param response: a urllib3.HTTPResponse requested with stream=True
+    :param model: the Schema class each item is validated against, None yields the decoded json
+    :param configuration: the Configuration passed to model validation
+    :param chunk_size: the number of bytes read from the socket at a time
+    :param validate_responses: whether items are validated against model,
+        defaults to configuration.validate_responses
+    :param fields: the properties built for each item, see Schema.from_server_data_oapg
+    """
+
+    def __init__(
+        self,
+        response: urllib3.HTTPResponse,
+        model: typing.Optional[typing.Type[Schema]] = None,
+        configuration: typing.Optional[Configuration] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        validate_responses: typing.Optional[bool] = None,
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
+    ):
+        self.response = response
+        self.model = model
+        self.configuration = configuration
+        self.validate_responses = validate_responses
+        self.fields = fields
+        self._stream = JsonArrayStream(response.stream(chunk_size), array_key='data')
+
+    @property
+    def envelope(self) -> typing.Dict[str, typing.Any]:
+        return self._stream.envelope
+
+    @property
+    def count(self) -> typing.Optional[int]:
+        return self.envelope.get('count')
+
+    @property
+    def has_more(self) -> bool:
+        return bool(self.envelope.get('has_more'))
+
+    def __iter__(self) -> typing.Iterator[typing.Union[Schema, typing.Any]]:
+        consumed = False
+        try:
+            for item in self._stream:
+                if self.model is None:
+                    yield project_json(item, self.fields)
+                else:
+                    yield self.model.from_server_data_oapg(
+                        item, _configuration=self.configuration, validate=self.validate_responses,
+                        fields=self.fields)
+            # read whatever follows the document, so the connection is at the end of the body
+            self.response.drain_conn()
+            consumed = True
+        finally:
+            if not consumed:
+                # the rest of the body would be read as the response to the next request sent
+                # on the connection, so it is closed before it goes back to the pool
+                self.response.close()
+            self.response.release_conn()
+
+
+def stream_search(
+    api_client: ApiClient,
+    resource: typing.Union[str, Resource],
+    body: typing.Any,
+    header_params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    timeout: typing.Optional[typing.Union[int, typing.Tuple]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    validate_responses: typing.Optional[bool] = None,
+    fields: typing.Optional[typing.Tuple[str, ...]] = None,
+) -> StreamingList:
+    """Runs a /v2/<resource>/search request and streams the matching items
+
+    :param body: the SearchQuery (or dict) sent as the request body
+    :param fields: the properties built for each item, e.g. ('_id', 'email')
+    """
+    resource = get_resource(resource)
+    kwargs = {}
+    if header_params:
+        kwargs['header_params'] = header_params
+    api_response = resource.search_api(api_client).post(
+        body=body, skip_deserialization=True, stream=True, timeout=timeout, fields=fields,
+        **kwargs)
+    return StreamingList(
+        api_response.response,
+        model=resource.model,
+        configuration=api_client.configuration,
+        chunk_size=chunk_size,
+        validate_responses=validate_responses,
+        fields=fields,
+    )